@@ -1,25 +1,159 @@
+import argparse
 import logging
 import sys
+import threading
+from datetime import date
+from pathlib import Path
 
 from src.auth.session import get_authenticated_session
 from src.exceptions.config_error import ConfigError
+from src.exceptions.rollover_plan_error import RolloverPlanError
 from src.logs.configure_logging import log_config
-from src.orchestration.sprint_orchestration import automate_sprint
-from src.utils.config_loader import load_config
+from src.logs.metrics import serve_metrics, write_textfile
+from src.logs.profiling import profiling
+from src.logs.tracing import exporting_spans
+from src.orchestration.multi_board import run_boards
+from src.orchestration.rollover_plan import (
+    DEFAULT_PLAN_PATH,
+    commit_boards,
+    prepare_boards,
+)
+from src.services.pagination import DEFAULT_PAGE_WORKERS
+from src.transport.http_cache import HttpCache
+from src.utils.config_loader import get_config_provider
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Jira sprint rollover.')
+    parser.add_argument(
+        'mode',
+        nargs='?',
+        choices=('run', 'prepare', 'commit'),
+        default='run',
+        help='run everything now (default), prepare a plan ahead of '
+        'rollover day, or commit a prepared plan',
+    )
+    parser.add_argument(
+        '--plan',
+        type=Path,
+        default=DEFAULT_PLAN_PATH,
+        help=f'plan file path (default: {DEFAULT_PLAN_PATH})',
+    )
+    parser.add_argument(
+        '--day',
+        type=date.fromisoformat,
+        default=None,
+        help='rollover day (YYYY-MM-DD) to prepare for; defaults to today',
+    )
+    parser.add_argument(
+        '--trace',
+        type=Path,
+        default=None,
+        help='append phase and HTTP spans to this JSON lines file',
+    )
+    parser.add_argument(
+        '--trace-format',
+        choices=('json', 'otel'),
+        default='json',
+        help='span records as plain JSON or OTLP/JSON span objects',
+    )
+    parser.add_argument(
+        '--metrics-file',
+        type=Path,
+        default=None,
+        help='write Prometheus metrics here for the textfile collector',
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='serve /metrics on this local port and keep serving after '
+        'the run until interrupted',
+    )
+    parser.add_argument(
+        '--http-cache',
+        type=Path,
+        default=None,
+        help='cache board sprint listings in this directory; prepare '
+        'reuses them while fresh, run revalidates them with conditional '
+        'GETs (not used by commit)',
+    )
+    parser.add_argument(
+        '--profile',
+        type=Path,
+        default=None,
+        help='profile the run and write the result to this path',
+    )
+    parser.add_argument(
+        '--profile-mode',
+        choices=('cprofile', 'sample'),
+        default='cprofile',
+        help='cProfile pstats dump, or sampled time split into network, '
+        'pydantic, json, idle and other',
+    )
+    return parser.parse_args()
+
 
 if __name__ == '__main__':
+    args = parse_args()
     log_config()
 
     try:
-        config = load_config()
+        config = get_config_provider().get()
     except ConfigError as e:
         print(f'Error: {e}')
         sys.exit(1)
 
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = serve_metrics(args.metrics_port)
+
     try:
-        session = get_authenticated_session()
-        automate_sprint(session, config)
+        with (
+            exporting_spans(args.trace, args.trace_format),
+            profiling(args.profile, args.profile_mode),
+        ):
+            workers = min(config.max_workers, len(config.boards))
+            hosts = {board.base_url.host for board in config.boards}
+            # Commit must see the board as it is now; keep it off the cache
+            # entirely.
+            use_cache = args.http_cache and args.mode != 'commit'
+            cache = HttpCache(args.http_cache) if use_cache else None
+            session = get_authenticated_session(
+                pool_connections=max(len(hosts), 1),
+                pool_maxsize=workers * DEFAULT_PAGE_WORKERS,
+                cache=cache,
+            )
+
+            if args.mode == 'prepare':
+                results = prepare_boards(
+                    session, config.boards, workers, args.plan, args.day
+                )
+            elif args.mode == 'commit':
+                results = commit_boards(
+                    session, config.boards, workers, args.plan
+                )
+            else:
+                results = run_boards(session, config.boards, workers)
+
+    except RolloverPlanError as e:
+        print(f'Error: {e}')
+        sys.exit(1)
 
     except Exception as e:
         logging.exception('An unexpected error occurred')
         raise
+
+    finally:
+        if args.metrics_file is not None:
+            write_textfile(args.metrics_file)
+
+    if metrics_server is not None:
+        logging.info(f'\nServing metrics on port {args.metrics_port}.')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            metrics_server.shutdown()
+
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import time
 from typing import Final
 
 import requests
 from requests.auth import HTTPBasicAuth, AuthBase
 
 from src.auth.credentials import get_jira_credentials
+from src.logs.metrics import record_request
+from src.logs.tracing import get_tracer
 from src.models.credentials import Credentials
+from src.transport.adapter import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    ConnectionStats,
+    JiraHTTPAdapter,
+)
+from src.transport.compression import ACCEPT_ENCODING, body_size_attributes
+from src.transport.http_cache import HttpCache
+from src.transport.json_codec import JsonCodec
+from src.transport.retry import RetryBudget, RetryPolicy
+from src.utils.url_builder import endpoint_template
 
 DEFAULT_TIMEOUT: Final[float] = 10.0
+DEFAULT_RETRY_POLICY: Final[RetryPolicy] = RetryPolicy()
 
 
 def _validate_timeout(timeout: float | tuple[float, float]) -> None:
@@ -22,28 +37,125 @@ def _validate_timeout(timeout: float | tuple[float, float]) -> None:
 
 
 class TimeoutSession(requests.Session):
-    """requests.Session that applies a default timeout to every request."""
-    def __init__(self, timeout: float | tuple[float, float]) -> None:
+    """requests.Session that applies a default timeout to every request.
+
+    ``json=`` bodies, Pydantic models included, are encoded to bytes with
+    the adapter's codec rather than by requests.
+    """
+    def __init__(
+            self,
+            timeout: float | tuple[float, float],
+            adapter: JiraHTTPAdapter | None = None,
+            retry_budget: RetryBudget | None = None
+    ) -> None:
         super().__init__()
         _validate_timeout(timeout)
         self._timeout = timeout
+        self._adapter = adapter or JiraHTTPAdapter()
+        self.retry_budget = retry_budget
+        self.mount('https://', self._adapter)
+        self.mount('http://', self._adapter)
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        return self._adapter.stats
+
+    @property
+    def codec(self) -> JsonCodec:
+        return self._adapter.codec
 
-    def request(self, *args, **kwargs):
+    @property
+    def cache(self) -> HttpCache | None:
+        return self._adapter.cache
+
+    def request(self, method, url, *args, **kwargs):
         kwargs.setdefault("timeout", self._timeout)
-        return super().request(*args, **kwargs)
+        if kwargs.get('json') is not None:
+            kwargs['data'] = self.codec.encode(kwargs.pop('json'))
+            kwargs['headers'] = {
+                'Content-Type': 'application/json',
+                **(kwargs.get('headers') or {}),
+            }
+        method = method.upper()
+        endpoint = endpoint_template(url)
+        started = time.perf_counter()
+        status_code = None
+
+        try:
+            with get_tracer().span(
+                'http',
+                kind='client',
+                **{'http.method': method, 'http.route': endpoint},
+            ) as span:
+                response = super().request(method, url, *args, **kwargs)
+                status_code = response.status_code
+                span.set(**exchange_attributes(response, kwargs.get('stream')))
+        finally:
+            seconds = time.perf_counter() - started
+            record_request(method, endpoint, status_code, seconds)
+
+        return response
+
+
+def exchange_attributes(
+        response: requests.Response,
+        stream: bool | None = None
+) -> dict[str, int | str]:
+    body = response.request.body if response.request else None
+    attributes: dict[str, int | str] = {
+        'http.status_code': response.status_code,
+        'http.request.bytes': len(body) if body else 0,
+    }
+    # Reading a streamed body here would consume it before the caller does;
+    # JsonResponse reports its sizes when it is decoded instead.
+    if not stream:
+        attributes.update(
+            body_size_attributes(response, len(response.content))
+        )
+    if cache_status := getattr(response, 'cache_status', None):
+        attributes['http.cache'] = cache_status
+    return attributes
 
 
 def build_authenticated_session(
         credentials: Credentials,
         auth: AuthBase | None = None,
-        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT
-) -> requests.Session:
-    session = TimeoutSession(timeout)
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        retry_budget: RetryBudget | None = None,
+        adapter_class: type[JiraHTTPAdapter] = JiraHTTPAdapter,
+        codec: JsonCodec | None = None,
+        cache: HttpCache | None = None
+) -> TimeoutSession:
+    retry_budget = retry_budget or RetryBudget()
+    adapter = adapter_class(
+        pool_connections,
+        pool_maxsize,
+        pool_block,
+        codec=codec,
+        cache=cache,
+        max_retries=retry_policy.build(retry_budget),
+    )
+    session = TimeoutSession(timeout, adapter, retry_budget)
     session.auth = auth or HTTPBasicAuth(credentials.email, credentials.token)
-    session.headers.update({'Content-Type': 'application/json'})
+    session.headers.update(
+        {'Content-Type': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING}
+    )
     return session
 
 
-def get_authenticated_session() -> requests.Session:
+def get_authenticated_session(
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        cache: HttpCache | None = None
+) -> requests.Session:
     credentials = get_jira_credentials()
-    return build_authenticated_session(credentials)
+    return build_authenticated_session(
+        credentials,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        cache=cache,
+    )
@@ -0,0 +1,5 @@
+class PaginationError(Exception):
+    def __init__(self, context: str, start_at: int) -> None:
+        super().__init__(f'Failed while {context} (startAt={start_at}).')
+        self.context = context
+        self.start_at = start_at
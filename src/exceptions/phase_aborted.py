@@ -0,0 +1,5 @@
+class PhaseAborted(Exception):
+    def __init__(self, phase: str, reason: str) -> None:
+        super().__init__(f'Phase {phase!r} aborted: {reason}')
+        self.phase = phase
+        self.reason = reason
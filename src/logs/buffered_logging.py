@@ -0,0 +1,43 @@
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_buffer: ContextVar[list[logging.LogRecord] | None] = ContextVar(
+    'log_buffer', default=None
+)
+_flush_lock = threading.Lock()
+
+
+class _BufferFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = _buffer.get()
+        if buffer is None:
+            return True
+        buffer.append(record)
+        return False
+
+
+_BUFFER_FILTER = _BufferFilter()
+
+
+@contextmanager
+def buffered_logs() -> Iterator[None]:
+    """Hold root-logger records made in this context and emit them as one
+    block on exit, so concurrent boards' ::group:: sections never mix.
+
+    Worker threads started with ``copy_context()`` share the buffer.
+    """
+    root = logging.getLogger()
+    root.addFilter(_BUFFER_FILTER)
+    records: list[logging.LogRecord] = []
+    token = _buffer.set(records)
+
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+        with _flush_lock:
+            for record in records:
+                root.handle(record)
@@ -16,5 +16,8 @@ def handle_api_error(response: requests.Response, context: str) -> bool:
         else:
             logging.error(f'Response content: {response.text}')
 
+        # A streamed body is not read on every branch above; release the
+        # connection instead of leaving it checked out of the pool.
+        response.close()
         return False
     return True
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Final, Iterator
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+CONTENT_TYPE: Final[str] = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Counter:
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = _label_values(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_values(self.labelnames, labels), 0)
+
+    def samples(self) -> Iterator[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} counter'
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            labels = _format_labels(self.labelnames, key)
+            yield f'{self.name}{labels} {_format_number(value)}'
+
+
+class Histogram:
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket (non-cumulative) counts, sum, count.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_values(self.labelnames, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        key = _label_values(self.labelnames, labels)
+        counts, _ = self._series.get(key, ([], [0.0]))
+        return sum(counts)
+
+    def samples(self) -> Iterator[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} histogram'
+        with self._lock:
+            series = sorted(
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._series.items()
+            )
+
+        for key, counts, total in series:
+            cumulative = 0
+            bounds = [*map(_format_number, self.buckets), '+Inf']
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*self.labelnames, 'le'), (*key, bound)
+                )
+                yield f'{self.name}_bucket{labels} {cumulative}'
+
+            labels = _format_labels(self.labelnames, key)
+            yield f'{self.name}_sum{labels} {_format_number(total)}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class MetricsRegistry:
+    """Holds a run's metrics and renders the Prometheus text format."""
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.samples()]
+        return '\n'.join(lines) + '\n'
+
+    def _register[M: (Counter, Histogram)](self, metric: M) -> M:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric {metric.name} already registered.')
+            self._metrics[metric.name] = metric
+        return metric
+
+
+def _label_values(
+        labelnames: tuple[str, ...], labels: dict[str, str]
+) -> LabelValues:
+    if set(labels) != set(labelnames):
+        raise ValueError(
+            f'Expected labels {sorted(labelnames)}, got {sorted(labels)}.'
+        )
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}'
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    )
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def status_class(status_code: int | None) -> str:
+    return f'{status_code // 100}xx' if status_code else 'error'
+
+
+_registry: Final[MetricsRegistry] = MetricsRegistry()
+
+REQUESTS: Final[Counter] = _registry.counter(
+    'jira_requests_total',
+    'Jira API requests by endpoint template, method and status class.',
+    ('endpoint', 'method', 'status_class'),
+)
+REQUEST_SECONDS: Final[Histogram] = _registry.histogram(
+    'jira_request_duration_seconds',
+    'Jira API request latency in seconds, retries included.',
+    ('endpoint', 'method', 'status_class'),
+)
+RETRIES: Final[Counter] = _registry.counter(
+    'jira_request_retries_total',
+    'Transport retries spent by endpoint template.',
+    ('endpoint',),
+)
+ISSUES_MOVED: Final[Counter] = _registry.counter(
+    'jira_issues_moved_total',
+    'Issues moved into a new sprint.',
+)
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def record_request(
+        method: str,
+        endpoint: str,
+        status_code: int | None,
+        seconds: float
+) -> None:
+    labels = {
+        'endpoint': endpoint,
+        'method': method,
+        'status_class': status_class(status_code),
+    }
+    REQUESTS.inc(**labels)
+    REQUEST_SECONDS.observe(seconds, **labels)
+
+
+def write_textfile(
+        path: Path, registry: MetricsRegistry = _registry
+) -> None:
+    """Write for node_exporter's textfile collector; swapped in atomically."""
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    temp_path.write_text(registry.render(), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def serve_metrics(
+        port: int,
+        registry: MetricsRegistry = _registry,
+        host: str = '127.0.0.1'
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread; call shutdown() to stop."""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
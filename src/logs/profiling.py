@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Final, Iterator, Literal
+
+ProfileMode = Literal['cprofile', 'sample']
+
+DEFAULT_SAMPLE_INTERVAL: Final[float] = 0.005
+
+# Matched against frame filenames with '/' separators. The innermost frame
+# decides 'idle'; otherwise the innermost frame matching a category wins.
+IDLE_PATHS: Final[tuple[str, ...]] = (
+    '/threading.py',
+    '/queue.py',
+    '/concurrent/futures/',
+    '/selectors.py',
+)
+CATEGORY_PATHS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ('json', ('/json/', 'orjson')),
+    ('pydantic', ('/pydantic/', '/pydantic_core/')),
+    (
+        'network',
+        (
+            '/socket.py',
+            '/ssl.py',
+            '/http/client.py',
+            '/urllib3/',
+            '/requests/',
+        ),
+    ),
+)
+
+
+def classify_stack(frame: FrameType | None) -> str:
+    """Name what a thread is doing from its current stack."""
+    if frame is None:
+        return 'other'
+
+    if _matches(frame, IDLE_PATHS):
+        return 'idle'
+
+    while frame is not None:
+        for category, paths in CATEGORY_PATHS:
+            if _matches(frame, paths):
+                return category
+        frame = frame.f_back
+
+    return 'other'
+
+
+def _matches(frame: FrameType, paths: tuple[str, ...]) -> bool:
+    filename = frame.f_code.co_filename.replace('\\', '/')
+    return any(path in filename for path in paths)
+
+
+class SamplingProfiler:
+    """Samples every thread's stack on a wall-clock interval.
+
+    Each sample is attributed to network waiting, JSON decoding, Pydantic
+    validation, idle pool threads or other Python work, which shows where
+    a run spends its time without instrumenting the code.
+    """
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        if interval <= 0:
+            raise ValueError('Sampling interval must be > 0 seconds.')
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='sampler', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample(self) -> None:
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != own_id:
+                self.counts[classify_stack(frame)] += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        busy = sum(
+            count for name, count in self.counts.items() if name != 'idle'
+        )
+        summary = {}
+        for name, count in self.counts.most_common():
+            share = count / busy if busy and name != 'idle' else 0.0
+            summary[name] = {
+                'samples': count,
+                'seconds': round(count * self.interval, 3),
+                'busy_share': round(share, 4),
+            }
+        return summary
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+
+@contextmanager
+def profiling(
+        path: Path | None,
+        mode: ProfileMode = 'cprofile',
+        interval: float = DEFAULT_SAMPLE_INTERVAL
+) -> Iterator[None]:
+    """Profile the block and write the result to ``path`` when it exits.
+
+    'cprofile' writes a pstats dump (``python -m pstats path``); since
+    Python 3.12 it sees every thread. 'sample' writes a JSON breakdown of
+    thread time by category.
+    """
+    if path is None:
+        yield
+        return
+
+    if mode == 'sample':
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            summary = sampler.summary()
+            path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+            log_sample_summary(summary, path)
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        logging.info(f'\nProfile written to {path}.')
+
+
+def log_sample_summary(
+        summary: dict[str, dict[str, float]], path: Path
+) -> None:
+    logging.info(f'\nSampled thread time (written to {path}):')
+    for name, stats in summary.items():
+        logging.info(
+            f'{name:>9}: {stats['seconds']:8.2f}s '
+            f'{stats['busy_share']:6.1%} of busy time'
+        )
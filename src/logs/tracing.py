@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Final, Iterator, Literal, TextIO
+
+SpanKind = Literal['internal', 'client']
+SpanFormat = Literal['json', 'otel']
+SpanExporter = Callable[['Span'], None]
+
+# OTLP enum values for SpanKind and StatusCode.
+OTEL_SPAN_KINDS: Final[dict[str, int]] = {'internal': 1, 'client': 3}
+OTEL_STATUS_OK: Final[int] = 1
+OTEL_STATUS_ERROR: Final[int] = 2
+
+_current_span: ContextVar[Span | None] = ContextVar(
+    'current_span', default=None
+)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = 'internal'
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'kind': self.kind,
+            'start_ns': self.start_ns,
+            'duration_ms': round(self.duration_ms, 3),
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+    def to_otel(self) -> dict[str, Any]:
+        """Render the span as an OTLP/JSON span object."""
+        status = {'code': OTEL_STATUS_OK}
+        if self.error:
+            status = {'code': OTEL_STATUS_ERROR, 'message': self.error}
+
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_id or '',
+            'name': self.name,
+            'kind': OTEL_SPAN_KINDS[self.kind],
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns or self.start_ns),
+            'attributes': [
+                {'key': key, 'value': otel_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            'status': status,
+        }
+
+
+def otel_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class Tracer:
+    """Records nested spans and hands each finished one to the exporters.
+
+    The current span lives in a context variable, so work submitted with
+    ``contextvars.copy_context().run`` keeps its parent across threads.
+    """
+    def __init__(self) -> None:
+        self._exporters: list[SpanExporter] = []
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        with self._lock:
+            self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter: SpanExporter) -> None:
+        with self._lock:
+            self._exporters.remove(exporter)
+
+    @contextmanager
+    def span(
+            self,
+            name: str,
+            kind: SpanKind = 'internal',
+            **attributes: Any
+    ) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else _random_id(128),
+            span_id=_random_id(64),
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            self._export(span)
+
+    def _export(self, span: Span) -> None:
+        for exporter in tuple(self._exporters):
+            exporter(span)
+
+
+class JsonLinesExporter:
+    """Writes one JSON object per finished span, plain or OTLP-shaped."""
+    def __init__(self, stream: TextIO, span_format: SpanFormat = 'json'):
+        self._stream = stream
+        self._render = Span.to_otel if span_format == 'otel' else Span.to_record
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = json.dumps(self._render(span), default=str)
+        with self._lock:
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+
+def _random_id(bits: int) -> str:
+    return f'{random.getrandbits(bits):0{bits // 4}x}'
+
+
+_tracer: Final[Tracer] = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def exporting_spans(
+        path: Path | None,
+        span_format: SpanFormat = 'json'
+) -> Iterator[None]:
+    """Append every span finished inside the block to a JSON lines file."""
+    if path is None:
+        yield
+        return
+
+    with path.open(mode='a', encoding='utf-8') as stream:
+        exporter = JsonLinesExporter(stream, span_format)
+        _tracer.add_exporter(exporter)
+        try:
+            yield
+        finally:
+            _tracer.remove_exporter(exporter)
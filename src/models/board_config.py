@@ -1,9 +1,17 @@
+from typing import Literal
+
 from pydantic import BaseModel, HttpUrl
 
 from src.customtypes.shared import SAFE_STR, PositiveInt
 
+# 'offset' pages the Agile sprint issue listing by startAt; 'cursor' pages
+# the enhanced JQL search by nextPageToken, which stays consistent while
+# issues move between sprints.
+IssueBackend = Literal['offset', 'cursor']
+
 
 class BoardConfig(BaseModel):
     board_id: PositiveInt
     base_url: HttpUrl
     board_name: SAFE_STR
+    issue_backend: IssueBackend = 'offset'
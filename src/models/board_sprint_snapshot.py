@@ -0,0 +1,12 @@
+from datetime import date
+from typing import NamedTuple
+
+from src.models.sprint_summary import SprintSummary
+
+
+class BoardSprintSnapshot(NamedTuple):
+    active: SprintSummary | None
+    future_by_start: dict[date, SprintSummary]
+
+    def dart_sprint_starting(self, day: date) -> SprintSummary | None:
+        return self.future_by_start.get(day)
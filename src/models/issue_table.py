@@ -0,0 +1,165 @@
+import sys
+from array import array
+from itertools import batched
+from typing import Final, Iterable, Iterator
+
+from src.models.jira_issue import Issue, JiraIssueRecord
+
+TRANSFER_BATCH_SIZE: Final[int] = 50
+
+
+class Vocabulary:
+    """Interns repeated strings and hands out small integer codes."""
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(sys.intern(name))
+            self._codes[name] = code
+        return code
+
+    def lookup(self, name: str) -> int | None:
+        return self._codes.get(name)
+
+
+class IssueTable:
+    """Column-oriented store for a set of issues.
+
+    Keys are split into an interned project prefix code and the issue
+    number; type and status are interned codes; summaries share one UTF-8
+    buffer indexed by end offsets. Each issue costs a few dozen bytes plus
+    its summary, against several hundred for a JiraIssue. Rows are read
+    back as JiraIssueRecord.
+    """
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        self._prefixes = Vocabulary()
+        self._types = Vocabulary()
+        self._statuses = Vocabulary()
+        self._prefix_codes = array('I')
+        # Issue number + 1; 0 marks a key stored whole in its prefix.
+        self._numbers = array('I')
+        self._type_codes = array('H')
+        self._status_codes = array('H')
+        self._summaries = bytearray()
+        self._summary_ends = array('I')
+        self.extend(issues)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __iter__(self) -> Iterator[JiraIssueRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> JiraIssueRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('IssueTable index out of range.')
+
+        start = self._summary_ends[index - 1] if index else 0
+        end = self._summary_ends[index]
+        return JiraIssueRecord(
+            key=self.key(index),
+            type=self._types.names[self._type_codes[index]],
+            status=self._statuses.names[self._status_codes[index]],
+            summary=self._summaries[start:end].decode('utf-8'),
+        )
+
+    def append(self, issue: Issue) -> None:
+        prefix, number = split_issue_key(issue.key)
+        self._prefix_codes.append(self._prefixes.code(prefix))
+        self._numbers.append(number)
+        self._type_codes.append(self._types.code(issue.type))
+        self._status_codes.append(self._statuses.code(issue.status))
+        self._summaries += issue.summary.encode('utf-8')
+        self._summary_ends.append(len(self._summaries))
+
+    def _copy_row(self, source: 'IssueTable', index: int) -> None:
+        start = source._summary_ends[index - 1] if index else 0
+        end = source._summary_ends[index]
+        self._prefix_codes.append(source._prefix_codes[index])
+        self._numbers.append(source._numbers[index])
+        self._type_codes.append(source._type_codes[index])
+        self._status_codes.append(source._status_codes[index])
+        self._summaries += source._summaries[start:end]
+        self._summary_ends.append(len(self._summaries))
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            self.append(issue)
+
+    def key(self, index: int) -> str:
+        prefix = self._prefixes.names[self._prefix_codes[index]]
+        number = self._numbers[index]
+        return f'{prefix}{number - 1}' if number else prefix
+
+    def keys(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.key(index)
+
+    def with_status(
+            self, statuses: Iterable[str], exclude: bool = False
+    ) -> 'IssueTable':
+        """Return the issues whose status is in ``statuses``, or with
+        ``exclude`` is not. Rows are copied column by column, so nothing
+        is decoded and the vocabularies are shared with this table.
+        """
+        codes = {
+            code
+            for code in map(self._statuses.lookup, statuses)
+            if code is not None
+        }
+        table = IssueTable()
+        table._prefixes = self._prefixes
+        table._types = self._types
+        table._statuses = self._statuses
+
+        for index, code in enumerate(self._status_codes):
+            if (code in codes) != exclude:
+                table._copy_row(self, index)
+        return table
+
+    def key_batches(
+            self, batch_size: int = TRANSFER_BATCH_SIZE
+    ) -> Iterator[list[str]]:
+        for batch in batched(self.keys(), batch_size):
+            yield list(batch)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns, excluding the shared vocabularies."""
+        columns = (
+            self._prefix_codes,
+            self._numbers,
+            self._type_codes,
+            self._status_codes,
+            self._summary_ends,
+        )
+        return len(self._summaries) + sum(
+            len(column) * column.itemsize for column in columns
+        )
+
+
+def split_issue_key(key: str) -> tuple[str, int]:
+    """Split 'PROJ-123' into ('PROJ-', 123 + 1).
+
+    Keys without a plain numeric suffix come back whole, with 0.
+    """
+    prefix, dash, number = key.rpartition('-')
+    if (
+        dash
+        and number.isdecimal()
+        and number.isascii()
+        and str(int(number)) == number
+        and int(number) < 2 ** 32 - 1
+    ):
+        return prefix + dash, int(number) + 1
+    return key, 0
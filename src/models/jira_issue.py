@@ -1,10 +1,31 @@
-from pydantic import BaseModel
+from typing import NamedTuple
+
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
 
 from src.customtypes.shared import SAFE_STR
 
 
 class JiraIssue(BaseModel):
+    # Raw issues from Jira nest type, status and summary under 'fields';
+    # the aliases let a whole page validate in one call.
+    model_config = ConfigDict(validate_by_name=True, validate_by_alias=True)
+
     key: SAFE_STR
-    type: SAFE_STR
-    status: SAFE_STR
-    summary: SAFE_STR
+    type: SAFE_STR = Field(
+        validation_alias=AliasPath('fields', 'issuetype', 'name')
+    )
+    status: SAFE_STR = Field(
+        validation_alias=AliasPath('fields', 'status', 'name')
+    )
+    summary: SAFE_STR = Field(validation_alias=AliasPath('fields', 'summary'))
+
+
+class JiraIssueRecord(NamedTuple):
+    """Unvalidated issue decoded from a response Jira itself sent."""
+    key: str
+    type: str
+    status: str
+    summary: str
+
+
+Issue = JiraIssue | JiraIssueRecord
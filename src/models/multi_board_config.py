@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+from src.customtypes.shared import PositiveInt
+from src.models.board_config import BoardConfig
+
+
+class MultiBoardConfig(BaseModel):
+    boards: list[BoardConfig] = Field(min_length=1)
+    max_workers: PositiveInt = 8
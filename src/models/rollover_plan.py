@@ -0,0 +1,25 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+from src.customtypes.shared import INT_GT_0, SAFE_STR, PositiveInt
+
+
+class PlannedSprint(BaseModel):
+    id: INT_GT_0
+    name: SAFE_STR
+    startDate: SAFE_STR | None = None
+    endDate: SAFE_STR | None = None
+
+
+class RolloverPlan(BaseModel):
+    board_id: PositiveInt
+    rollover_day: date
+    prepared_at: datetime
+    active_sprint: PlannedSprint | None
+    target_sprint: PlannedSprint
+    key_batches: list[list[SAFE_STR]]
+
+
+class RolloverPlanFile(BaseModel):
+    plans: list[RolloverPlan]
@@ -0,0 +1,119 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, NamedTuple
+
+import requests
+
+from src.logs.buffered_logging import buffered_logs
+from src.logs.tracing import get_tracer
+from src.models.board_config import BoardConfig
+from src.orchestration.sprint_orchestration import automate_sprint
+from src.transport.retry import RetryBudget, retry_budget_scope
+
+BoardTask = Callable[[requests.Session, BoardConfig], None]
+
+
+class BoardRunResult(NamedTuple):
+    board_id: int
+    board_name: str
+    succeeded: bool
+    seconds: float
+    error: str | None = None
+
+
+def run_board(
+    session: requests.Session,
+    config: BoardConfig,
+    task: BoardTask | None = None,
+    buffer_logs: bool = False,
+) -> BoardRunResult:
+    with buffered_logs() if buffer_logs else nullcontext():
+        return _run_board(session, config, task)
+
+
+def _run_board(
+    session: requests.Session,
+    config: BoardConfig,
+    task: BoardTask | None,
+) -> BoardRunResult:
+    started = time.perf_counter()
+
+    try:
+        with (
+            get_tracer().span(
+                'board',
+                **{
+                    'board.id': config.board_id,
+                    'board.name': config.board_name,
+                },
+            ),
+            retry_budget_scope(RetryBudget()),
+        ):
+            (task or automate_sprint)(session, config)
+
+    # SystemExit is how a failed issue transfer aborts a single-board run;
+    # here it must only end this board.
+    except (Exception, SystemExit) as e:
+        logging.exception(f'Sprint automation failed for {config.board_name}')
+        return BoardRunResult(
+            config.board_id,
+            config.board_name,
+            False,
+            time.perf_counter() - started,
+            str(e) or type(e).__name__,
+        )
+
+    return BoardRunResult(
+        config.board_id,
+        config.board_name,
+        True,
+        time.perf_counter() - started,
+    )
+
+
+def run_boards(
+    session: requests.Session,
+    configs: list[BoardConfig],
+    max_workers: int,
+    task: BoardTask | None = None,
+) -> list[BoardRunResult]:
+    """Run a board task (automate_sprint by default) on a bounded pool.
+
+    All boards share one session and so one connection pool, but each
+    draws its retries from its own budget. Results come back in config
+    order, and a failing board never stops the others. When boards run
+    side by side, each board's log lines are written out together once it
+    finishes.
+    """
+    buffer_logs = max_workers > 1 and len(configs) > 1
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='board'
+    ) as pool:
+        results = list(
+            pool.map(
+                lambda config: run_board(session, config, task, buffer_logs),
+                configs,
+            )
+        )
+
+    log_run_summary(results)
+    return results
+
+
+def log_run_summary(results: list[BoardRunResult]) -> None:
+    failed = [result for result in results if not result.succeeded]
+
+    logging.info(
+        f'\nSprint automation finished for {len(results)} boards: '
+        f'{len(results) - len(failed)} succeeded, {len(failed)} failed.'
+    )
+
+    for result in results:
+        outcome = 'ok' if result.succeeded else f'FAILED ({result.error})'
+        logging.info(
+            f'{result.board_name} (board {result.board_id}): '
+            f'{outcome} in {result.seconds:.1f}s'
+        )
@@ -0,0 +1,97 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from typing import Any, Callable, Final, NamedTuple
+
+from src.logs.tracing import get_tracer
+
+DEFAULT_PHASE_WORKERS: Final[int] = 4
+
+
+class Phase(NamedTuple):
+    name: str
+    run: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+def validate_phases(phases: list[Phase]) -> None:
+    names = [phase.name for phase in phases]
+    if len(set(names)) != len(names):
+        raise ValueError('Phase names must be unique.')
+
+    known = set(names)
+    for phase in phases:
+        missing = set(phase.depends_on) - known
+        if missing:
+            raise ValueError(
+                f'Phase {phase.name!r} depends on unknown phases: '
+                f'{", ".join(sorted(missing))}'
+            )
+
+    resolved: set[str] = set()
+    remaining = list(phases)
+    while remaining:
+        ready = [p for p in remaining if set(p.depends_on) <= resolved]
+        if not ready:
+            cycle = ', '.join(sorted(p.name for p in remaining))
+            raise ValueError(f'Phase dependencies form a cycle: {cycle}')
+        resolved.update(p.name for p in ready)
+        remaining = [p for p in remaining if p.name not in resolved]
+
+
+def run_phase_graph(
+    phases: list[Phase], max_workers: int = DEFAULT_PHASE_WORKERS
+) -> dict[str, Any]:
+    """Run phases as soon as their dependencies finish; return all results.
+
+    Each phase receives a dict of its dependencies' results. Independent
+    phases overlap on a thread pool, so total time follows the longest
+    dependency chain. If a phase raises, nothing new is started, phases
+    already running are allowed to finish, and the first error is raised.
+    """
+    validate_phases(phases)
+
+    results: dict[str, Any] = {}
+    pending = list(phases)
+    running: dict[Future, Phase] = {}
+    error: BaseException | None = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            if error is None:
+                for phase in [p for p in pending if _is_ready(p, results)]:
+                    inputs = {dep: results[dep] for dep in phase.depends_on}
+                    future = pool.submit(
+                        copy_context().run, run_phase, phase, inputs
+                    )
+                    running[future] = phase
+                    pending.remove(phase)
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                phase = running.pop(future)
+                try:
+                    results[phase.name] = future.result()
+                except BaseException as e:
+                    error = error or e
+
+    if error is not None:
+        raise error
+
+    return results
+
+
+def run_phase(phase: Phase, inputs: dict[str, Any]) -> Any:
+    with get_tracer().span('phase', **{'phase.name': phase.name}):
+        return phase.run(inputs)
+
+
+def _is_ready(phase: Phase, results: dict[str, Any]) -> bool:
+    return all(dep in results for dep in phase.depends_on)
@@ -0,0 +1,262 @@
+import logging
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Final
+
+import requests
+from pydantic import ValidationError
+
+from src.exceptions.phase_aborted import PhaseAborted
+from src.exceptions.rollover_plan_error import RolloverPlanError
+from src.models.board_config import BoardConfig
+from src.models.board_sprint_snapshot import BoardSprintSnapshot
+from src.models.rollover_plan import (
+    PlannedSprint,
+    RolloverPlan,
+    RolloverPlanFile,
+)
+from src.orchestration.multi_board import BoardRunResult, run_boards
+from src.orchestration.phase_graph import run_phase_graph
+from src.orchestration.sprint_orchestration import (
+    build_rollover_phases,
+    collect_incomplete_issues,
+)
+from src.services.jira_sprint import get_board_sprint_snapshot
+from src.services.jira_sprint_closure import close_sprint
+from src.services.jira_start_sprint import start_sprint
+from src.services.sprint_transfer import move_key_batches
+
+DEFAULT_PLAN_PATH: Final[Path] = Path('rollover_plan.json')
+PREPARE_PHASES: Final[frozenset[str]] = frozenset(
+    {'snapshot', 'target', 'incomplete'}
+)
+
+
+def prepare_rollover(
+    session: requests.Session,
+    config: BoardConfig,
+    day: date | None = None
+) -> RolloverPlan:
+    """Do every read, and any sprint creation, ahead of rollover day.
+
+    Runs the read-only half of the rollover phase graph and records which
+    sprint to close, which sprint to start and the incomplete keys it
+    expects to move; commit lists them again before moving. Since commit
+    revalidates the plan, the sprint listing may come from a fresh cache.
+    """
+    day = day or date.today()
+    start_date = datetime.combine(day, datetime.now().time())
+    end_date = start_date + timedelta(days=14)
+
+    phases = [
+        phase
+        for phase in build_rollover_phases(
+            session, config, start_date, end_date, revalidate=False
+        )
+        if phase.name in PREPARE_PHASES
+    ]
+    done = run_phase_graph(phases)
+
+    active_sprint = done['snapshot'].active
+    target_id, target_name = done['target']
+
+    plan = RolloverPlan(
+        board_id=config.board_id,
+        rollover_day=day,
+        prepared_at=datetime.now(),
+        active_sprint=PlannedSprint(**active_sprint) if active_sprint else None,
+        target_sprint=PlannedSprint(id=target_id, name=target_name),
+        key_batches=list(done['incomplete'].key_batches()),
+    )
+
+    logging.info(
+        f'\nPrepared rollover for {config.board_name} on {day}: '
+        f'{sum(map(len, plan.key_batches))} issues to move into '
+        f'{target_name}.'
+    )
+    return plan
+
+
+def commit_rollover(
+    session: requests.Session, config: BoardConfig, plan: RolloverPlan
+) -> None:
+    """Revalidate a prepared plan against the board, then do the writes.
+
+    The incomplete keys are listed again before the sprint closes, so the
+    move covers the sprint as it is now rather than as it was at prepare.
+    """
+    snapshot = get_board_sprint_snapshot(session, config, plan.rollover_day)
+    validate_plan(plan, config, snapshot, date.today())
+    key_batches = relist_key_batches(plan, session, config)
+
+    start_date = datetime.now()
+    end_date = start_date + timedelta(days=14)
+    active_sprint = plan.active_sprint
+    target_sprint = plan.target_sprint
+
+    if active_sprint and not close_sprint(
+        active_sprint.id,
+        active_sprint.name,
+        active_sprint.startDate,
+        active_sprint.endDate,
+        session,
+        config.base_url,
+    ):
+        raise PhaseAborted(
+            'close', f'Failed to close sprint {active_sprint.name}.'
+        )
+
+    if key_batches:
+        move_key_batches(
+            key_batches, session, config.base_url, target_sprint.id
+        )
+
+    if not start_sprint(
+        target_sprint.id,
+        target_sprint.name,
+        start_date,
+        end_date,
+        session,
+        config.base_url,
+    ):
+        raise PhaseAborted(
+            'start', f'Failed to start sprint {target_sprint.name}.'
+        )
+
+
+def relist_key_batches(
+    plan: RolloverPlan, session: requests.Session, config: BoardConfig
+) -> list[list[str]]:
+    """Re-read every incomplete-issue page of the planned active sprint.
+
+    The moves follow the sprint as it is now, not as it was planned; the
+    differences are only logged.
+    """
+    if not plan.active_sprint:
+        return []
+
+    current = collect_incomplete_issues(
+        plan.active_sprint.id, session, config
+    )
+    current_keys = set(current.keys())
+    planned_keys = {key for batch in plan.key_batches for key in batch}
+
+    if finished := planned_keys - current_keys:
+        logging.info(
+            f'\n{len(finished)} planned issues are no longer incomplete '
+            f'and stay put: {', '.join(sorted(finished))}'
+        )
+    if added := current_keys - planned_keys:
+        logging.info(
+            f'\n{len(added)} issues became incomplete after the plan was '
+            f'prepared and will move too: {', '.join(sorted(added))}'
+        )
+
+    return list(current.key_batches())
+
+
+def validate_plan(
+    plan: RolloverPlan,
+    config: BoardConfig,
+    snapshot: BoardSprintSnapshot,
+    today: date
+) -> None:
+    if plan.board_id != config.board_id:
+        raise RolloverPlanError(
+            f'Plan is for board {plan.board_id}, not {config.board_id}.'
+        )
+
+    if plan.rollover_day != today:
+        raise RolloverPlanError(
+            f'Plan is for {plan.rollover_day}, not today ({today}).'
+        )
+
+    active_id = snapshot.active['id'] if snapshot.active else None
+    planned_id = plan.active_sprint.id if plan.active_sprint else None
+    if active_id != planned_id:
+        raise RolloverPlanError(
+            f'Active sprint changed since the plan was prepared '
+            f'(planned {planned_id}, found {active_id}).'
+        )
+
+    target = snapshot.dart_sprint_starting(plan.rollover_day)
+    if not target or target['id'] != plan.target_sprint.id:
+        raise RolloverPlanError(
+            f'Planned sprint {plan.target_sprint.name} is no longer '
+            'a future sprint on the board.'
+        )
+
+
+def write_plan_file(path: Path, plans: list[RolloverPlan]) -> None:
+    plan_file = RolloverPlanFile(
+        plans=sorted(plans, key=lambda plan: plan.board_id)
+    )
+    path.write_text(plan_file.model_dump_json(indent=2), encoding='utf-8')
+    logging.info(f'\nRollover plan for {len(plans)} boards written to {path}.')
+
+
+def read_plan_file(path: Path) -> dict[int, RolloverPlan]:
+    try:
+        plan_file = RolloverPlanFile.model_validate_json(
+            path.read_text(encoding='utf-8')
+        )
+    except FileNotFoundError:
+        raise RolloverPlanError(f'No rollover plan found at {path}.')
+    except ValidationError as e:
+        raise RolloverPlanError(f'Invalid rollover plan in {path}: {e}')
+
+    return {plan.board_id: plan for plan in plan_file.plans}
+
+
+def prepare_boards(
+    session: requests.Session,
+    configs: list[BoardConfig],
+    max_workers: int,
+    path: Path = DEFAULT_PLAN_PATH,
+    day: date | None = None,
+) -> list[BoardRunResult]:
+    plans: list[RolloverPlan] = []
+
+    def prepare(board_session: requests.Session, config: BoardConfig) -> None:
+        plans.append(prepare_rollover(board_session, config, day))
+
+    results = run_boards(session, configs, max_workers, prepare)
+
+    if failed := [result for result in results if not result.succeeded]:
+        logging.warning(
+            f'\nNo new plan for {', '.join(r.board_name for r in failed)}; '
+            f'keeping any earlier entries for them in {path}.'
+        )
+
+    write_plan_file(path, merge_plans(path, plans))
+    return results
+
+
+def merge_plans(path: Path, plans: list[RolloverPlan]) -> list[RolloverPlan]:
+    """Overlay new plans on the file's, so a board that failed to prepare
+    keeps its earlier entry; commit revalidates it before any write."""
+    try:
+        kept = read_plan_file(path)
+    except RolloverPlanError:
+        kept = {}
+
+    return list((kept | {plan.board_id: plan for plan in plans}).values())
+
+
+def commit_boards(
+    session: requests.Session,
+    configs: list[BoardConfig],
+    max_workers: int,
+    path: Path = DEFAULT_PLAN_PATH,
+) -> list[BoardRunResult]:
+    plans = read_plan_file(path)
+
+    def commit(board_session: requests.Session, config: BoardConfig) -> None:
+        plan = plans.get(config.board_id)
+        if plan is None:
+            raise RolloverPlanError(
+                f'No prepared plan for board {config.board_id} in {path}.'
+            )
+        commit_rollover(board_session, config, plan)
+
+    return run_boards(session, configs, max_workers, commit)
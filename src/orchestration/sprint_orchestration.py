@@ -3,18 +3,27 @@ from datetime import datetime, timedelta
 
 import requests
 
+from src.exceptions.pagination_error import PaginationError
+from src.exceptions.phase_aborted import PhaseAborted
+from src.logs.tracing import get_tracer
 from src.models.board_config import BoardConfig
-from src.services.jira_issues import get_incomplete_stories
-from src.services.jira_sprint import (
-    create_sprint,
-    get_sprint_by_state,
-    get_all_future_sprints,
+from src.models.board_sprint_snapshot import BoardSprintSnapshot
+from src.models.issue_table import IssueTable
+from src.orchestration.phase_graph import Phase, run_phase_graph
+from src.services.jira_issues import (
+    iter_incomplete_stories,
+    log_incomplete_count,
 )
+from src.services.jira_sprint import create_sprint, get_board_sprint_snapshot
 from src.services.jira_sprint_closure import close_sprint
 from src.services.jira_start_sprint import start_sprint
-from src.services.sprint_transfer import move_issues_to_new_sprint, parse_issue
+from src.services.pagination import DEFAULT_PAGE_WORKERS
+from src.services.sprint_transfer import (
+    log_issue_stream,
+    move_key_batches,
+    parse_issues,
+)
 from src.utils.sprint_naming import generate_sprint_name
-from src.utils.sprint_parser import parse_dart_sprint
 
 
 def automate_sprint(session: requests.Session, config: BoardConfig) -> None:
@@ -22,74 +31,163 @@ def automate_sprint(session: requests.Session, config: BoardConfig) -> None:
 
     start_date = datetime.now()
     end_date = start_date + timedelta(days=14)
-    active_sprint = get_sprint_by_state(session, config, 'active')
-    future_sprints = get_all_future_sprints(session, config)
-
-    dart_sprint = next(
-        (
-            sprint
-            for sprint in future_sprints
-            if (parsed := parse_dart_sprint(sprint['name']))
-            and parsed.start == start_date
-        ),
-        None,
-    )
 
-    if dart_sprint:
-        logging.info(
-            msg=f'\nUpcoming DART sprint found: {dart_sprint['name']}.'
-            '\nProceeding with automation process.'
-        )
-        new_sprint_id = dart_sprint['id']
-        new_sprint_name = dart_sprint['name']
+    try:
+        with get_tracer().span(
+            'automate_sprint', **{'board.id': config.board_id}
+        ):
+            run_phase_graph(
+                build_rollover_phases(session, config, start_date, end_date)
+            )
+    except PhaseAborted as e:
+        # Logged here for the run's log; re-raised so the board's result
+        # records the failure.
+        logging.error(e.reason)
+        raise
 
-    else:
-        logging.warning(
-            '\nNo future sprint found in the backlog starting with DART.'
-        )
 
-        new_sprint_name = generate_sprint_name(start_date, end_date)
+def build_rollover_phases(
+    session: requests.Session,
+    config: BoardConfig,
+    start_date: datetime,
+    end_date: datetime,
+    revalidate: bool = True
+) -> list[Phase]:
+    """Declare the rollover as phases wired by their real dependencies.
 
-        new_sprint = create_sprint(
-            new_sprint_name, start_date, end_date, session
+    The target sprint lookup (or creation) and the incomplete-issue read
+    both only need the board snapshot, so they overlap. The active sprint
+    is closed only once its keys are read and a target sprint exists, and
+    close, move and start then run in order. ``revalidate`` is passed on
+    to the board snapshot read.
+    """
+    def snapshot(_: dict) -> BoardSprintSnapshot:
+        return get_board_sprint_snapshot(
+            session, config, start_date.date(), revalidate
         )
 
-        if new_sprint:
-            new_sprint_id = new_sprint.get('id')
-            logging.info(
-                'New sprint successfully generated with sprint name: '
-                f'{new_sprint_name}'
-            )
-        else:
-            logging.error('Failed to create new sprint.')
-            return
-
-    if active_sprint:
-        incomplete_stories = get_incomplete_stories(
-            active_sprint['id'], config, session
+    def target(done: dict) -> tuple[int, str]:
+        return resolve_target_sprint(
+            done['snapshot'], session, config, start_date, end_date
         )
-        incomplete_stories = [
-            parse_issue(issue) for issue in incomplete_stories
-        ]
 
-        close_sprint(
+    def incomplete(done: dict) -> IssueTable:
+        active_sprint = done['snapshot'].active
+        if not active_sprint:
+            return IssueTable()
+        return collect_incomplete_issues(active_sprint['id'], session, config)
+
+    def close(done: dict) -> None:
+        active_sprint = done['snapshot'].active
+        if active_sprint and not close_sprint(
             active_sprint['id'],
             active_sprint['name'],
             active_sprint['startDate'],
             active_sprint['endDate'],
             session,
             config.base_url,
-        )
+        ):
+            raise PhaseAborted(
+                'close', f'Failed to close sprint {active_sprint['name']}.'
+            )
+
+    def move(done: dict) -> None:
+        issues = done['incomplete']
+        if issues:
+            new_sprint_id, _ = done['target']
+            move_key_batches(
+                issues.key_batches(),
+                session,
+                config.base_url,
+                new_sprint_id,
+            )
+
+    def start(done: dict) -> None:
+        new_sprint_id, new_sprint_name = done['target']
+        if not start_sprint(
+            new_sprint_id,
+            new_sprint_name,
+            start_date,
+            end_date,
+            session,
+            config.base_url,
+        ):
+            raise PhaseAborted(
+                'start', f'Failed to start sprint {new_sprint_name}.'
+            )
+
+    return [
+        Phase('snapshot', snapshot),
+        Phase('target', target, ('snapshot',)),
+        Phase('incomplete', incomplete, ('snapshot',)),
+        Phase('close', close, ('snapshot', 'target', 'incomplete')),
+        Phase('move', move, ('close', 'target', 'incomplete')),
+        Phase('start', start, ('move', 'target')),
+    ]
+
 
-        move_issues_to_new_sprint(
-            incomplete_stories, session, config.base_url, new_sprint_id
+def resolve_target_sprint(
+    snapshot: BoardSprintSnapshot,
+    session: requests.Session,
+    config: BoardConfig,
+    start_date: datetime,
+    end_date: datetime
+) -> tuple[int, str]:
+    dart_sprint = snapshot.dart_sprint_starting(start_date.date())
+
+    if dart_sprint:
+        logging.info(
+            msg=f'\nUpcoming DART sprint found: {dart_sprint['name']}.'
+            '\nProceeding with automation process.'
         )
+        return dart_sprint['id'], dart_sprint['name']
+
+    logging.warning(
+        '\nNo future sprint found in the backlog starting with DART.'
+    )
 
-    start_sprint(
-        new_sprint_id,
-        new_sprint_name,
-        start_date,
-        end_date,
+    new_sprint_name = generate_sprint_name(start_date, end_date)
+    new_sprint = create_sprint(
+        new_sprint_name, start_date, end_date, session, config
+    )
+
+    if not new_sprint:
+        raise PhaseAborted('target', 'Failed to create new sprint.')
+
+    logging.info(
+        'New sprint successfully generated with sprint name: '
+        f'{new_sprint_name}'
+    )
+    return new_sprint.get('id'), new_sprint_name
+
+
+def collect_incomplete_issues(
+    sprint_id: int, session: requests.Session, config: BoardConfig
+) -> IssueTable:
+    """Stream the sprint's incomplete issues into a columnar IssueTable.
+
+    Raw pages and issue records are dropped as soon as they are logged, so
+    only the compact table stays in memory while the sprint is closed. Its
+    key batches are handed to the mover lazily once the close is done.
+    A listing that fails part-way aborts the phase, so the sprint is never
+    closed with issues left behind.
+    """
+    raw_issues = iter_incomplete_stories(
+        sprint_id,
+        config,
         session,
-        config.base_url,
+        server_side_filter=True,
+        max_workers=DEFAULT_PAGE_WORKERS,
+        backend=config.issue_backend,
     )
+
+    try:
+        issues = log_issue_stream(parse_issues(raw_issues, trusted=True))
+        table = IssueTable(issues)
+    except PaginationError as e:
+        raise PhaseAborted(
+            'incomplete', f'Could not list incomplete issues: {e}'
+        ) from e
+
+    log_incomplete_count(len(table), config)
+    return table
@@ -1,48 +1,190 @@
 import logging
-from typing import List
+from typing import Iterator, List
 
 import requests
 
 from src.customtypes.shared import INT_GT_0
+from src.exceptions.pagination_error import PaginationError
 from src.logs.error_handling import handle_api_error
-from src.models.board_config import BoardConfig
+from src.models.board_config import BoardConfig, IssueBackend
+from src.services.pagination import (
+    field_identity,
+    iter_pages,
+    iter_token_pages,
+    iter_unique,
+)
+from src.utils.jql_builder import build_status_exclusion_jql
 
 DONE_STATUSES = {'Done', 'Cancelled', 'Existing Solution', 'Abandoned'}
+ISSUE_FIELDS = 'summary,status,issuetype'
+MAX_RESULTS = 50
+CURSOR_MAX_RESULTS = 100
+SEARCH_JQL = '/rest/api/3/search/jql'
 
 
-def get_incomplete_stories(
-    sprint_id: INT_GT_0, config: BoardConfig, session: requests.Session
-) -> List[dict] | None:
-    incomplete_stories: List[dict] = []
-    start_at = 0
-    max_results = 50
+def build_sprint_issues_url(config: BoardConfig, sprint_id: INT_GT_0) -> str:
+    return f'{config.base_url}/rest/agile/1.0/sprint/{sprint_id}/issue'
 
-    while True:
-        url = f'{config.base_url}/rest/agile/1.0/sprint/{sprint_id}/issue'
-        params = {'startAt': start_at, 'maxResults': max_results}
-        response = session.get(url, params=params)
-        context = f'retrieving issues from sprint {sprint_id}'
 
-        if not handle_api_error(response, context):
-            return []
+def build_issue_page_params(
+    start_at: int, max_results: int, server_side_filter: bool
+) -> dict:
+    params = {'startAt': start_at, 'maxResults': max_results}
 
-        data = response.json()
-        issues = data.get('issues', [])
+    if server_side_filter:
+        params['jql'] = build_status_exclusion_jql(DONE_STATUSES)
+        params['fields'] = ISSUE_FIELDS
 
-        incomplete_stories.extend(
-            issue
-            for issue in issues
-            if issue['fields']['status']['name'] not in DONE_STATUSES
-        )
+    return params
+
+
+def build_sprint_search_jql(
+    sprint_id: INT_GT_0, server_side_filter: bool
+) -> str:
+    jql = f'sprint = {sprint_id}'
+
+    if server_side_filter:
+        jql += f' AND {build_status_exclusion_jql(DONE_STATUSES)}'
+
+    return jql
+
+
+def build_search_page_params(
+    sprint_id: INT_GT_0, server_side_filter: bool, token: str | None
+) -> dict:
+    # The enhanced search endpoint returns only issue ids unless fields
+    # are named, so the projection is always sent.
+    params = {
+        'jql': build_sprint_search_jql(sprint_id, server_side_filter),
+        'fields': ISSUE_FIELDS,
+        'maxResults': CURSOR_MAX_RESULTS,
+    }
+
+    if token:
+        params['nextPageToken'] = token
 
-        if len(issues) < max_results:
-            break
+    return params
 
-        start_at += max_results
 
-    num_inc_stories = len(incomplete_stories)
+def filter_incomplete(issues: List[dict]) -> List[dict]:
+    return [
+        issue
+        for issue in issues
+        if issue['fields']['status']['name'] not in DONE_STATUSES
+    ]
+
+
+def log_incomplete_count(count: int, config: BoardConfig) -> None:
     logging.info(
-        f'\n{num_inc_stories} incomplete stories found in '
+        f'\n{count} incomplete stories found in '
         f'previous sprint: {config.board_name}'
     )
+
+
+def iter_incomplete_stories(
+    sprint_id: INT_GT_0,
+    config: BoardConfig,
+    session: requests.Session,
+    server_side_filter: bool = False,
+    max_workers: int = 1,
+    backend: IssueBackend = 'offset',
+) -> Iterator[dict]:
+    """Stream incomplete issues as their pages arrive.
+
+    The ``offset`` backend walks the Agile sprint issue listing by startAt
+    and can fetch pages concurrently. The ``cursor`` backend walks Jira
+    Cloud's enhanced JQL search by nextPageToken, which stays consistent
+    while issues move between sprints. Both de-duplicate by issue key.
+
+    Raises PaginationError when a page request fails, so callers can tell
+    a failed listing apart from an empty one.
+    """
+    if backend == 'cursor':
+        pages = iter_sprint_search_pages(
+            sprint_id, config, session, server_side_filter
+        )
+    else:
+        pages = iter_sprint_issue_pages(
+            sprint_id, config, session, server_side_filter, max_workers
+        )
+
+    issues = (issue for page in pages for issue in filter_incomplete(page))
+    yield from iter_unique(issues, field_identity('key'))
+
+
+def iter_sprint_issue_pages(
+    sprint_id: INT_GT_0,
+    config: BoardConfig,
+    session: requests.Session,
+    server_side_filter: bool,
+    max_workers: int,
+) -> Iterator[List[dict]]:
+    url = build_sprint_issues_url(config, sprint_id)
+    context = f'retrieving issues from sprint {sprint_id}'
+
+    def fetch_page(start_at: int) -> dict:
+        params = build_issue_page_params(
+            start_at, MAX_RESULTS, server_side_filter
+        )
+        response = session.get(url, params=params, stream=True)
+
+        if not handle_api_error(response, context):
+            raise PaginationError(context, start_at)
+
+        return response.json()
+
+    return iter_pages(
+        fetch_page, MAX_RESULTS, 'issues', max_workers=max_workers
+    )
+
+
+def iter_sprint_search_pages(
+    sprint_id: INT_GT_0,
+    config: BoardConfig,
+    session: requests.Session,
+    server_side_filter: bool,
+) -> Iterator[List[dict]]:
+    url = f'{config.base_url}{SEARCH_JQL}'
+    context = f'searching issues in sprint {sprint_id}'
+    page_number = 0
+
+    def fetch_page(token: str | None) -> dict:
+        nonlocal page_number
+        params = build_search_page_params(
+            sprint_id, server_side_filter, token
+        )
+        response = session.get(url, params=params, stream=True)
+
+        if not handle_api_error(response, context):
+            raise PaginationError(context, page_number * CURSOR_MAX_RESULTS)
+
+        page_number += 1
+        return response.json()
+
+    return iter_token_pages(fetch_page, 'issues')
+
+
+def get_incomplete_stories(
+    sprint_id: INT_GT_0,
+    config: BoardConfig,
+    session: requests.Session,
+    server_side_filter: bool = False,
+    max_workers: int = 1,
+    backend: IssueBackend = 'offset',
+) -> List[dict] | None:
+    try:
+        incomplete_stories = list(
+            iter_incomplete_stories(
+                sprint_id,
+                config,
+                session,
+                server_side_filter,
+                max_workers,
+                backend,
+            )
+        )
+    except PaginationError:
+        return []
+
+    log_incomplete_count(len(incomplete_stories), config)
     return incomplete_stories
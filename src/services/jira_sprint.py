@@ -1,18 +1,30 @@
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from itertools import chain
+from typing import Iterator
 
 import requests
 
+from src.auth.session import TimeoutSession
 from src.logs.error_handling import handle_api_error
 from src.models.board_config import BoardConfig
+from src.models.board_sprint_snapshot import BoardSprintSnapshot
 from src.models.sprint_create_response import SprintCreateResponse
 from src.models.sprint_payload import SprintPayload
 from src.models.sprint_summary import SprintSummary
-from src.utils.config_loader import load_config
+from src.services.pagination import (
+    field_identity,
+    flagged_page_is_last,
+    iter_pages,
+    iter_unique,
+)
 from src.utils.datetime_format import format_jira_date
-from src.utils.url_builder import build_sprint_state_query_url
+from src.utils.sprint_parser import parse_dart_sprint
+from src.utils.url_builder import build_board_sprint_url
 
 SPRINT_CREATE = '/rest/agile/1.0/sprint'
+MAX_RESULTS = 50
+REVALIDATE_HEADERS = {'Cache-Control': 'no-cache'}
 
 
 def build_sprint_payload(
@@ -30,11 +42,11 @@ def build_sprint_payload(
 
 
 def post_sprint_payload(
-    session: requests.Session,
+    session: TimeoutSession,
     url: str,
     payload: SprintPayload
 ) -> requests.Response:
-    return session.post(url, json=payload.model_dump())
+    return session.post(url, json=payload)
 
 
 def parse_json_response(
@@ -54,9 +66,9 @@ def create_sprint(
     sprint_name: str,
     start_date: datetime,
     end_date: datetime,
-    session: requests.Session,
+    session: TimeoutSession,
+    config: BoardConfig,
 ) -> SprintCreateResponse | None:
-    config = load_config()
     payload = build_sprint_payload(
         sprint_name,
         start_date,
@@ -74,55 +86,77 @@ def create_sprint(
     return parse_json_response(response)
 
 
-def get_sprint_by_state(
+def iter_board_sprints(
     session: requests.Session,
     config: BoardConfig,
-    state: str
-) -> SprintSummary | None:
-    url = build_sprint_state_query_url(
-        config.base_url,
-        config.board_id,
-        state
-    )
-    response = session.get(url)
-    context = f'retrieving {state} sprint'
-
-    if not handle_api_error(response, context):
-        return None
-
-    sprints = response.json().get('values', [])
-    return sprints[0] if sprints else None
-
-
-def get_all_future_sprints(
-    session: requests.Session,
-    config: BoardConfig
-) -> list[SprintSummary]:
-    board_id = config.board_id
-    start_at = 0
-    max_results = 50
-    all_sprints = []
-    url = f'{config.base_url}/rest/agile/1.0/board/{board_id}/sprint'
-
-    while True:
+    states: str,
+    max_workers: int = 1,
+    revalidate: bool = False,
+) -> Iterator[SprintSummary]:
+    """Yield the board's sprints in ``states`` lazily, one page at a time.
+
+    ``states`` is a comma-separated list such as ``'active,future'``. Pages
+    are only requested as the consumer advances, so a caller that stops at
+    the sprint it needs never pays for the rest of the backlog. With
+    ``revalidate``, an HTTP cache must check every page with the server.
+    """
+    url = build_board_sprint_url(config.base_url, config.board_id)
+    headers = REVALIDATE_HEADERS if revalidate else None
+
+    def fetch_page(start_at: int) -> dict:
         params = {
-            'state': 'future',
+            'state': states,
             'startAt': start_at,
-            'maxResults': max_results,
+            'maxResults': MAX_RESULTS,
         }
-        response = session.get(url, params=params)
+        response = session.get(
+            url, params=params, headers=headers, stream=True
+        )
         if response.status_code != 200:
             raise RuntimeError(
-                f'Error while fetching future sprints: {response.text}'
+                f'Error while fetching {states} sprints: {response.text}'
             )
 
-        data = response.json()
-        sprints = data.get('values', [])
-        all_sprints.extend(sprints)
+        return response.json()
+
+    pages = iter_pages(
+        fetch_page,
+        MAX_RESULTS,
+        'values',
+        is_last=flagged_page_is_last,
+        max_workers=max_workers,
+    )
+    yield from iter_unique(chain.from_iterable(pages), field_identity('id'))
 
-        if data.get('isLast', True):
-            break
 
-        start_at += max_results
+def get_board_sprint_snapshot(
+    session: requests.Session,
+    config: BoardConfig,
+    start_day: date | None = None,
+    revalidate: bool = True,
+) -> BoardSprintSnapshot:
+    """Index the board's active and future sprints from a single listing.
+
+    Future sprints are keyed by their parsed DART start date; sprints whose
+    names do not parse are skipped. With ``start_day`` set, paging stops as
+    soon as the active sprint and the DART sprint starting that day are
+    both known. The rollover decides from this listing, so by default it
+    is never served from a cache without revalidation; prepare, whose plan
+    commit checks again, passes ``revalidate=False``.
+    """
+    active = None
+    future_by_start: dict[date, SprintSummary] = {}
+
+    sprints = iter_board_sprints(
+        session, config, 'active,future', revalidate=revalidate
+    )
+    for sprint in sprints:
+        if sprint.get('state') == 'active':
+            active = active or sprint
+        elif parsed := parse_dart_sprint(sprint['name']):
+            future_by_start.setdefault(parsed.start, sprint)
+
+        if active and start_day in future_by_start:
+            break
 
-    return all_sprints
+    return BoardSprintSnapshot(active, future_by_start)
@@ -1,8 +1,8 @@
 import logging
 
-import requests
 from pydantic import HttpUrl
 
+from src.auth.session import TimeoutSession
 from src.customtypes.shared import SAFE_STR, INT_GT_0
 from src.logs.error_handling import handle_api_error
 from src.utils.payload_builder import build_close_sprint_payload
@@ -13,9 +13,9 @@ def close_sprint(
     sprint_name: SAFE_STR,
     start_date: SAFE_STR,
     end_date: SAFE_STR,
-    session: requests.Session,
+    session: TimeoutSession,
     base_url: HttpUrl,
-) -> None:
+) -> bool:
     url = f'{base_url}/rest/agile/1.0/sprint/{sprint_id}'
     payload = build_close_sprint_payload(
         sprint_name,
@@ -23,10 +23,11 @@ def close_sprint(
         end_date
     )
 
-    response = session.put(url, json=payload.model_dump())
+    response = session.put(url, json=payload)
     context = f'closing sprint {sprint_id}'
 
     if not handle_api_error(response, context):
-        return
+        return False
 
     logging.info(f'Sprint {sprint_id} has been closed.')
+    return True
@@ -0,0 +1,129 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import count
+from typing import Any, Callable, Final, Hashable, Iterable, Iterator, List
+
+DEFAULT_PAGE_WORKERS: Final[int] = 4
+
+PageFetcher = Callable[[int], dict]
+TokenPageFetcher = Callable[[str | None], dict]
+PageCheck = Callable[[dict, List[Any], int], bool]
+Identity = Callable[[Any], Hashable | None]
+
+
+def short_page_is_last(page: dict, items: List[Any], page_size: int) -> bool:
+    return page.get('isLast', False) or len(items) < page_size
+
+
+def flagged_page_is_last(page: dict, _items: List[Any], _size: int) -> bool:
+    return page.get('isLast', True)
+
+
+def field_identity(field: str) -> Identity:
+    def identity(item: Any) -> Hashable | None:
+        return item.get(field) if isinstance(item, dict) else None
+
+    return identity
+
+
+def iter_unique(
+    items: Iterable[Any], identity: Identity | None
+) -> Iterator[Any]:
+    if identity is None:
+        yield from items
+        return
+
+    seen: set[Hashable] = set()
+    for item in items:
+        marker = identity(item)
+        if marker is not None:
+            if marker in seen:
+                continue
+            seen.add(marker)
+        yield item
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    page_size: int,
+    items_key: str,
+    is_last: PageCheck = short_page_is_last,
+    max_workers: int = 1,
+) -> Iterator[List[Any]]:
+    """Yield the items of a startAt-paginated Jira listing page by page.
+
+    Page one is fetched alone and its ``maxResults`` becomes the stride, as
+    Jira may cap the requested page size. Later pages are fetched on up to
+    ``max_workers`` threads but yielded in offset order, with no more than
+    ``max_workers`` pages buffered. When page one reports ``total`` every
+    remaining offset is requested; listings without a total (board
+    sprints) are read ahead until a page reports that it is the last one.
+    """
+    if max_workers <= 0:
+        raise ValueError('max_workers must be > 0.')
+
+    first = fetch_page(0)
+    first_items = first.get(items_key, [])
+    stride = first.get('maxResults') or page_size
+    yield first_items
+
+    if is_last(first, first_items, stride):
+        return
+
+    total = first.get('total')
+    has_total = isinstance(total, int)
+    offsets = iter(
+        range(stride, total, stride) if has_total else count(stride, stride)
+    )
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[Future] = deque()
+
+    # Each page runs in a copy of the caller's context so its HTTP span
+    # still nests under the phase that asked for it.
+    def submit(offset: int) -> Future:
+        return pool.submit(copy_context().run, fetch_page, offset)
+
+    try:
+        for offset in offsets:
+            pending.append(submit(offset))
+            if len(pending) == max_workers:
+                break
+
+        while pending:
+            page = pending.popleft().result()
+            items = page.get(items_key, [])
+            yield items
+
+            if not has_total and is_last(page, items, stride):
+                return
+
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(submit(offset))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_token_pages(
+    fetch_page: TokenPageFetcher, items_key: str
+) -> Iterator[List[Any]]:
+    """Yield the items of a nextPageToken-paginated listing page by page.
+
+    Each request resumes from the token the previous page returned, so the
+    server never rescans skipped rows and a listing that changes between
+    requests cannot shift later pages. A repeated token ends the walk.
+    """
+    token = None
+    seen_tokens: set[str] = set()
+
+    while True:
+        page = fetch_page(token)
+        yield page.get(items_key, [])
+
+        token = page.get('nextPageToken')
+        if page.get('isLast') or not token or token in seen_tokens:
+            return
+
+        seen_tokens.add(token)
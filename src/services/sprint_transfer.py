@@ -1,12 +1,21 @@
 import logging
-import time
+from itertools import batched
+from typing import Final, Iterable, Iterator
 
 import requests
-from pydantic import HttpUrl
+from pydantic import HttpUrl, TypeAdapter
 
 from src.customtypes.shared import INT_GT_0
 from src.logs.error_handling import handle_api_error
-from src.models.jira_issue import JiraIssue
+from src.logs.metrics import ISSUES_MOVED
+from src.models.jira_issue import Issue, JiraIssue, JiraIssueRecord
+from src.transport.pacing import RateLimitPacer
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 3
+PARSE_CHUNK_SIZE = 100
+
+ISSUE_LIST_ADAPTER: Final = TypeAdapter(list[JiraIssue])
 
 
 def transfer_issue_batch_with_retry(
@@ -14,96 +23,171 @@ def transfer_issue_batch_with_retry(
     base_url: HttpUrl,
     sprint_id: INT_GT_0,
     issue_keys: list[str],
+    pacer: RateLimitPacer | None = None,
 ) -> bool:
     url = f'{base_url}/rest/agile/1.0/sprint/{sprint_id}/issue'
     payload = {'issues': issue_keys}
+    pacer = pacer or RateLimitPacer()
 
-    for attempt in range(1, 4):
-        logging.info(
-            f'\nMoving batch of {len(issue_keys)} issues to new sprint.'
-            f' (Attempt {attempt} of 3).'
-        )
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        log_transfer_attempt(issue_keys, attempt)
 
+        pacer.wait()
         response = session.post(url, json=payload)
+        pacer.observe(response)
         context = f'moving issues batch'
 
         if handle_api_error(response, context):
             logging.info('Transfer process successful.')
-            time.sleep(5)
             return True
 
-        if attempt < 3:
-            logging.info('\nTransfer failed. Retrying...')
-        else:
-            logging.error('Transfer failed. Max attempts exceeded.')
+        log_transfer_failure(attempt)
 
     return False
 
 
-def transfer_all_issue_batches(
-    issue_keys: list[str],
+def log_transfer_attempt(issue_keys: list[str], attempt: int) -> None:
+    logging.info(
+        f'\nMoving batch of {len(issue_keys)} issues to new sprint.'
+        f' (Attempt {attempt} of {MAX_ATTEMPTS}).'
+    )
+
+
+def log_transfer_failure(attempt: int) -> None:
+    if attempt < MAX_ATTEMPTS:
+        logging.info('\nTransfer failed. Retrying...')
+    else:
+        logging.error('Transfer failed. Max attempts exceeded.')
+
+
+def transfer_key_batches(
+    batches: Iterable[list[str]],
     session: requests.Session,
     base_url: HttpUrl,
     new_sprint_id: INT_GT_0,
-) -> None:
-    start_index = 0
-    stop_index = len(issue_keys)
-    batch_size = 50
+) -> int:
+    """Move each batch as soon as it is available; return the issue count."""
+    moved = 0
+    pacer = RateLimitPacer()
 
-    for i in range(start_index, stop_index, batch_size):
-        batch = issue_keys[i : i + batch_size]
+    for batch in batches:
         success = transfer_issue_batch_with_retry(
-            session, base_url, new_sprint_id, batch
+            session, base_url, new_sprint_id, batch, pacer
         )
 
         if not success:
-            message = (
-                'Transfer process aborted. '
-                f'\nFailed to move issues from index {i}'
-                f' to {(i, i + len(batch) - 1)}.'
-            )
+            raise SystemExit(build_abort_message(moved, batch))
+
+        moved += len(batch)
+        ISSUES_MOVED.inc(len(batch))
+
+    return moved
 
-            raise SystemExit(message)
 
+def transfer_all_issue_batches(
+    issue_keys: list[str],
+    session: requests.Session,
+    base_url: HttpUrl,
+    new_sprint_id: INT_GT_0,
+) -> None:
+    transfer_key_batches(
+        batch_keys(issue_keys), session, base_url, new_sprint_id
+    )
     logging.info('Migration of unfinished stories complete.')
 
 
-def move_issues_to_new_sprint(
-    issues: list[JiraIssue],
+def build_abort_message(index: int, batch: list[str]) -> str:
+    return (
+        'Transfer process aborted. '
+        f'\nFailed to move issues from index {index}'
+        f' to {(index, index + len(batch) - 1)}.'
+    )
+
+
+def move_key_batches(
+    batches: Iterable[list[str]],
     session: requests.Session,
     base_url: HttpUrl,
     new_sprint_id: INT_GT_0,
 ) -> None:
-    if not issues:
+    moved = transfer_key_batches(batches, session, base_url, new_sprint_id)
+
+    if not moved:
         logging.info('No incomplete stories to transfer.')
-        return
+    else:
+        logging.info('Migration of unfinished stories complete.')
+
+
+def batch_keys(
+    issue_keys: Iterable[str], batch_size: int = BATCH_SIZE
+) -> Iterator[list[str]]:
+    for batch in batched(issue_keys, batch_size):
+        yield list(batch)
 
+
+def log_issue_stream(issues: Iterable[Issue]) -> Iterator[Issue]:
     logging.info(
-        f'\n::group::'
-        f'Moving {len(issues)} stories to the new sprint. '
-        f'Click the dropdown arrow for more information.'
+        '\n::group::'
+        'Moving stories to the new sprint. '
+        'Click the dropdown arrow for more information.'
     )
 
-    for issue in issues:
-        logging.info(
-            f'\nIssue ID: {issue.key}'
-            f'\nType: {issue.type}'
-            f'\nStatus: {issue.status}'
-            f'\nDescription: {issue.summary}'
-        )
+    count = 0
+    try:
+        for issue in issues:
+            log_issue(issue)
+            count += 1
+            yield issue
+    finally:
+        # Close the group even if the source or the consumer fails midway.
+        logging.info('::endgroup::')
 
-    logging.info('::endgroup::')
+    logging.info(f'{count} stories queued for the new sprint.')
 
-    issue_keys = [issue.key for issue in issues]
-    transfer_all_issue_batches(issue_keys, session, base_url, new_sprint_id)
 
+def log_issue(issue: Issue) -> None:
+    logging.info(
+        f'\nIssue ID: {issue.key}'
+        f'\nType: {issue.type}'
+        f'\nStatus: {issue.status}'
+        f'\nDescription: {issue.summary}'
+    )
 
-def parse_issue(raw: dict) -> JiraIssue:
-    fields = raw['fields']
 
-    return JiraIssue(
-        key=raw['key'],
-        type=fields['issuetype']['name'],
-        status=fields['status']['name'],
-        summary=fields['summary'],
-    )
+def parse_issues(
+    raw_issues: Iterable[dict], trusted: bool = False
+) -> Iterator[Issue]:
+    """Decode raw issues lazily, PARSE_CHUNK_SIZE at a time.
+
+    Each chunk is validated by one TypeAdapter call instead of one model
+    per issue. ``trusted`` skips validation and unpacks each issue into a
+    JiraIssueRecord; use it only for responses straight from Jira.
+    """
+    decode = decode_trusted_issues if trusted else parse_issue_chunk
+    for chunk in batched(raw_issues, PARSE_CHUNK_SIZE):
+        yield from decode(chunk)
+
+
+def parse_issue_chunk(raw_issues: Iterable[dict]) -> list[JiraIssue]:
+    return ISSUE_LIST_ADAPTER.validate_python(raw_issues)
+
+
+def decode_trusted_issues(
+    raw_issues: Iterable[dict]
+) -> list[JiraIssueRecord]:
+    records = []
+    for raw in raw_issues:
+        fields = raw['fields']
+        records.append(
+            JiraIssueRecord(
+                raw['key'],
+                fields['issuetype']['name'],
+                fields['status']['name'],
+                fields['summary'],
+            )
+        )
+    return records
+
+
+def parse_issue(raw: dict) -> JiraIssue:
+    return JiraIssue.model_validate(raw)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Final
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.transport.http_cache import CacheEntry, HttpCache, cache_directives
+from src.transport.json_codec import JsonCodec, JsonResponse, default_codec
+
+DEFAULT_POOL_CONNECTIONS: Final[int] = 10
+DEFAULT_POOL_MAXSIZE: Final[int] = 10
+SAFE_METHODS: Final[frozenset[str]] = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    requests: int = 0
+    opened: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.opened, 0)
+
+
+def _validate_pool_sizes(pool_connections: int, pool_maxsize: int) -> None:
+    if pool_connections <= 0 or pool_maxsize <= 0:
+        raise ValueError('Connection pool sizes must be > 0.')
+
+
+class JiraHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with tunable pooling that counts opened vs reused sockets.
+
+    urllib3 pools only expose a running total of connections they created,
+    so each send compares that total with the last value seen for the pool.
+    A request that did not bump the total was served on a kept-alive socket.
+
+    Responses are built as JsonResponse, decoding with ``codec``. With a
+    ``cache``, GETs to its endpoints are answered from disk while fresh,
+    revalidated with If-None-Match/If-Modified-Since when they carry
+    validators, and any successful write clears that origin's entries. A
+    request sent with ``Cache-Control: no-cache`` is never answered from
+    disk without asking the server.
+    """
+    def __init__(
+            self,
+            pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            pool_block: bool = False,
+            codec: JsonCodec | None = None,
+            cache: HttpCache | None = None,
+            **kwargs
+    ) -> None:
+        _validate_pool_sizes(pool_connections, pool_maxsize)
+        self.codec = codec or default_codec()
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._seen: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._requests = 0
+        self._opened = 0
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs
+        )
+
+    @property
+    def stats(self) -> ConnectionStats:
+        with self._lock:
+            return ConnectionStats(self._requests, self._opened)
+
+    def send(
+            self,
+            request: requests.PreparedRequest,
+            stream: bool = False,
+            timeout=None,
+            verify=True,
+            cert=None,
+            proxies=None
+    ) -> requests.Response:
+        kwargs = dict(
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+        if self.cache is None:
+            return self._send(request, **kwargs)
+
+        if (
+            request.method == 'GET'
+            and self.cache.ttl_for(request.url or '') is not None
+        ):
+            return self._send_cached(request, self.cache, **kwargs)
+
+        response = self._send(request, **kwargs)
+        if request.method not in SAFE_METHODS and response.ok:
+            self.cache.invalidate(request.url or '')
+        return response
+
+    def _send_cached(
+            self,
+            request: requests.PreparedRequest,
+            cache: HttpCache,
+            **kwargs
+    ) -> requests.Response:
+        key = cache.key(request)
+        cached = cache.get(key)
+        requested = cache_directives(request.headers.get('Cache-Control'))
+        if cached is not None:
+            entry, body = cached
+            if entry.has_validators:
+                request.headers.update(entry.conditional_headers())
+            elif 'no-cache' not in requested and entry.is_fresh(time.time()):
+                return self._cached_response(request, entry, body, 'hit')
+
+        response = self._send(request, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            entry = cache.refresh(key, entry, response)
+            return self._cached_response(
+                request, entry, body, 'revalidated'
+            )
+
+        if response.status_code == 200:
+            # Storing reads the whole body, even for stream=True.
+            cache.put(key, request.url or '', response)
+            response.cache_status = 'miss'
+        return response
+
+    def _cached_response(
+            self,
+            request: requests.PreparedRequest,
+            entry: CacheEntry,
+            body: bytes,
+            cache_status: str
+    ) -> JsonResponse:
+        response = JsonResponse()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(
+            {
+                'Content-Type': entry.content_type or 'application/json',
+                'Content-Length': str(len(body)),
+            }
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url or entry.url
+        response.request = request
+        response.connection = self
+        response.codec = self.codec
+        response.cache_status = cache_status
+        return response
+
+    def _send(
+            self,
+            request: requests.PreparedRequest,
+            **kwargs
+    ) -> requests.Response:
+        response = super().send(request, **kwargs)
+        pool = self.get_connection_with_tls_context(
+            request,
+            kwargs['verify'],
+            proxies=kwargs['proxies'],
+            cert=kwargs['cert'],
+        )
+        self._record(pool)
+        return response
+
+    def build_response(self, req, resp) -> JsonResponse:
+        response = super().build_response(req, resp)
+        return JsonResponse.from_response(response, self.codec)
+
+    def _record(self, pool) -> None:
+        total = pool.num_connections
+        with self._lock:
+            self._requests += 1
+            self._opened += total - self._seen.get(pool, 0)
+            self._seen[pool] = total
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Final
+
+import requests
+from urllib3 import HTTPResponse
+from urllib3.util.request import ACCEPT_ENCODING as DECODABLE_CODINGS
+
+# Most compact first. urllib3 only lists br and zstd when their decoders
+# (brotli/brotlicffi, zstandard) are importable, so the header never asks
+# for a coding this process cannot decode.
+PREFERRED_CODINGS: Final[tuple[str, ...]] = ('br', 'zstd', 'gzip', 'deflate')
+ACCEPT_ENCODING: Final[str] = ', '.join(
+    coding
+    for coding in PREFERRED_CODINGS
+    if coding in DECODABLE_CODINGS.split(',')
+)
+STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def wire_bytes(response: requests.Response) -> int | None:
+    """Body bytes read off the socket so far, before any decompression."""
+    if isinstance(response.raw, HTTPResponse):
+        return response.raw.tell()
+    return None
+
+
+def body_size_attributes(
+        response: requests.Response, decoded_bytes: int
+) -> dict[str, int | str]:
+    attributes: dict[str, int | str] = {
+        'http.response.bytes': decoded_bytes,
+    }
+    wire = wire_bytes(response)
+    if wire is not None:
+        attributes['http.response.wire_bytes'] = wire
+    if coding := response.headers.get('Content-Encoding'):
+        attributes['http.response.content_encoding'] = coding
+    return attributes
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Final, Mapping
+from urllib.parse import urlsplit
+
+import requests
+
+from src.utils.url_builder import endpoint_template
+
+DEFAULT_CACHE_DIR: Final[Path] = Path('.http_cache')
+DEFAULT_MAX_BYTES: Final[int] = 64 * 2 ** 20
+# Endpoints that may be cached, with how long a response that carries no
+# ETag, Last-Modified or Cache-Control max-age stays fresh. Responses with
+# validators are always revalidated with a conditional GET instead, as is
+# every request sent with Cache-Control: no-cache, so only reads that do
+# not decide the rollover (prepare's sprint listing) can be served fresh.
+DEFAULT_TTLS: Final[dict[str, float]] = {
+    '/rest/agile/1.0/board/{id}/sprint': 60.0,
+}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    url: str
+    origin: str
+    stored_at: float
+    etag: str | None
+    last_modified: str | None
+    content_type: str | None
+    ttl: float
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """On-disk cache of GET bodies and their validators, bounded by size.
+
+    Each entry is a ``.body`` file and a ``.json`` metadata file named by a
+    hash of the URL and credentials. A hit touches the body file, so
+    eviction drops the least recently used entries once the bodies exceed
+    ``max_bytes``.
+    """
+    def __init__(
+            self,
+            directory: Path = DEFAULT_CACHE_DIR,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+            ttls: Mapping[str, float] = DEFAULT_TTLS
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError('Cache size must be > 0 bytes.')
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls)
+        self._lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def ttl_for(self, url: str) -> float | None:
+        """Freshness for the URL's endpoint, or None if it is not cached."""
+        return self.ttls.get(endpoint_template(url))
+
+    def key(self, request: requests.PreparedRequest) -> str:
+        # Credentials are part of the key: boards can differ per user.
+        identity = request.headers.get('Authorization', '')
+        material = f'{request.method} {request.url} {identity}'
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> tuple[CacheEntry, bytes] | None:
+        body_path, meta_path = self._paths(key)
+        try:
+            entry = CacheEntry(**json.loads(meta_path.read_bytes()))
+            body = body_path.read_bytes()
+            os.utime(body_path)
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry, body
+
+    def put(self, key: str, url: str, response: requests.Response) -> None:
+        """Store a 200 response unless its Cache-Control says no-store.
+
+        Reads ``response.content``, so a response that is cached has been
+        read in full by the time it is returned, even with ``stream=True``.
+        """
+        directives = cache_directives(response.headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            with self._lock:
+                self._remove(key)
+            return
+
+        entry = CacheEntry(
+            url=url,
+            origin=_origin(url),
+            stored_at=time.time(),
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            content_type=response.headers.get('Content-Type'),
+            ttl=self._freshness(url, directives),
+        )
+        body_path, meta_path = self._paths(key)
+        with self._lock:
+            _write_atomic(body_path, response.content)
+            _write_atomic(meta_path, json.dumps(asdict(entry)).encode())
+            self._evict()
+
+    def refresh(
+            self, key: str, entry: CacheEntry, response: requests.Response
+    ) -> CacheEntry:
+        """Restamp an entry after a 304, keeping any validators it sent."""
+        cache_control = response.headers.get('Cache-Control')
+        refreshed = replace(
+            entry,
+            stored_at=time.time(),
+            etag=response.headers.get('ETag', entry.etag),
+            last_modified=response.headers.get(
+                'Last-Modified', entry.last_modified
+            ),
+            ttl=(
+                self._freshness(entry.url, cache_directives(cache_control))
+                if cache_control is not None
+                else entry.ttl
+            ),
+        )
+        _, meta_path = self._paths(key)
+        with self._lock:
+            _write_atomic(meta_path, json.dumps(asdict(refreshed)).encode())
+        return refreshed
+
+    def invalidate(self, url: str) -> None:
+        """Drop every entry from the URL's origin, e.g. after a write."""
+        origin = _origin(url)
+        with self._lock:
+            for meta_path in self.directory.glob('*.json'):
+                try:
+                    entry_origin = json.loads(meta_path.read_bytes())['origin']
+                except (OSError, ValueError, KeyError):
+                    entry_origin = origin
+                if entry_origin == origin:
+                    self._remove(meta_path.stem)
+
+    def clear(self) -> None:
+        with self._lock:
+            for meta_path in self.directory.glob('*.json'):
+                self._remove(meta_path.stem)
+
+    @property
+    def size(self) -> int:
+        return sum(
+            path.stat().st_size for path in self.directory.glob('*.body')
+        )
+
+    def _freshness(self, url: str, directives: dict[str, str]) -> float:
+        if 'no-cache' in directives:
+            return 0.0
+        try:
+            return max(float(int(directives['max-age'])), 0.0)
+        except (KeyError, ValueError):
+            return self.ttl_for(url) or 0.0
+
+    def _evict(self) -> None:
+        bodies = []
+        for path in self.directory.glob('*.body'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            bodies.append((stat.st_mtime_ns, stat.st_size, path.stem))
+
+        total = sum(size for _, size, _ in bodies)
+        for _, size, key in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return (
+            self.directory / f'{key}.body',
+            self.directory / f'{key}.json',
+        )
+
+
+def cache_directives(cache_control: str | None) -> dict[str, str]:
+    """Parse a Cache-Control header into lower-cased directives."""
+    directives = {}
+    for part in (cache_control or '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    return directives
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temp_path = path.with_name(
+        f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp'
+    )
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
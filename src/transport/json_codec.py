@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Final
+
+import requests
+from pydantic import BaseModel
+from urllib3 import HTTPResponse
+
+from src.logs.tracing import get_tracer
+from src.transport.compression import STREAM_CHUNK_SIZE, body_size_attributes
+from src.utils.url_builder import endpoint_template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+UTF8_ENCODINGS: Final[frozenset[str]] = frozenset({'utf-8', 'utf8'})
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Encodes request bodies to bytes and decodes response bodies from
+    bytes. Decode errors surface as ``json.JSONDecodeError`` subclasses."""
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+    def encode(self, payload: Any) -> bytes:
+        # Models serialise straight to JSON, skipping the model_dump dict.
+        if isinstance(payload, BaseModel):
+            return payload.model_dump_json().encode('utf-8')
+        return self.dumps(payload)
+
+
+def _stdlib_dumps(payload: Any) -> bytes:
+    text = json.dumps(payload, separators=(',', ':'), allow_nan=False)
+    return text.encode('utf-8')
+
+
+STDLIB_CODEC: Final[JsonCodec] = JsonCodec('json', json.loads, _stdlib_dumps)
+ORJSON_CODEC: Final[JsonCodec | None] = (
+    JsonCodec('orjson', orjson.loads, orjson.dumps) if orjson else None
+)
+
+
+def default_codec() -> JsonCodec:
+    """orjson when it is installed, else the standard library."""
+    return ORJSON_CODEC or STDLIB_CODEC
+
+
+class JsonResponse(requests.Response):
+    """Response whose json() decodes ``content`` with the session's codec.
+
+    requests decodes the body to text before parsing it; both json.loads
+    and orjson.loads take the UTF-8 bytes directly. A body requested with
+    ``stream=True`` is decompressed chunk by chunk into one buffer that is
+    parsed and dropped, under a 'json.decode' span reporting its wire and
+    decoded sizes.
+    """
+    codec: JsonCodec = STDLIB_CODEC
+    # 'hit', 'revalidated' or 'miss' when the adapter's HttpCache handled
+    # the request.
+    cache_status: str | None = None
+
+    @classmethod
+    def from_response(
+            cls, response: requests.Response, codec: JsonCodec
+    ) -> JsonResponse:
+        adopted = cls.__new__(cls)
+        adopted.__dict__.update(response.__dict__)
+        adopted.codec = codec
+        return adopted
+
+    def json(self, **kwargs) -> Any:
+        encoding = (self.encoding or 'utf-8').lower()
+        if kwargs or encoding not in UTF8_ENCODINGS:
+            return super().json(**kwargs)
+
+        if not self._content_consumed and isinstance(self.raw, HTTPResponse):
+            return self._decode_stream()
+
+        try:
+            return self.codec.loads(self.content)
+        except json.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+    def _decode_stream(self) -> Any:
+        route = endpoint_template(self.url or '')
+        with get_tracer().span('json.decode', **{'http.route': route}) as span:
+            buffer = bytearray()
+            try:
+                # iter_content maps urllib3 read and decode failures to
+                # requests exceptions; the wire size still comes from
+                # raw.tell().
+                for chunk in self.iter_content(STREAM_CHUNK_SIZE):
+                    buffer += chunk
+            finally:
+                # Returns the connection to the pool once fully read.
+                self.close()
+
+            span.set(**body_size_attributes(self, len(buffer)))
+            try:
+                return self.codec.loads(buffer)
+            except json.JSONDecodeError as e:
+                # Keep the body readable for error logging.
+                self._content = bytes(buffer)
+                raise requests.exceptions.JSONDecodeError(
+                    e.msg, e.doc, e.pos
+                )
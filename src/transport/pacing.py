@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Final
+
+import requests
+
+DEFAULT_BACKOFF: Final[float] = 5.0
+MAX_BACKOFF: Final[float] = 60.0
+NEAR_LIMIT_DELAY: Final[float] = 1.0
+THROTTLE_CODES: Final[frozenset[int]] = frozenset({429, 503})
+
+
+def parse_retry_after(value: object) -> float | None:
+    """Return the delay in seconds for a delta-seconds or HTTP-date value."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(seconds, 0.0) if math.isfinite(seconds) else None
+
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return _seconds_until(moment)
+
+
+def parse_rate_limit_reset(value: object) -> float | None:
+    """Return the delay until an ISO 8601 X-RateLimit-Reset timestamp."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+    return _seconds_until(moment)
+
+
+def _seconds_until(moment: datetime) -> float:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    delta = moment - datetime.now(timezone.utc)
+    return max(delta.total_seconds(), 0.0)
+
+
+class RateLimitPacer:
+    """Paces calls from Jira Cloud's rate-limit signals, not a fixed sleep.
+
+    Calls run back to back until a response pushes back: a 429/503, an
+    exhausted ``X-RateLimit-Remaining`` or an ``X-RateLimit-NearLimit`` hint.
+    Throttle responses without ``Retry-After`` back off exponentially.
+    """
+    def __init__(
+            self,
+            default_backoff: float = DEFAULT_BACKOFF,
+            max_backoff: float = MAX_BACKOFF,
+            near_limit_delay: float = NEAR_LIMIT_DELAY,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        self._default_backoff = default_backoff
+        self._max_backoff = max_backoff
+        self._near_limit_delay = near_limit_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._resume_at = 0.0
+        self._throttled = 0
+
+    def observe(self, response: requests.Response) -> None:
+        delay = self._delay_for(response)
+        if delay > 0:
+            self._resume_at = max(self._resume_at, self._clock() + delay)
+
+    def pending_delay(self) -> float:
+        return max(self._resume_at - self._clock(), 0.0)
+
+    def wait(self) -> float:
+        delay = self.pending_delay()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def _delay_for(self, response: requests.Response) -> float:
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+
+        if response.status_code in THROTTLE_CODES:
+            self._throttled += 1
+            if retry_after is not None:
+                return min(retry_after, self._max_backoff)
+            backoff = self._default_backoff * 2 ** (self._throttled - 1)
+            return min(backoff, self._max_backoff)
+
+        self._throttled = 0
+
+        if headers.get('X-RateLimit-Remaining') == '0':
+            reset = parse_rate_limit_reset(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                return min(reset, self._max_backoff)
+            return min(
+                retry_after or self._default_backoff, self._max_backoff
+            )
+
+        if headers.get('X-RateLimit-NearLimit') == 'true':
+            return self._near_limit_delay
+
+        return 0.0
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+import requests
+
+from src.transport.adapter import JiraHTTPAdapter
+from src.utils.url_builder import endpoint_template
+
+CallKey = tuple[str, str]
+
+
+class RecordingAdapter(JiraHTTPAdapter):
+    """JiraHTTPAdapter that counts calls per method and endpoint template.
+
+    Counts are taken per send, so transport retries inside urllib3 do not
+    add to them; those are drawn from the session's retry budget instead.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._calls: Counter[CallKey] = Counter()
+        self._calls_lock = threading.Lock()
+
+    @property
+    def calls(self) -> Counter[CallKey]:
+        with self._calls_lock:
+            return self._calls.copy()
+
+    @property
+    def total(self) -> int:
+        with self._calls_lock:
+            return self._calls.total()
+
+    def reset(self) -> None:
+        with self._calls_lock:
+            self._calls.clear()
+
+    def send(
+            self,
+            request: requests.PreparedRequest,
+            *args,
+            **kwargs
+    ) -> requests.Response:
+        key = (request.method or 'GET', endpoint_template(request.url or ''))
+        with self._calls_lock:
+            self._calls[key] += 1
+        return super().send(request, *args, **kwargs)
+
+
+def format_calls(calls: Counter[CallKey]) -> str:
+    return '\n'.join(
+        f'{count:>6}  {method} {endpoint}'
+        for (method, endpoint), count in calls.most_common()
+    )
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Final, Iterator
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from src.logs.metrics import RETRIES
+from src.utils.url_builder import endpoint_template
+
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset(
+    {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+)
+DEFAULT_RETRY_BUDGET: Final[int] = 50
+
+_scoped_budget: ContextVar[RetryBudget | None] = ContextVar(
+    'retry_budget', default=None
+)
+
+
+def is_retryable_status(status_code: int) -> bool:
+    return status_code in RETRYABLE_STATUSES
+
+
+class RetryBudget:
+    """Thread-safe cap on the number of retries a whole run may spend."""
+    def __init__(self, capacity: int = DEFAULT_RETRY_BUDGET) -> None:
+        if capacity < 0:
+            raise ValueError('Retry budget must be >= 0.')
+        self._capacity = capacity
+        self._spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def spent(self) -> int:
+        return self._spent
+
+    @property
+    def remaining(self) -> int:
+        return self._capacity - self._spent
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._spent >= self._capacity:
+                return False
+            self._spent += 1
+            return True
+
+
+@contextmanager
+def retry_budget_scope(budget: RetryBudget) -> Iterator[RetryBudget]:
+    """Draw retries made in this context from ``budget`` instead of the
+    session's, so one board cannot spend the retries of the others."""
+    token = _scoped_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _scoped_budget.reset(token)
+
+
+class BudgetedRetry(Retry):
+    """urllib3 Retry that draws every retry from a shared RetryBudget, or
+    from the one set by an enclosing retry_budget_scope."""
+    def __init__(
+            self,
+            *args,
+            budget: RetryBudget | None = None,
+            **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kw) -> BudgetedRetry:
+        kw.setdefault('budget', self.budget)
+        return super().new(**kw)
+
+    def increment(
+            self,
+            method=None,
+            url=None,
+            response=None,
+            error=None,
+            _pool=None,
+            _stacktrace=None
+    ) -> BudgetedRetry:
+        new_retry = super().increment(
+            method, url, response, error, _pool, _stacktrace
+        )
+        is_redirect = bool(response and response.get_redirect_location())
+        budget = _scoped_budget.get() or self.budget
+
+        if not is_redirect and budget and not budget.try_spend():
+            logging.warning(f'Retry budget exhausted; not retrying {url}.')
+            reason = error or ResponseError('retry budget exhausted')
+            raise MaxRetryError(_pool, url, reason) from reason
+
+        if not is_redirect:
+            RETRIES.inc(endpoint=endpoint_template(url or ''))
+
+        return new_retry
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Transport retry settings for idempotent Jira calls.
+
+    Waits grow as ``backoff_factor * 2 ** (retry - 1)`` seconds, capped at
+    ``backoff_max``, plus up to ``backoff_jitter`` seconds of random jitter.
+    A Retry-After header on 429/503 takes precedence over the computed wait.
+    """
+    total: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    backoff_jitter: float = 0.5
+    statuses: frozenset[int] = RETRYABLE_STATUSES
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+
+    def build(self, budget: RetryBudget | None = None) -> BudgetedRetry:
+        return BudgetedRetry(
+            total=self.total,
+            backoff_factor=self.backoff_factor,
+            backoff_max=self.backoff_max,
+            backoff_jitter=self.backoff_jitter,
+            status_forcelist=self.statuses,
+            allowed_methods=self.methods,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+            budget=budget,
+        )
@@ -1,3 +1,5 @@
+import threading
+from functools import cache
 from pathlib import Path
 
 import yaml
@@ -5,29 +7,87 @@ from pydantic import ValidationError
 
 from src.exceptions.config_error import ConfigError
 from src.models.board_config import BoardConfig
+from src.models.multi_board_config import MultiBoardConfig
 
 filename = 'board_config.yaml'
+CONFIG_PATH = Path(__file__).resolve().parents[2] / filename
 
+# libyaml's parser when PyYAML was built with it, else the pure-Python one.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-def load_config() -> BoardConfig:
-    config_path = Path(__file__).resolve().parents[2] / filename
+
+def read_config_file(config_path: Path = CONFIG_PATH) -> dict:
     try:
         with config_path.open(mode='r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=YAML_LOADER)
 
-            if config is None:
-                raise ConfigError(
-                    'Expected a non-empty configuration for '
-                    f'{filename}.')
+    except FileNotFoundError:
+        raise ConfigError.file_not_found()
 
-            if not isinstance(config, dict):
-                raise ConfigError(
-                    f'Invalid file structure in {filename}.'
-                )
+    if config is None:
+        raise ConfigError(
+            'Expected a non-empty configuration for '
+            f'{filename}.')
 
-            return BoardConfig(**config)
+    if not isinstance(config, dict):
+        raise ConfigError(
+            f'Invalid file structure in {filename}.'
+        )
 
-    except FileNotFoundError:
-        raise ConfigError.file_not_found()
+    return config
+
+
+def parse_multi_board_config(config: dict) -> MultiBoardConfig:
+    """Validate either a ``boards:`` list or a single-board mapping."""
+    try:
+        if 'boards' in config:
+            return MultiBoardConfig(**config)
+        return MultiBoardConfig(boards=[BoardConfig(**config)])
     except ValidationError as e:
         raise ConfigError.from_validation_error(e)
+
+
+def load_multi_board_config() -> MultiBoardConfig:
+    return parse_multi_board_config(read_config_file())
+
+
+class ConfigProvider:
+    """Parses and validates a config file once, until the file changes.
+
+    The file is re-read only when its mtime or size differs from the last
+    parse, so long-running and multi-board callers can ask for the config
+    as often as they like for the cost of a stat.
+    """
+    def __init__(self, config_path: Path = CONFIG_PATH) -> None:
+        self.config_path = config_path
+        self._lock = threading.Lock()
+        self._stamp: tuple[int, int] | None = None
+        self._config: MultiBoardConfig | None = None
+
+    def get(self) -> MultiBoardConfig:
+        stamp = self._stat()
+        with self._lock:
+            if self._config is None or stamp != self._stamp:
+                raw = read_config_file(self.config_path)
+                self._config = parse_multi_board_config(raw)
+                self._stamp = stamp
+            return self._config
+
+    def board(self, board_id: int) -> BoardConfig:
+        for board in self.get().boards:
+            if board.board_id == board_id:
+                return board
+        raise ConfigError(f'Board {board_id} is not configured in {filename}.')
+
+    def _stat(self) -> tuple[int, int]:
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise ConfigError.file_not_found()
+        return stat.st_mtime_ns, stat.st_size
+
+
+@cache
+def get_config_provider(config_path: Path = CONFIG_PATH) -> ConfigProvider:
+    """Return the shared provider for a config path."""
+    return ConfigProvider(config_path.resolve())
@@ -0,0 +1,13 @@
+from typing import Iterable
+
+from src.customtypes.shared import SAFE_STR
+
+
+def quote_jql_value(value: str) -> str:
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def build_status_exclusion_jql(statuses: Iterable[str]) -> SAFE_STR:
+    quoted = ', '.join(quote_jql_value(status) for status in sorted(statuses))
+    return f'status not in ({quoted})'
@@ -1,11 +1,32 @@
+import re
+from urllib.parse import urlsplit
+
 from pydantic import HttpUrl
 
 from src.customtypes.shared import INT_GT_0, SAFE_STR
 
+ISSUE_KEY_SEGMENT = re.compile(r'^[A-Z][A-Z0-9_]*-\d+$')
+
 
-def build_sprint_state_query_url(
+def build_board_sprint_url(
     base_url: HttpUrl,
-    board_id: INT_GT_0,
-    state: SAFE_STR
+    board_id: INT_GT_0
 ) -> SAFE_STR:
-    return f'{base_url}rest/agile/1.0/board/{board_id}/sprint?state={state}'
+    return f'{base_url}rest/agile/1.0/board/{board_id}/sprint'
+
+
+def endpoint_template(url: str) -> str:
+    """Collapse ids and issue keys in a URL path, e.g. ``/sprint/{id}``.
+
+    Gives one stable label per Jira endpoint for spans and metrics.
+    """
+    segments: list[str] = []
+    for segment in urlsplit(url).path.split('/'):
+        # The API version in /rest/api/3/ is part of the endpoint.
+        is_version = bool(segments) and segments[-1] == 'api'
+        if segment.isdigit() and not is_version:
+            segment = '{id}'
+        elif ISSUE_KEY_SEGMENT.match(segment):
+            segment = '{key}'
+        segments.append(segment)
+    return re.sub('/{2,}', '/', '/'.join(segments)) or '/'
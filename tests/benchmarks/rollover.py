@@ -0,0 +1,296 @@
+"""Rollover benchmarks against the local fake Jira server.
+
+Run from the repository root::
+
+    python -m tests.benchmarks.rollover                 # compare to baseline
+    python -m tests.benchmarks.rollover --update-baseline
+    python -m tests.benchmarks.rollover --sizes 100 --only pagination
+
+Each scenario runs twice per size: once for wall time and request count,
+and once under tracemalloc for peak memory (tracemalloc is process-wide,
+so the fake server's allocations are included). Request counts must not
+grow at all; time and memory may drift by ``--tolerance`` before the run
+fails. Wall time is machine-specific, so refresh the baseline on the
+machine that enforces it.
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator, NamedTuple
+
+from src.auth.session import build_authenticated_session
+from src.models.board_config import BoardConfig
+from src.models.credentials import Credentials
+from src.orchestration.sprint_orchestration import automate_sprint
+from src.services.jira_issues import get_incomplete_stories
+from src.services.sprint_transfer import (
+    parse_issues,
+    transfer_all_issue_batches,
+)
+from src.transport.retry import RetryBudget
+from src.utils.sprint_naming import generate_sprint_name
+from src.utils.sprint_parser import parse_dart_sprint
+from tests.fakes.jira_server import FakeJiraOptions, FakeJiraServer, board_for
+
+DEFAULT_SIZES = (100, 10_000, 100_000)
+DEFAULT_TOLERANCE = 0.25
+# Absolute slack so millisecond-scale runs do not fail on timer noise.
+MIN_SLACK = {'seconds': 0.05, 'peak_bytes': 2 ** 20}
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+CREDENTIALS = Credentials(email='bench@example.com', token='token')
+
+# Runs the workload once and returns the number of HTTP requests it made.
+Workload = Callable[[], int]
+
+
+class Measurement(NamedTuple):
+    seconds: float
+    requests: int
+    peak_bytes: int
+
+
+class Scenario(NamedTuple):
+    name: str
+    prepare: Callable[[int], ContextManager[Workload]]
+
+
+@contextmanager
+def fake_jira(size: int) -> Iterator[tuple[FakeJiraServer, BoardConfig]]:
+    options = FakeJiraOptions(issue_count=size, rollover_day=date.today())
+    with FakeJiraServer(options) as server:
+        yield server, board_for(server, 'Benchmark board')
+
+
+def counting(server: FakeJiraServer, work: Callable[[], object]) -> Workload:
+    def run() -> int:
+        before = sum(server.requests.values())
+        work()
+        return sum(server.requests.values()) - before
+
+    return run
+
+
+def new_session():
+    return build_authenticated_session(
+        CREDENTIALS, retry_budget=RetryBudget(10_000)
+    )
+
+
+@contextmanager
+def pagination(size: int) -> Iterator[Workload]:
+    with fake_jira(size) as (server, config):
+        session = new_session()
+        yield counting(
+            server, lambda: get_incomplete_stories(1, config, session)
+        )
+
+
+def raw_issue_list(size: int) -> list[dict]:
+    return [
+        {
+            'key': f'JIRA-{n}',
+            'fields': {
+                'summary': f'Story {n}',
+                'status': {'name': 'In Progress'},
+                'issuetype': {'name': 'Story'},
+            },
+        }
+        for n in range(size)
+    ]
+
+
+@contextmanager
+def issue_parsing(size: int) -> Iterator[Workload]:
+    raw_issues = raw_issue_list(size)
+
+    def run() -> int:
+        for _ in parse_issues(raw_issues):
+            pass
+        return 0
+
+    yield run
+
+
+@contextmanager
+def trusted_issue_parsing(size: int) -> Iterator[Workload]:
+    raw_issues = raw_issue_list(size)
+
+    def run() -> int:
+        for _ in parse_issues(raw_issues, trusted=True):
+            pass
+        return 0
+
+    yield run
+
+
+@contextmanager
+def dart_parsing(size: int) -> Iterator[Workload]:
+    first = date(2020, 1, 6)
+    names = []
+    for n in range(size):
+        start = first + timedelta(days=n % 3650)
+        names.append(generate_sprint_name(start, start + timedelta(days=14)))
+        if n % 10 == 0:
+            names.append(f'Team sprint {n}')
+
+    def run() -> int:
+        for name in names:
+            parse_dart_sprint(name)
+        return 0
+
+    yield run
+
+
+@contextmanager
+def batch_transfer(size: int) -> Iterator[Workload]:
+    with fake_jira(size) as (server, config):
+        session = new_session()
+        keys = list(server.issues)
+        yield counting(
+            server,
+            lambda: transfer_all_issue_batches(
+                keys, session, config.base_url, 2
+            ),
+        )
+
+
+@contextmanager
+def full_rollover(size: int) -> Iterator[Workload]:
+    with fake_jira(size) as (server, config):
+        session = new_session()
+        yield counting(server, lambda: automate_sprint(session, config))
+
+
+SCENARIOS = (
+    Scenario('pagination', pagination),
+    Scenario('issue_parsing', issue_parsing),
+    Scenario('trusted_issue_parsing', trusted_issue_parsing),
+    Scenario('dart_parsing', dart_parsing),
+    Scenario('batch_transfer', batch_transfer),
+    Scenario('full_rollover', full_rollover),
+)
+
+
+def measure(scenario: Scenario, size: int) -> Measurement:
+    with scenario.prepare(size) as run:
+        started = time.perf_counter()
+        requests = run()
+        seconds = time.perf_counter() - started
+
+    with scenario.prepare(size) as run:
+        tracemalloc.start()
+        try:
+            run()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Measurement(round(seconds, 4), requests, peak_bytes)
+
+
+def compare(
+        results: dict[str, Measurement],
+        baseline: dict[str, dict],
+        tolerance: float = DEFAULT_TOLERANCE
+) -> list[str]:
+    """Return one message per regression against the stored baseline."""
+    regressions = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+
+        if result.requests > expected['requests']:
+            regressions.append(
+                f'{key}: {result.requests} requests, '
+                f'baseline {expected['requests']}'
+            )
+
+        for field in ('seconds', 'peak_bytes'):
+            slack = max(expected[field] * tolerance, MIN_SLACK[field])
+            limit = expected[field] + slack
+            if getattr(result, field) > limit:
+                regressions.append(
+                    f'{key}: {field} {getattr(result, field)} exceeds '
+                    f'baseline {expected[field]} by more than '
+                    f'{tolerance:.0%}'
+                )
+
+    return regressions
+
+
+def run_suite(
+        sizes: tuple[int, ...] = DEFAULT_SIZES,
+        only: tuple[str, ...] = ()
+) -> dict[str, Measurement]:
+    results = {}
+    for scenario in SCENARIOS:
+        if only and scenario.name not in only:
+            continue
+        for size in sizes:
+            key = f'{scenario.name}@{size}'
+            results[key] = measure(scenario, size)
+            print(format_row(key, results[key], size), flush=True)
+    return results
+
+
+def format_row(key: str, result: Measurement, size: int) -> str:
+    return (
+        f'{key:<32} {result.seconds:>9.3f}s '
+        f'{result.seconds / size * 1e9:>9.0f} ns/item '
+        f'{result.requests:>7} req {result.peak_bytes / 2 ** 20:>9.1f} MiB'
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--only', nargs='+', default=())
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument(
+        '--tolerance', type=float, default=DEFAULT_TOLERANCE
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    # Per-issue log lines would dominate the timings at 100k issues.
+    logging.disable(logging.CRITICAL)
+    try:
+        results = run_suite(tuple(args.sizes), tuple(args.only))
+    finally:
+        logging.disable(logging.NOTSET)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+
+    if args.update_baseline:
+        baseline.update(
+            {key: result._asdict() for key, result in results.items()}
+        )
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + '\n',
+            encoding='utf-8',
+        )
+        print(f'Baseline written to {args.baseline}.')
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}', file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
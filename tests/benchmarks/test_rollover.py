@@ -0,0 +1,72 @@
+import json
+
+from tests.benchmarks.rollover import (
+    BASELINE_PATH,
+    DEFAULT_SIZES,
+    SCENARIOS,
+    Measurement,
+    compare,
+    main,
+    run_suite,
+)
+
+BASELINE = {
+    'full_rollover@100': {
+        'seconds': 1.0,
+        'requests': 7,
+        'peak_bytes': 10 * 2 ** 20,
+    },
+}
+
+
+def test_every_scenario_runs_at_a_small_size() -> None:
+    results = run_suite(sizes=(20,))
+
+    assert set(results) == {f'{s.name}@20' for s in SCENARIOS}
+    assert results['full_rollover@20'].requests > 0
+    assert results['issue_parsing@20'].requests == 0
+
+
+def test_extra_requests_always_regress() -> None:
+    result = Measurement(seconds=0.5, requests=8, peak_bytes=2 ** 20)
+
+    [regression] = compare({'full_rollover@100': result}, BASELINE)
+
+    assert '8 requests, baseline 7' in regression
+
+
+def test_time_and_memory_regress_beyond_tolerance() -> None:
+    result = Measurement(seconds=1.3, requests=7, peak_bytes=13 * 2 ** 20)
+
+    regressions = compare({'full_rollover@100': result}, BASELINE, 0.25)
+
+    assert [r.split()[1] for r in regressions] == ['seconds', 'peak_bytes']
+
+
+def test_within_tolerance_and_unknown_keys_pass() -> None:
+    results = {
+        'full_rollover@100': Measurement(1.2, 7, 12 * 2 ** 20),
+        'pagination@5': Measurement(99.0, 99, 2 ** 30),
+    }
+
+    assert compare(results, BASELINE, 0.25) == []
+
+
+def test_update_baseline_writes_results(tmp_path) -> None:
+    path = tmp_path / 'baseline.json'
+
+    args = ['--sizes', '10', '--only', 'dart_parsing', '--baseline', str(path)]
+
+    assert main([*args, '--update-baseline']) == 0
+    assert 'dart_parsing@10' in path.read_text(encoding='utf-8')
+    assert main(args) == 0
+
+
+def test_stored_baseline_covers_every_scenario_and_size() -> None:
+    baseline = json.loads(BASELINE_PATH.read_text(encoding='utf-8'))
+
+    assert set(baseline) == {
+        f'{scenario.name}@{size}'
+        for scenario in SCENARIOS
+        for size in DEFAULT_SIZES
+    }
@@ -0,0 +1,415 @@
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, cast
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import HttpUrl
+
+from src.models.board_config import BoardConfig
+from src.utils.datetime_format import format_jira_date
+from src.utils.sprint_naming import generate_sprint_name
+from src.utils.url_builder import endpoint_template
+
+STATUS_EXCLUSION = re.compile(r'status not in \(([^)]*)\)')
+SPRINT_CLAUSE = re.compile(r'sprint = (\d+)')
+STATUSES = ('To Do', 'In Progress', 'Code Review', 'Done', 'Cancelled')
+DONE = {'Done', 'Cancelled'}
+MAX_MOVE_BATCH = 50
+
+
+@dataclass(frozen=True)
+class FakeJiraOptions:
+    """Dataset and behaviour of a FakeJiraServer.
+
+    ``error_rate`` of requests, or every ``error_every``-th request, is
+    answered with a status from ``error_statuses`` (with ``Retry-After: 0``)
+    before touching any state. With ``compress``, bodies are gzipped for
+    clients that send ``Accept-Encoding: gzip``.
+    """
+    board_id: int = 1
+    issue_count: int = 100
+    done_ratio: float = 0.2
+    rollover_day: date | None = None
+    with_next_sprint: bool = True
+    latency: float = 0.0
+    page_size: int = 50
+    error_rate: float = 0.0
+    error_every: int = 0
+    error_statuses: tuple[int, ...] = (429, 503)
+    compress: bool = False
+    seed: int = 0
+
+
+class FakeJiraServer:
+    """In-process stand-in for the Jira Agile endpoints automation uses.
+
+    Serves board sprint listings, sprint issue listings, the enhanced JQL
+    search, sprint create/update and issue moves over real HTTP, so code
+    under test runs unchanged against ``base_url``.
+    """
+    def __init__(self, options: FakeJiraOptions = FakeJiraOptions()) -> None:
+        self.options = options
+        self.sprints: dict[int, dict] = {}
+        self.issues: dict[str, dict] = {}
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.compressed: Counter[tuple[str, str]] = Counter()
+        self.injected_errors = 0
+        # Filtered sprint listings, dropped whenever an issue changes sprint.
+        self._listings: dict[tuple[int, frozenset[str]], list[dict]] = {}
+        self._random = random.Random(options.seed)
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._seed_dataset()
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, 'FakeJiraServer is not running.'
+        return f'http://127.0.0.1:{self._server.server_port}/'
+
+    def __enter__(self) -> 'FakeJiraServer':
+        self._server = ThreadingHTTPServer(
+            ('127.0.0.1', 0), _make_handler(self)
+        )
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def sprint_issue_keys(self, sprint_id: int) -> list[str]:
+        with self._lock:
+            return [
+                key
+                for key, issue in self.issues.items()
+                if issue['sprint'] == sprint_id
+            ]
+
+    def sprints_in_state(self, state: str) -> list[dict]:
+        with self._lock:
+            return [s for s in self.sprints.values() if s['state'] == state]
+
+    def _seed_dataset(self) -> None:
+        options = self.options
+        day = options.rollover_day or date.today()
+        previous = day - timedelta(days=14)
+
+        active = self._add_sprint(previous, 'active')
+        if options.with_next_sprint:
+            self._add_sprint(day, 'future')
+
+        for number in range(1, options.issue_count + 1):
+            done = self._random.random() < options.done_ratio
+            status = self._random.choice(
+                [s for s in STATUSES if (s in DONE) == done]
+            )
+            key = f'JIRA-{number}'
+            self.issues[key] = {
+                'key': key,
+                'status': status,
+                'issuetype': 'Story',
+                'summary': f'Story {number}',
+                'sprint': active['id'],
+            }
+
+    def _add_sprint(self, start: date, state: str) -> dict:
+        start_at = _midnight(start)
+        end_at = start_at + timedelta(days=14)
+        sprint = {
+            'id': len(self.sprints) + 1,
+            'name': generate_sprint_name(start_at, end_at),
+            'state': state,
+            'startDate': format_jira_date(start_at),
+            'endDate': format_jira_date(end_at),
+            'originBoardId': self.options.board_id,
+        }
+        self.sprints[sprint['id']] = sprint
+        return sprint
+
+    # Route handlers return (status, body); body None means no content.
+
+    def list_board_sprints(
+            self, board_id: int, query: dict[str, str], _body: Any
+    ) -> tuple[int, Any]:
+        if board_id != self.options.board_id:
+            return 404, {'errorMessages': ['Board not found.']}
+
+        states = set(query.get('state', 'active,future').split(','))
+        with self._lock:
+            sprints = [
+                s for s in self.sprints.values() if s['state'] in states
+            ]
+        start_at, max_results = self._page_window(query)
+        values = sprints[start_at:start_at + max_results]
+
+        return 200, {
+            'maxResults': max_results,
+            'startAt': start_at,
+            'isLast': start_at + max_results >= len(sprints),
+            'values': values,
+        }
+
+    def list_sprint_issues(
+            self, sprint_id: int, query: dict[str, str], _body: Any
+    ) -> tuple[int, Any]:
+        if sprint_id not in self.sprints:
+            return 404, {'errorMessages': ['Sprint not found.']}
+
+        issues = self._matching_issues(sprint_id, query.get('jql', ''))
+        start_at, max_results = self._page_window(query)
+
+        return 200, {
+            'startAt': start_at,
+            'maxResults': max_results,
+            'total': len(issues),
+            'issues': [
+                _render_issue(issue)
+                for issue in issues[start_at:start_at + max_results]
+            ],
+        }
+
+    def search_jql(
+            self, query: dict[str, str], _body: Any
+    ) -> tuple[int, Any]:
+        jql = query.get('jql', '')
+        sprint = SPRINT_CLAUSE.search(jql)
+        if not sprint:
+            return 400, {'errorMessages': ['Only sprint JQL is supported.']}
+
+        issues = self._matching_issues(int(sprint[1]), jql)
+        start_at = int(query.get('nextPageToken') or 0)
+        _, max_results = self._page_window(query)
+        end = start_at + max_results
+        page = {
+            'issues': [_render_issue(issue) for issue in issues[start_at:end]],
+            'isLast': end >= len(issues),
+        }
+        if end < len(issues):
+            page['nextPageToken'] = str(end)
+
+        return 200, page
+
+    def create_sprint(
+            self, _query: dict[str, str], body: Any
+    ) -> tuple[int, Any]:
+        with self._lock:
+            sprint = {
+                'id': max(self.sprints, default=0) + 1,
+                'name': body['name'],
+                'state': 'future',
+                'startDate': body.get('startDate'),
+                'endDate': body.get('endDate'),
+                'originBoardId': body['originBoardId'],
+            }
+            self.sprints[sprint['id']] = sprint
+
+        return 201, sprint
+
+    def update_sprint(
+            self, sprint_id: int, _query: dict[str, str], body: Any
+    ) -> tuple[int, Any]:
+        with self._lock:
+            sprint = self.sprints.get(sprint_id)
+            if sprint is None:
+                return 404, {'errorMessages': ['Sprint not found.']}
+
+            if body.get('state') == 'closed':
+                # Like Jira, closing sends unfinished issues to the backlog.
+                for issue in self.issues.values():
+                    if issue['sprint'] == sprint_id and (
+                        issue['status'] not in DONE
+                    ):
+                        issue['sprint'] = None
+                self._listings.clear()
+
+            sprint.update({k: v for k, v in body.items() if k in sprint})
+            return 200, dict(sprint)
+
+    def move_issues(
+            self, sprint_id: int, _query: dict[str, str], body: Any
+    ) -> tuple[int, Any]:
+        keys = body.get('issues', [])
+        if len(keys) > MAX_MOVE_BATCH:
+            return 400, {'errorMessages': ['Too many issues in one move.']}
+
+        with self._lock:
+            if sprint_id not in self.sprints:
+                return 404, {'errorMessages': ['Sprint not found.']}
+            for key in keys:
+                if key in self.issues:
+                    self.issues[key]['sprint'] = sprint_id
+            self._listings.clear()
+
+        return 204, None
+
+    def _matching_issues(self, sprint_id: int, jql: str) -> list[dict]:
+        excluded: set[str] = set()
+        if match := STATUS_EXCLUSION.search(jql):
+            excluded = {
+                value.strip().strip('"') for value in match[1].split(',')
+            }
+
+        cache_key = (sprint_id, frozenset(excluded))
+        with self._lock:
+            if cache_key not in self._listings:
+                self._listings[cache_key] = [
+                    issue
+                    for issue in self.issues.values()
+                    if issue['sprint'] == sprint_id
+                    and issue['status'] not in excluded
+                ]
+            return self._listings[cache_key]
+
+    def _page_window(self, query: dict[str, str]) -> tuple[int, int]:
+        start_at = int(query.get('startAt', 0))
+        requested = int(query.get('maxResults', self.options.page_size))
+        return start_at, min(requested, self.options.page_size)
+
+    def _injected_error(self) -> int | None:
+        options = self.options
+        with self._lock:
+            served = sum(self.requests.values())
+            every = options.error_every
+            scheduled = bool(every) and served % every == 0
+            if scheduled or self._random.random() < options.error_rate:
+                self.injected_errors += 1
+                return options.error_statuses[
+                    self.injected_errors % len(options.error_statuses)
+                ]
+        return None
+
+
+def board_for(
+    server: FakeJiraServer, board_name: str = 'Fake board'
+) -> BoardConfig:
+    return BoardConfig(
+        base_url=cast(HttpUrl, server.base_url),
+        board_id=server.options.board_id,
+        board_name=board_name,
+    )
+
+
+def _render_issue(issue: dict) -> dict:
+    return {
+        'key': issue['key'],
+        'fields': {
+            'summary': issue['summary'],
+            'status': {'name': issue['status']},
+            'issuetype': {'name': issue['issuetype']},
+        },
+    }
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+Route = tuple[str, re.Pattern, Callable[..., tuple[int, Any]]]
+
+
+def _routes(fake: FakeJiraServer) -> list[Route]:
+    return [
+        (
+            'GET',
+            re.compile(r'/rest/agile/1\.0/board/(\d+)/sprint'),
+            fake.list_board_sprints,
+        ),
+        (
+            'GET',
+            re.compile(r'/rest/agile/1\.0/sprint/(\d+)/issue'),
+            fake.list_sprint_issues,
+        ),
+        ('GET', re.compile(r'/rest/api/3/search/jql'), fake.search_jql),
+        ('POST', re.compile(r'/rest/agile/1\.0/sprint'), fake.create_sprint),
+        (
+            'PUT',
+            re.compile(r'/rest/agile/1\.0/sprint/(\d+)'),
+            fake.update_sprint,
+        ),
+        (
+            'POST',
+            re.compile(r'/rest/agile/1\.0/sprint/(\d+)/issue'),
+            fake.move_issues,
+        ),
+    ]
+
+
+def _make_handler(fake: FakeJiraServer) -> type[BaseHTTPRequestHandler]:
+    routes = _routes(fake)
+
+    class FakeJiraHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out in separate writes; with Nagle on, each
+        # keep-alive response would stall ~40 ms on a delayed ACK.
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._dispatch('GET')
+
+        def do_POST(self) -> None:
+            self._dispatch('POST')
+
+        def do_PUT(self) -> None:
+            self._dispatch('PUT')
+
+        def _dispatch(self, method: str) -> None:
+            length = int(self.headers.get('Content-Length') or 0)
+            raw_body = self.rfile.read(length) if length else b''
+            parts = urlsplit(self.path)
+            path = re.sub('/{2,}', '/', parts.path)
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+            self.call = (method, endpoint_template(path))
+            with fake._lock:
+                fake.requests[self.call] += 1
+
+            if fake.options.latency:
+                time.sleep(fake.options.latency)
+
+            if status := fake._injected_error():
+                self._send(status, {'errorMessages': ['Injected error.']})
+                return
+
+            for route_method, pattern, handler in routes:
+                match = pattern.fullmatch(path)
+                if route_method == method and match:
+                    body = json.loads(raw_body) if raw_body else {}
+                    args = [int(group) for group in match.groups()]
+                    self._send(*handler(*args, query, body))
+                    return
+
+            self._send(404, {'errorMessages': [f'No route for {path}.']})
+
+        def _send(self, status: int, body: Any) -> None:
+            payload = b'' if body is None else json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            accepted = self.headers.get('Accept-Encoding', '')
+            if payload and fake.options.compress and 'gzip' in accepted:
+                payload = gzip.compress(payload, compresslevel=1)
+                self.send_header('Content-Encoding', 'gzip')
+                with fake._lock:
+                    fake.compressed[self.call] += 1
+            self.send_header('Content-Length', str(len(payload)))
+            if status in (429, 503):
+                self.send_header('Retry-After', '0')
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    return FakeJiraHandler
@@ -0,0 +1,131 @@
+import math
+from datetime import date
+
+import pytest
+
+from src.auth.session import build_authenticated_session
+from src.logs.tracing import get_tracer
+from src.models.board_config import IssueBackend
+from src.models.credentials import Credentials
+from src.orchestration.sprint_orchestration import automate_sprint
+from src.transport.retry import RetryBudget
+from tests.fakes.jira_server import (
+    DONE,
+    FakeJiraOptions,
+    FakeJiraServer,
+    board_for,
+)
+
+CREDENTIALS = Credentials(email='bot@example.com', token='token')
+
+
+def incomplete_keys(server: FakeJiraServer, sprint_id: int) -> set[str]:
+    return {
+        key
+        for key, issue in server.issues.items()
+        if issue['sprint'] == sprint_id and issue['status'] not in DONE
+    }
+
+
+def run_rollover(
+        server: FakeJiraServer, backend: IssueBackend = 'offset'
+) -> tuple[dict, dict]:
+    [active] = server.sprints_in_state('active')
+    session = build_authenticated_session(
+        CREDENTIALS, retry_budget=RetryBudget(500)
+    )
+    config = board_for(server).model_copy(update={'issue_backend': backend})
+
+    automate_sprint(session, config)
+
+    [closed] = server.sprints_in_state('closed')
+    [started] = server.sprints_in_state('active')
+    assert closed['id'] == active['id']
+    return closed, started
+
+
+def test_rollover_moves_unfinished_issues_into_next_sprint() -> None:
+    options = FakeJiraOptions(issue_count=230, rollover_day=date.today())
+
+    with FakeJiraServer(options) as server:
+        to_move = incomplete_keys(server, 1)
+        closed, started = run_rollover(server)
+
+    assert started['id'] == 2
+    assert set(server.sprint_issue_keys(started['id'])) == to_move
+    assert all(
+        server.issues[key]['status'] in DONE
+        for key in server.sprint_issue_keys(closed['id'])
+    )
+    moves = server.requests[('POST', '/rest/agile/1.0/sprint/{id}/issue')]
+    assert moves == math.ceil(len(to_move) / 50)
+
+
+def test_rollover_can_list_issues_with_the_cursor_backend() -> None:
+    options = FakeJiraOptions(issue_count=230, rollover_day=date.today())
+
+    with FakeJiraServer(options) as server:
+        to_move = incomplete_keys(server, 1)
+        _, started = run_rollover(server, backend='cursor')
+
+    assert set(server.sprint_issue_keys(started['id'])) == to_move
+    assert server.requests[('GET', '/rest/api/3/search/jql')]
+    assert not server.requests[('GET', '/rest/agile/1.0/sprint/{id}/issue')]
+
+
+def test_rollover_creates_missing_sprint() -> None:
+    options = FakeJiraOptions(issue_count=20, with_next_sprint=False)
+
+    with FakeJiraServer(options) as server:
+        to_move = incomplete_keys(server, 1)
+        _, started = run_rollover(server)
+
+    assert started['name'].startswith('DART ')
+    assert set(server.sprint_issue_keys(started['id'])) == to_move
+
+
+@pytest.mark.parametrize('page_size', [7, 50])
+def test_rollover_survives_small_pages_and_injected_errors(
+        page_size: int
+) -> None:
+    options = FakeJiraOptions(
+        issue_count=120,
+        rollover_day=date.today(),
+        page_size=page_size,
+        error_every=4,
+        error_statuses=(429, 503),
+    )
+
+    with FakeJiraServer(options) as server:
+        to_move = incomplete_keys(server, 1)
+        _, started = run_rollover(server)
+
+    assert server.injected_errors > 0
+    assert set(server.sprint_issue_keys(started['id'])) == to_move
+
+
+def test_paging_endpoints_are_served_compressed() -> None:
+    options = FakeJiraOptions(
+        issue_count=230, rollover_day=date.today(), compress=True
+    )
+    spans = []
+    get_tracer().add_exporter(spans.append)
+
+    try:
+        with FakeJiraServer(options) as server:
+            to_move = incomplete_keys(server, 1)
+            _, started = run_rollover(server)
+    finally:
+        get_tracer().remove_exporter(spans.append)
+
+    assert set(server.sprint_issue_keys(started['id'])) == to_move
+    assert server.compressed[('GET', '/rest/agile/1.0/sprint/{id}/issue')]
+    assert server.compressed[('GET', '/rest/agile/1.0/board/{id}/sprint')]
+
+    decoded = [span.attributes for span in spans if span.name == 'json.decode']
+    assert decoded and all(
+        attributes['http.response.content_encoding'] == 'gzip'
+        and attributes['http.response.wire_bytes']
+        < attributes['http.response.bytes']
+        for attributes in decoded
+    )
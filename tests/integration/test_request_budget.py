@@ -0,0 +1,66 @@
+from datetime import date
+
+import pytest
+
+from src.orchestration.rollover_plan import commit_rollover, prepare_rollover
+from src.orchestration.sprint_orchestration import automate_sprint
+from tests.fakes.jira_server import (
+    DONE,
+    FakeJiraOptions,
+    FakeJiraServer,
+    board_for,
+)
+from tests.utils.request_budget import (
+    assert_request_budget,
+    build_recording_session,
+    rollover_request_budget,
+)
+
+
+def incomplete_count(server: FakeJiraServer) -> int:
+    return sum(
+        issue['status'] not in DONE for issue in server.issues.values()
+    )
+
+
+@pytest.mark.parametrize('issue_count', [0, 49, 50, 51, 480])
+def test_rollover_stays_within_request_budget(issue_count: int) -> None:
+    options = FakeJiraOptions(
+        issue_count=issue_count, rollover_day=date.today()
+    )
+    session = build_recording_session()
+
+    with FakeJiraServer(options) as server:
+        budget = rollover_request_budget(incomplete_count(server))
+        with assert_request_budget(session, budget):
+            automate_sprint(session, board_for(server))
+
+
+def test_rollover_with_sprint_creation_stays_within_budget() -> None:
+    options = FakeJiraOptions(issue_count=120, with_next_sprint=False)
+    session = build_recording_session()
+
+    with FakeJiraServer(options) as server:
+        budget = rollover_request_budget(
+            incomplete_count(server), creates_sprint=True
+        )
+        with assert_request_budget(session, budget):
+            automate_sprint(session, board_for(server))
+
+
+def test_commit_relists_the_issues_then_writes() -> None:
+    options = FakeJiraOptions(issue_count=230, rollover_day=date.today())
+    session = build_recording_session()
+
+    with FakeJiraServer(options) as server:
+        config = board_for(server)
+        plan = prepare_rollover(session, config)
+        batches = len(plan.key_batches)
+
+        # One board read, the incomplete-issue pages, close, one move per
+        # batch and start.
+        budget = 1 + max(batches, 1) + 1 + batches + 1
+        with assert_request_budget(session, budget) as calls:
+            commit_rollover(session, config, plan)
+
+    assert calls.calls[('GET', '/rest/agile/1.0/board/{id}/sprint')] == 1
@@ -8,8 +8,14 @@ from src.auth.session import (
     build_authenticated_session,
     get_authenticated_session
 )
+from src.logs.metrics import REQUEST_SECONDS, REQUESTS
+from src.logs.tracing import get_tracer
 from src.models.credentials import Credentials
+from src.transport.adapter import JiraHTTPAdapter
+from src.transport.json_codec import JsonResponse
+from src.transport.retry import RetryBudget, RetryPolicy
 from tests.strategies.shared import valid_credentials
+from tests.utils.local_http import QuietHandler, serve
 from tests.utils.patch_helper import make_base_path
 
 base_path = make_base_path('src.auth.session')
@@ -39,4 +45,88 @@ def test_request_timeout_enforced(credentials: Credentials) -> None:
         session = build_authenticated_session(credentials)
 
     with pytest.raises(Timeout):
-        session.request('GET', 'https://example.com')
\ No newline at end of file
+        session.request('GET', 'https://example.com')
+
+@given(credentials=valid_credentials())
+def test_build_authenticated_session_applies_pool_settings(
+    credentials: Credentials,
+) -> None:
+    session = build_authenticated_session(
+        credentials, pool_connections=2, pool_maxsize=4, pool_block=True
+    )
+    adapter = session.get_adapter('https://example.com')
+
+    assert isinstance(adapter, JiraHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 4
+    assert session.connection_stats.requests == 0
+
+
+@given(credentials=valid_credentials())
+def test_build_authenticated_session_shares_retry_budget(
+    credentials: Credentials,
+) -> None:
+    budget = RetryBudget(7)
+    session = build_authenticated_session(
+        credentials, retry_policy=RetryPolicy(total=2), retry_budget=budget
+    )
+    retry = session.get_adapter('https://example.com').max_retries
+
+    assert session.retry_budget is budget
+    assert retry.budget is budget and retry.total == 2
+
+
+def test_requests_are_traced_and_counted() -> None:
+    class Handler(QuietHandler):
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers['Content-Length']))
+            self.send_body(201, b'{"id": 1}')
+
+    spans = []
+    get_tracer().add_exporter(spans.append)
+    credentials = Credentials(email='a@b.co', token='t')
+    session = build_authenticated_session(credentials)
+
+    try:
+        with serve(Handler) as url:
+            session.post(f'{url}rest/agile/1.0/sprint/42', data=b'{"a": 1}')
+    finally:
+        get_tracer().remove_exporter(spans.append)
+
+    labels = {
+        'endpoint': '/rest/agile/1.0/sprint/{id}',
+        'method': 'POST',
+        'status_class': '2xx',
+    }
+    assert REQUESTS.value(**labels) >= 1
+    assert REQUEST_SECONDS.count(**labels) >= 1
+    assert spans[0].name == 'http'
+    assert spans[0].attributes == {
+        'http.method': 'POST',
+        'http.route': '/rest/agile/1.0/sprint/{id}',
+        'http.status_code': 201,
+        'http.request.bytes': 8,
+        'http.response.bytes': 9,
+        'http.response.wire_bytes': 9,
+    }
+
+
+def test_json_bodies_are_encoded_by_the_session_codec() -> None:
+    received = []
+
+    class Handler(QuietHandler):
+        def do_PUT(self) -> None:
+            length = int(self.headers['Content-Length'])
+            received.append(
+                (self.headers['Content-Type'], self.rfile.read(length))
+            )
+            self.send_body(200, b'{"ok": true}')
+
+    credentials = Credentials(email='a@b.co', token='t')
+    session = build_authenticated_session(credentials)
+
+    with serve(Handler) as url:
+        response = session.put(url, json={'state': 'closed'})
+
+    assert isinstance(response, JsonResponse)
+    assert response.json() == {'ok': True}
+    assert received == [('application/json', b'{"state":"closed"}')]
@@ -75,3 +75,12 @@ def test_gateway_timeout_logs(caplog: LogCaptureFixture) -> None:
     assert result is False
     assert 'Response content' not in caplog.text
     assert all(msg in caplog.text for msg in expected_messages)
+
+
+@pytest.mark.parametrize('status_code', [400, 504])
+def test_error_responses_are_closed(status_code: INT_HTTP) -> None:
+    response = make_mock_response(status_code, '', MOCK_BASE_URL, POST)
+
+    handle_api_error(response, CONTEXT)
+
+    response.close.assert_called_once()
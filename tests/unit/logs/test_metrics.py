@@ -0,0 +1,123 @@
+import pytest
+import requests
+
+from src.logs.metrics import (
+    REQUEST_SECONDS,
+    REQUESTS,
+    MetricsRegistry,
+    record_request,
+    serve_metrics,
+    status_class,
+    write_textfile,
+)
+
+
+def test_counter_renders_labelled_samples() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter('calls_total', 'Calls.', ('endpoint',))
+
+    counter.inc(endpoint='/b')
+    counter.inc(2, endpoint='/a')
+    counter.inc(endpoint='/a')
+
+    assert registry.render() == (
+        '# HELP calls_total Calls.\n'
+        '# TYPE calls_total counter\n'
+        'calls_total{endpoint="/a"} 3\n'
+        'calls_total{endpoint="/b"} 1\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        'latency_seconds', 'Latency.', buckets=(0.1, 1.0)
+    )
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        'latency_seconds_sum 2.65',
+        'latency_seconds_count 4',
+    ]
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter('c', 'C.', ('v',)).inc(v='a"b\\c\nd')
+
+    assert 'c{v="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_labels_must_match_declaration() -> None:
+    counter = MetricsRegistry().counter('c', 'C.', ('endpoint',))
+
+    with pytest.raises(ValueError, match='Expected labels'):
+        counter.inc(route='/x')
+
+
+def test_duplicate_metric_names_are_rejected() -> None:
+    registry = MetricsRegistry()
+    registry.counter('c', 'C.')
+
+    with pytest.raises(ValueError, match='already registered'):
+        registry.histogram('c', 'C.')
+
+
+@pytest.mark.parametrize(
+    'status_code, expected', [(200, '2xx'), (429, '4xx'), (None, 'error')]
+)
+def test_status_class(status_code, expected) -> None:
+    assert status_class(status_code) == expected
+
+
+def test_record_request_feeds_counter_and_histogram() -> None:
+    labels = {
+        'endpoint': '/test/record',
+        'method': 'GET',
+        'status_class': '5xx',
+    }
+    before = REQUESTS.value(**labels)
+
+    record_request('GET', '/test/record', 503, 0.2)
+
+    assert REQUESTS.value(**labels) == before + 1
+    assert REQUEST_SECONDS.count(**labels) >= 1
+    assert REQUEST_SECONDS.count(
+        endpoint='/test/record', method='GET', status_class='2xx'
+    ) == 0
+
+
+def test_write_textfile_replaces_file(tmp_path) -> None:
+    registry = MetricsRegistry()
+    registry.counter('c', 'C.').inc()
+    path = tmp_path / 'jira.prom'
+    path.write_text('stale', encoding='utf-8')
+
+    write_textfile(path, registry)
+
+    assert path.read_text(encoding='utf-8') == registry.render()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_serve_metrics() -> None:
+    registry = MetricsRegistry()
+    registry.counter('c', 'C.').inc()
+    server = serve_metrics(0, registry)
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    try:
+        response = requests.get(f'{base}/metrics', timeout=5)
+        missing = requests.get(f'{base}/other', timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert response.text == registry.render()
+    assert response.headers['Content-Type'].startswith('text/plain')
+    assert missing.status_code == 404
@@ -0,0 +1,104 @@
+import json
+import pstats
+import sys
+import threading
+import time
+
+import pytest
+import requests
+from pydantic import BaseModel, field_validator
+
+from src.logs.profiling import SamplingProfiler, classify_stack, profiling
+from tests.utils.local_http import QuietHandler, serve
+
+
+def test_classifies_json_decoding() -> None:
+    seen = []
+
+    def hook(obj: dict) -> dict:
+        seen.append(classify_stack(sys._getframe()))
+        return obj
+
+    json.loads('{"a": 1}', object_hook=hook)
+
+    assert seen == ['json']
+
+
+def test_classifies_pydantic_validation() -> None:
+    seen = []
+
+    class Model(BaseModel):
+        name: str
+
+        @field_validator('name')
+        @classmethod
+        def record(cls, value: str) -> str:
+            seen.append(classify_stack(sys._getframe()))
+            return value
+
+    Model(name='x')
+
+    assert seen == ['pydantic']
+
+
+def test_classifies_plain_code_as_other() -> None:
+    assert classify_stack(sys._getframe()) == 'other'
+
+
+def test_samples_network_wait_and_idle_threads() -> None:
+    release = threading.Event()
+
+    class SlowHandler(QuietHandler):
+        def do_GET(self) -> None:
+            release.wait(5)
+            self.send_body(200, b'{}')
+
+    idle = threading.Thread(target=release.wait, args=(5,), daemon=True)
+    idle.start()
+    sampler = SamplingProfiler()
+
+    with serve(SlowHandler) as url:
+        caller = threading.Thread(
+            target=requests.get, args=(url,), kwargs={'timeout': 5}
+        )
+        caller.start()
+        deadline = time.monotonic() + 5
+        while sampler.counts['network'] == 0 and time.monotonic() < deadline:
+            sampler.sample()
+            time.sleep(0.01)
+        release.set()
+        caller.join()
+
+    assert sampler.counts['network'] > 0
+    assert sampler.counts['idle'] > 0
+
+
+def test_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError):
+        SamplingProfiler(0)
+
+
+def test_cprofile_mode_writes_pstats(tmp_path) -> None:
+    path = tmp_path / 'run.pstats'
+
+    with profiling(path):
+        sum(range(1000))
+
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_sample_mode_writes_breakdown(tmp_path) -> None:
+    path = tmp_path / 'run.json'
+
+    with profiling(path, mode='sample', interval=0.001):
+        time.sleep(0.05)
+
+    summary = json.loads(path.read_text(encoding='utf-8'))
+    assert summary and all('busy_share' in stats for stats in summary.values())
+
+
+def test_no_path_profiles_nothing(tmp_path) -> None:
+    with profiling(None):
+        pass
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,115 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import pytest
+
+from src.logs.tracing import (
+    JsonLinesExporter,
+    Span,
+    Tracer,
+    exporting_spans,
+    get_tracer,
+)
+
+
+@pytest.fixture
+def tracer_and_spans() -> tuple[Tracer, list[Span]]:
+    tracer = Tracer()
+    spans: list[Span] = []
+    tracer.add_exporter(spans.append)
+    return tracer, spans
+
+
+def test_nested_spans_share_trace_and_link_parent(tracer_and_spans) -> None:
+    tracer, spans = tracer_and_spans
+
+    with tracer.span('outer') as outer:
+        with tracer.span('inner', kind='client', route='/x') as inner:
+            inner.set(status=200)
+
+    assert [span.name for span in spans] == ['inner', 'outer']
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert inner.attributes == {'route': '/x', 'status': 200}
+    assert outer.duration_ms >= inner.duration_ms >= 0
+
+
+def test_span_records_error_and_reraises(tracer_and_spans) -> None:
+    tracer, spans = tracer_and_spans
+
+    with pytest.raises(ValueError):
+        with tracer.span('failing'):
+            raise ValueError('boom')
+
+    assert spans[0].error == 'ValueError'
+    assert spans[0].to_otel()['status'] == {
+        'code': 2,
+        'message': 'ValueError',
+    }
+
+
+def test_copied_context_keeps_parent_across_threads(tracer_and_spans) -> None:
+    tracer, spans = tracer_and_spans
+
+    def work() -> None:
+        with tracer.span('child'):
+            pass
+
+    with tracer.span('parent') as parent:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(copy_context().run, work).result()
+
+    assert spans[0].parent_id == parent.span_id
+
+
+def test_otel_record_shape(tracer_and_spans) -> None:
+    tracer, spans = tracer_and_spans
+
+    with tracer.span('http', kind='client', code=200, ok=True, ms=1.5):
+        pass
+
+    record = spans[0].to_otel()
+
+    assert len(record['traceId']) == 32 and len(record['spanId']) == 16
+    assert record['kind'] == 3
+    assert record['parentSpanId'] == ''
+    assert int(record['endTimeUnixNano']) >= int(record['startTimeUnixNano'])
+    assert record['attributes'] == [
+        {'key': 'code', 'value': {'intValue': '200'}},
+        {'key': 'ok', 'value': {'boolValue': True}},
+        {'key': 'ms', 'value': {'doubleValue': 1.5}},
+    ]
+
+
+@pytest.mark.parametrize(
+    'span_format, key', [('json', 'name'), ('otel', 'spanId')]
+)
+def test_json_lines_exporter(span_format, key) -> None:
+    tracer = Tracer()
+    stream = io.StringIO()
+    tracer.add_exporter(JsonLinesExporter(stream, span_format))
+
+    with tracer.span('a'):
+        pass
+    with tracer.span('b'):
+        pass
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) == 2 and all(key in line for line in lines)
+
+
+def test_exporting_spans_appends_to_file_and_detaches(tmp_path) -> None:
+    path = tmp_path / 'spans.jsonl'
+
+    with exporting_spans(path):
+        with get_tracer().span('inside'):
+            pass
+
+    with get_tracer().span('outside'):
+        pass
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)['name'] for line in lines] == ['inside']
@@ -0,0 +1,94 @@
+import pytest
+from hypothesis import given
+
+from src.models.issue_table import IssueTable, split_issue_key
+from src.models.jira_issue import JiraIssue, JiraIssueRecord
+from tests.strategies.shared import cleaned_string
+
+
+def make_issues(count: int) -> list[JiraIssueRecord]:
+    statuses = ('To Do', 'In Progress', 'Code Review')
+    return [
+        JiraIssueRecord(
+            f'JIRA-{n}', 'Story', statuses[n % 3], f'Story {n} – détails'
+        )
+        for n in range(count)
+    ]
+
+
+# Rows should read back exactly as they were appended
+def test_issue_table_round_trips_rows() -> None:
+    issues = make_issues(10)
+    table = IssueTable(issues)
+
+    assert len(table) == 10
+    assert list(table) == issues
+    assert table[-1] == issues[-1]
+    assert list(table.keys()) == [issue.key for issue in issues]
+
+
+# Validated models should be accepted alongside records
+def test_issue_table_accepts_jira_issue_models() -> None:
+    issue = JiraIssue(key='KEY-7', type='Bug', status='Open', summary='Fix')
+
+    assert list(IssueTable([issue])) == [
+        JiraIssueRecord('KEY-7', 'Bug', 'Open', 'Fix')
+    ]
+
+
+def test_issue_table_index_out_of_range() -> None:
+    with pytest.raises(IndexError):
+        IssueTable(make_issues(2))[2]
+
+
+# Filtering by status should keep order and support exclusion
+def test_issue_table_filters_by_status() -> None:
+    table = IssueTable(make_issues(9))
+
+    in_review = table.with_status(['Code Review', 'Unknown'])
+    not_started = table.with_status(['To Do'], exclude=True)
+
+    assert [issue.key for issue in in_review] == ['JIRA-2', 'JIRA-5', 'JIRA-8']
+    assert len(not_started) == 6
+    assert all(issue.status != 'To Do' for issue in not_started)
+    assert not_started[0] == table[1]
+
+
+# Keys should slice into transfer batches of at most 50
+def test_issue_table_key_batches() -> None:
+    batches = list(IssueTable(make_issues(120)).key_batches())
+
+    assert [len(batch) for batch in batches] == [50, 50, 20]
+    assert batches[-1][-1] == 'JIRA-119'
+
+
+# Repeated values should be stored once, not per issue
+def test_issue_table_interns_repeated_values() -> None:
+    table = IssueTable(make_issues(1_000))
+
+    assert len(table._types) == 1
+    assert len(table._statuses) == 3
+    assert len(table._prefixes) == 1
+    assert table.nbytes < 1_000 * 48
+
+
+@pytest.mark.parametrize(
+    'key, expected',
+    [
+        ('JIRA-0', ('JIRA-', 1)),
+        ('AB-12-34', ('AB-12-', 35)),
+        ('JIRA-007', ('JIRA-007', 0)),
+        ('LEGACY', ('LEGACY', 0)),
+        ('JIRA-99999999999', ('JIRA-99999999999', 0)),
+    ],
+)
+def test_split_issue_key(key: str, expected: tuple[str, int]) -> None:
+    assert split_issue_key(key) == expected
+
+
+# Any key should read back unchanged, whether or not it splits
+@given(cleaned_string())
+def test_issue_table_preserves_any_key(key: str) -> None:
+    table = IssueTable([JiraIssueRecord(key, 'Bug', 'Open', '')])
+
+    assert table.key(0) == key
@@ -54,3 +54,21 @@ def test_jira_issue_rejects_blank_or_missing_fields(
         JiraIssue(**invalid_data)
 
     assert field in str(error.value)
+
+
+# A raw Jira issue should validate through its nested field paths
+def test_jira_issue_validates_raw_response_shape() -> None:
+    raw = {
+        'key': 'ISSUE-1',
+        'fields': {
+            'summary': ' Something broke ',
+            'status': {'name': 'Open'},
+            'issuetype': {'name': 'Bug'},
+        },
+    }
+
+    issue = JiraIssue.model_validate(raw)
+
+    assert issue == JiraIssue(
+        key='ISSUE-1', type='Bug', status='Open', summary='Something broke'
+    )
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from typing import cast
+from unittest.mock import MagicMock
+
+from _pytest.logging import LogCaptureFixture
+from pydantic import HttpUrl
+
+from src.exceptions.phase_aborted import PhaseAborted
+from src.models.board_config import BoardConfig
+from src.orchestration.multi_board import run_board, run_boards
+from src.transport import retry
+from src.transport.retry import DEFAULT_RETRY_BUDGET
+from tests.utils.patch_helper import make_base_path
+
+base_path = make_base_path('src.orchestration.multi_board')
+
+
+def make_boards(count: int) -> list[BoardConfig]:
+    return [
+        BoardConfig(
+            base_url=cast(HttpUrl, 'https://mock.net'),
+            board_id=board_id,
+            board_name=f'Board {board_id}',
+        )
+        for board_id in range(1, count + 1)
+    ]
+
+
+def test_failing_board_does_not_stop_the_others(
+    monkeypatch, caplog: LogCaptureFixture
+) -> None:
+    def automate_sprint(_session, config):
+        if config.board_id == 2:
+            raise RuntimeError('Jira unavailable')
+        if config.board_id == 3:
+            raise SystemExit('Transfer process aborted.')
+
+    monkeypatch.setattr(base_path('automate_sprint'), automate_sprint)
+
+    with caplog.at_level(logging.INFO):
+        results = run_boards(MagicMock(), make_boards(4), max_workers=2)
+
+    assert [result.board_id for result in results] == [1, 2, 3, 4]
+    assert [result.succeeded for result in results] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert results[1].error == 'Jira unavailable'
+    assert results[2].error == 'Transfer process aborted.'
+    assert '2 succeeded, 2 failed' in caplog.text
+
+
+def test_boards_share_the_session_and_run_concurrently(monkeypatch) -> None:
+    session = MagicMock()
+    seen_sessions = []
+    lock = threading.Lock()
+    in_flight = {'now': 0, 'peak': 0}
+
+    def automate_sprint(used_session, _config):
+        with lock:
+            seen_sessions.append(used_session)
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        time.sleep(0.05)
+        with lock:
+            in_flight['now'] -= 1
+
+    monkeypatch.setattr(base_path('automate_sprint'), automate_sprint)
+
+    run_boards(session, make_boards(6), max_workers=3)
+
+    assert all(used is session for used in seen_sessions)
+    assert 1 < in_flight['peak'] <= 3
+
+
+def test_run_board_records_success(monkeypatch) -> None:
+    monkeypatch.setattr(base_path('automate_sprint'), lambda *_: None)
+
+    result = run_board(MagicMock(), make_boards(1)[0])
+
+    assert result.succeeded and result.error is None
+    assert result.board_name == 'Board 1'
+
+
+def test_run_board_records_an_aborted_phase_as_failed(monkeypatch) -> None:
+    def automate_sprint(_session, _config):
+        raise PhaseAborted('start', 'Failed to start sprint DART.')
+
+    monkeypatch.setattr(base_path('automate_sprint'), automate_sprint)
+
+    result = run_board(MagicMock(), make_boards(1)[0])
+
+    assert not result.succeeded
+    assert result.error == "Phase 'start' aborted: Failed to start sprint DART."
+
+
+def test_concurrent_boards_log_in_unbroken_blocks(
+    monkeypatch, caplog: LogCaptureFixture
+) -> None:
+    def automate_sprint(_session, config):
+        logging.info(f'::group::{config.board_name}')
+        time.sleep(0.02)
+        logging.info(f'{config.board_name} done')
+        logging.info('::endgroup::')
+
+    monkeypatch.setattr(base_path('automate_sprint'), automate_sprint)
+
+    with caplog.at_level(logging.INFO):
+        run_boards(MagicMock(), make_boards(4), max_workers=4)
+
+    lines = caplog.messages[:12]
+    for start in range(0, 12, 3):
+        name = lines[start].removeprefix('::group::')
+        assert lines[start + 1:start + 3] == [f'{name} done', '::endgroup::']
+
+
+def test_each_board_gets_its_own_retry_budget(monkeypatch) -> None:
+    budgets = []
+
+    def automate_sprint(_session, _config):
+        budgets.append(retry._scoped_budget.get())
+
+    monkeypatch.setattr(base_path('automate_sprint'), automate_sprint)
+
+    run_boards(MagicMock(), make_boards(3), max_workers=3)
+
+    assert len({id(budget) for budget in budgets}) == 3
+    assert all(budget.remaining == DEFAULT_RETRY_BUDGET for budget in budgets)
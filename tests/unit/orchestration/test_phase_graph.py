@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from src.orchestration.phase_graph import Phase, run_phase_graph
+
+
+def test_results_flow_to_dependents() -> None:
+    phases = [
+        Phase('a', lambda _: 1),
+        Phase('b', lambda done: done['a'] + 1, ('a',)),
+        Phase('c', lambda done: done['a'] + done['b'], ('a', 'b')),
+    ]
+
+    assert run_phase_graph(phases) == {'a': 1, 'b': 2, 'c': 3}
+
+
+def test_dependents_only_see_their_dependencies() -> None:
+    seen = {}
+
+    def record(done: dict) -> None:
+        seen.update(done)
+
+    run_phase_graph([
+        Phase('a', lambda _: 'a'),
+        Phase('b', lambda _: 'b'),
+        Phase('c', record, ('b',)),
+    ])
+
+    assert seen == {'b': 'b'}
+
+
+def test_independent_phases_overlap() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet(_: dict) -> bool:
+        barrier.wait()
+        return True
+
+    results = run_phase_graph([
+        Phase('left', meet),
+        Phase('right', meet),
+    ])
+
+    assert results == {'left': True, 'right': True}
+
+
+def test_dependent_waits_for_dependency() -> None:
+    order = []
+
+    def step(name: str):
+        return lambda _: order.append(name)
+
+    run_phase_graph([
+        Phase('start', step('start'), ('move',)),
+        Phase('close', step('close')),
+        Phase('move', step('move'), ('close',)),
+    ])
+
+    assert order == ['close', 'move', 'start']
+
+
+def test_failure_stops_dependents_and_is_raised() -> None:
+    ran = []
+
+    def boom(_: dict) -> None:
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        run_phase_graph([
+            Phase('a', boom),
+            Phase('b', lambda _: ran.append('b'), ('a',)),
+        ])
+
+    assert ran == []
+
+
+def test_rejects_unknown_dependency() -> None:
+    with pytest.raises(ValueError, match='unknown phases: missing'):
+        run_phase_graph([Phase('a', lambda _: None, ('missing',))])
+
+
+def test_rejects_cycles() -> None:
+    with pytest.raises(ValueError, match='cycle: a, b'):
+        run_phase_graph([
+            Phase('a', lambda _: None, ('b',)),
+            Phase('b', lambda _: None, ('a',)),
+        ])
+
+
+def test_rejects_duplicate_names() -> None:
+    with pytest.raises(ValueError, match='unique'):
+        run_phase_graph([
+            Phase('a', lambda _: None),
+            Phase('a', lambda _: None),
+        ])
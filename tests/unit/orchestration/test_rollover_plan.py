@@ -0,0 +1,295 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+
+from src.exceptions.pagination_error import PaginationError
+from src.exceptions.phase_aborted import PhaseAborted
+from src.exceptions.rollover_plan_error import RolloverPlanError
+from src.models.board_sprint_snapshot import BoardSprintSnapshot
+from src.models.issue_table import IssueTable
+from src.models.jira_issue import JiraIssue
+from src.models.rollover_plan import PlannedSprint, RolloverPlan
+from src.orchestration.rollover_plan import (
+    commit_boards,
+    commit_rollover,
+    prepare_boards,
+    prepare_rollover,
+    read_plan_file,
+    write_plan_file,
+)
+from tests.utils.patch_helper import make_base_path
+from tests.utils.simple_lambda_return import lambda_return
+
+base_path = make_base_path('src.orchestration.rollover_plan')
+orchestration_path = make_base_path('src.orchestration.sprint_orchestration')
+
+DAY = date(2025, 7, 28)
+ACTIVE = {
+    'id': 99,
+    'name': 'DART 250714 (07/14-07/28)',
+    'state': 'active',
+    'startDate': '2025-07-14',
+    'endDate': '2025-07-28',
+    'originBoardId': 123,
+}
+TARGET = {'id': 42, 'name': 'DART 250728 (07/28-08/11)'}
+SNAPSHOT = BoardSprintSnapshot(active=ACTIVE, future_by_start={DAY: TARGET})
+RAW_ISSUE = {
+    'key': 'JIRA-1',
+    'fields': {
+        'summary': 'Summary',
+        'status': {'name': 'To Do'},
+        'issuetype': {'name': 'Story'},
+    },
+}
+
+
+def make_plan(**overrides) -> RolloverPlan:
+    fields = {
+        'board_id': 123,
+        'rollover_day': DAY,
+        'prepared_at': datetime(2025, 7, 27, 18),
+        'active_sprint': PlannedSprint(**ACTIVE),
+        'target_sprint': PlannedSprint(**TARGET),
+        'key_batches': [['JIRA-1']],
+    }
+    return RolloverPlan(**(fields | overrides))
+
+
+def make_table(*keys: str) -> IssueTable:
+    return IssueTable(
+        JiraIssue(key=key, type='Story', status='To Do', summary='Summary')
+        for key in keys
+    )
+
+
+def patch_writes(monkeypatch) -> dict[str, MagicMock]:
+    mocks = {
+        name: MagicMock()
+        for name in ('close_sprint', 'move_key_batches', 'start_sprint')
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(base_path(name), mock)
+    return mocks
+
+
+@freeze_time('2025-07-27 18:00')
+def test_prepare_reads_ahead_without_writing(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    close_sprint = MagicMock()
+    get_snapshot = MagicMock(return_value=SNAPSHOT)
+    monkeypatch.setattr(
+        orchestration_path('get_board_sprint_snapshot'), get_snapshot
+    )
+    monkeypatch.setattr(
+        orchestration_path('iter_incomplete_stories'),
+        lambda_return(iter([RAW_ISSUE])),
+    )
+    monkeypatch.setattr(orchestration_path('close_sprint'), close_sprint)
+
+    plan = prepare_rollover(test_session, test_config, DAY)
+
+    assert plan.rollover_day == DAY
+    assert plan.active_sprint.id == 99
+    assert plan.target_sprint == PlannedSprint(**TARGET)
+    assert plan.key_batches == [['JIRA-1']]
+    close_sprint.assert_not_called()
+    # Commit revalidates the plan, so prepare may read a fresh cache entry.
+    assert get_snapshot.call_args.args[-1] is False
+
+
+@freeze_time('2025-07-28 09:00')
+def test_commit_revalidates_then_writes(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        base_path('get_board_sprint_snapshot'), lambda_return(SNAPSHOT)
+    )
+    monkeypatch.setattr(
+        base_path('collect_incomplete_issues'),
+        lambda_return(make_table('JIRA-1')),
+    )
+    writes = patch_writes(monkeypatch)
+
+    commit_rollover(test_session, test_config, make_plan())
+
+    writes['close_sprint'].assert_called_once()
+    writes['move_key_batches'].assert_called_once_with(
+        [['JIRA-1']], test_session, test_config.base_url, 42
+    )
+    writes['start_sprint'].assert_called_once()
+
+
+@freeze_time('2025-07-28 09:00')
+def test_commit_moves_the_current_incomplete_issues(
+        test_session,
+        test_config,
+        monkeypatch,
+        caplog
+) -> None:
+    events = []
+    monkeypatch.setattr(
+        base_path('get_board_sprint_snapshot'), lambda_return(SNAPSHOT)
+    )
+    monkeypatch.setattr(
+        base_path('collect_incomplete_issues'),
+        lambda *_: events.append('list') or make_table('JIRA-1', 'JIRA-3'),
+    )
+    writes = patch_writes(monkeypatch)
+    writes['close_sprint'].side_effect = (
+        lambda *_: events.append('close') or True
+    )
+
+    commit_rollover(
+        test_session, test_config, make_plan(key_batches=[['JIRA-1', 'JIRA-2']])
+    )
+
+    assert events == ['list', 'close']
+    assert writes['move_key_batches'].call_args.args[0] == [
+        ['JIRA-1', 'JIRA-3']
+    ]
+    assert 'no longer incomplete and stay put: JIRA-2' in caplog.text
+    assert 'will move too: JIRA-3' in caplog.text
+
+
+@freeze_time('2025-07-28 09:00')
+def test_failed_relist_leaves_the_sprint_open(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    def failing_stream(*_args, **_kwargs):
+        raise PaginationError('retrieving issues', 50)
+        yield
+
+    monkeypatch.setattr(
+        base_path('get_board_sprint_snapshot'), lambda_return(SNAPSHOT)
+    )
+    monkeypatch.setattr(
+        orchestration_path('iter_incomplete_stories'), failing_stream
+    )
+    writes = patch_writes(monkeypatch)
+
+    with pytest.raises(PhaseAborted, match='Could not list incomplete'):
+        commit_rollover(test_session, test_config, make_plan())
+
+    for mock in writes.values():
+        mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    'snapshot, plan_overrides, message',
+    [
+        (SNAPSHOT, {'rollover_day': date(2025, 7, 29)}, 'not today'),
+        (SNAPSHOT, {'board_id': 7}, 'board 7'),
+        (
+            SNAPSHOT._replace(active=ACTIVE | {'id': 100}),
+            {},
+            'Active sprint changed',
+        ),
+        (
+            SNAPSHOT._replace(future_by_start={}),
+            {},
+            'no longer a future sprint',
+        ),
+    ],
+)
+@freeze_time('2025-07-28 09:00')
+def test_stale_plan_writes_nothing(
+        test_session,
+        test_config,
+        monkeypatch,
+        snapshot,
+        plan_overrides,
+        message
+) -> None:
+    monkeypatch.setattr(
+        base_path('get_board_sprint_snapshot'), lambda_return(snapshot)
+    )
+    writes = patch_writes(monkeypatch)
+
+    with pytest.raises(RolloverPlanError, match=message):
+        commit_rollover(test_session, test_config, make_plan(**plan_overrides))
+
+    for mock in writes.values():
+        mock.assert_not_called()
+
+
+def test_plan_file_round_trip(tmp_path) -> None:
+    path = tmp_path / 'plan.json'
+    plans = [make_plan(board_id=2), make_plan(board_id=1)]
+
+    write_plan_file(path, plans)
+
+    assert read_plan_file(path) == {1: plans[1], 2: plans[0]}
+
+
+def test_missing_plan_file(tmp_path) -> None:
+    with pytest.raises(RolloverPlanError, match='No rollover plan'):
+        read_plan_file(tmp_path / 'missing.json')
+
+
+def test_invalid_plan_file(tmp_path) -> None:
+    path = tmp_path / 'plan.json'
+    path.write_text('{"plans": [{"board_id": 1}]}', encoding='utf-8')
+
+    with pytest.raises(RolloverPlanError, match='Invalid rollover plan'):
+        read_plan_file(path)
+
+
+def test_prepare_then_commit_boards(
+        test_session,
+        test_config,
+        monkeypatch,
+        tmp_path
+) -> None:
+    path = tmp_path / 'plan.json'
+    other_board = test_config.model_copy(update={'board_id': 456})
+    commit = MagicMock()
+
+    monkeypatch.setattr(
+        base_path('prepare_rollover'),
+        lambda _session, config, _day: make_plan(board_id=config.board_id),
+    )
+    monkeypatch.setattr(base_path('commit_rollover'), commit)
+
+    prepared = prepare_boards(test_session, [test_config], 2, path)
+    committed = commit_boards(
+        test_session, [test_config, other_board], 2, path
+    )
+
+    assert [result.succeeded for result in prepared] == [True]
+    assert [result.succeeded for result in committed] == [True, False]
+    assert 'No prepared plan for board 456' in committed[1].error
+    commit.assert_called_once()
+
+
+def test_prepare_keeps_earlier_entries_for_failed_boards(
+        test_session,
+        test_config,
+        monkeypatch,
+        tmp_path
+) -> None:
+    path = tmp_path / 'plan.json'
+    other_board = test_config.model_copy(update={'board_id': 456})
+    earlier = make_plan(board_id=456, key_batches=[['JIRA-9']])
+    write_plan_file(path, [earlier])
+
+    def prepare(_session, config, _day):
+        if config.board_id == 456:
+            raise RuntimeError('Jira unavailable')
+        return make_plan(board_id=config.board_id)
+
+    monkeypatch.setattr(base_path('prepare_rollover'), prepare)
+
+    results = prepare_boards(test_session, [test_config, other_board], 2, path)
+
+    assert [result.succeeded for result in results] == [True, False]
+    assert read_plan_file(path) == {123: make_plan(), 456: earlier}
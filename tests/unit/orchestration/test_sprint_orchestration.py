@@ -1,15 +1,24 @@
 import logging
-from datetime import datetime
+from datetime import date
 from unittest.mock import MagicMock
 
+import pytest
 from freezegun import freeze_time
 
-from src.orchestration.sprint_orchestration import automate_sprint
+from src.exceptions.pagination_error import PaginationError
+from src.exceptions.phase_aborted import PhaseAborted
+from src.models.board_sprint_snapshot import BoardSprintSnapshot
+from src.orchestration.sprint_orchestration import (
+    automate_sprint,
+    collect_incomplete_issues,
+)
 from tests.utils.patch_helper import make_base_path
 from tests.utils.simple_lambda_return import lambda_return
 
 base_path = make_base_path('src.orchestration.sprint_orchestration')
 
+EMPTY_SNAPSHOT = BoardSprintSnapshot(active=None, future_by_start={})
+
 
 # Helper function to avoid writing 'monkeypatch.attr' multiple times per test
 def patch_all(monkeypatch, **target_name_pairs) -> None:
@@ -26,10 +35,9 @@ def test_create_new_sprint_if_none_found(
 
     patch_all(
         monkeypatch,
-        get_all_future_sprints=lambda_return([]),
+        get_board_sprint_snapshot=lambda_return(EMPTY_SNAPSHOT),
         create_sprint=create_sprint_mock,
-        get_sprint_by_state=lambda_return(None),
-        start_sprint=lambda_return(None),
+        start_sprint=lambda_return(True),
     )
 
     automate_sprint(test_session, test_config)
@@ -43,17 +51,18 @@ def test_uses_existing_dart_sprint(
         monkeypatch,
         caplog
 ) -> None:
-    sprint_date = MagicMock(start=datetime(2025, 7, 28))
     sprint_name = 'DART 250728 (07/28-08/11)'
-
-    future_sprints = [{'name': sprint_name, 'id': 42}]
+    snapshot = BoardSprintSnapshot(
+        active=None,
+        future_by_start={date(2025, 7, 28): {'name': sprint_name, 'id': 42}},
+    )
+    create_sprint = MagicMock()
 
     patch_all(
         monkeypatch,
-        get_all_future_sprints=lambda_return(future_sprints),
-        parse_dart_sprint=lambda name: sprint_date,
-        get_sprint_by_state=lambda_return(None),
-        start_sprint=lambda_return(None),
+        get_board_sprint_snapshot=lambda_return(snapshot),
+        create_sprint=create_sprint,
+        start_sprint=lambda_return(True),
     )
 
     with caplog.at_level(logging.INFO):
@@ -61,6 +70,7 @@ def test_uses_existing_dart_sprint(
 
     assert f'Upcoming DART sprint found: {sprint_name}.' in caplog.text
     assert 'Proceeding with automation process.' in caplog.text
+    create_sprint.assert_not_called()
 
 
 def test_skips_closing_if_no_active_sprint(
@@ -71,10 +81,9 @@ def test_skips_closing_if_no_active_sprint(
 
     patch_all(
         monkeypatch,
-        get_all_future_sprints=lambda_return([]),
+        get_board_sprint_snapshot=lambda_return(EMPTY_SNAPSHOT),
         create_sprint=lambda_return({'id': 123, 'name': 'NewSprint'}),
-        get_sprint_by_state=lambda_return(None),
-        start_sprint=lambda_return(None),
+        start_sprint=lambda_return(True),
     )
 
     automate_sprint(test_session, test_config)
@@ -90,12 +99,45 @@ def test_returns_early_if_create_sprint_fails(
 
     patch_all(
         monkeypatch,
-        get_all_future_sprints=lambda_return([]),
+        get_board_sprint_snapshot=lambda_return(EMPTY_SNAPSHOT),
         create_sprint=lambda_return(None),
         start_sprint=start_sprint,
     )
 
-    automate_sprint(test_session, test_config)
+    with pytest.raises(PhaseAborted, match='Failed to create new sprint'):
+        automate_sprint(test_session, test_config)
+    start_sprint.assert_not_called()
+
+
+def test_failed_create_leaves_active_sprint_open(
+        test_session,
+        test_config,
+        monkeypatch,
+        caplog
+) -> None:
+    active_sprint = {
+        'id': 99,
+        'name': 'DART 250101 (01/01-01/15)',
+        'startDate': '2025-01-01',
+        'endDate': '2025-01-15',
+    }
+    close_sprint = MagicMock()
+
+    patch_all(
+        monkeypatch,
+        get_board_sprint_snapshot=lambda_return(
+            BoardSprintSnapshot(active=active_sprint, future_by_start={})
+        ),
+        create_sprint=lambda_return(None),
+        iter_incomplete_stories=lambda_return(iter([])),
+        close_sprint=close_sprint,
+    )
+
+    with caplog.at_level(logging.ERROR), pytest.raises(PhaseAborted):
+        automate_sprint(test_session, test_config)
+
+    close_sprint.assert_not_called()
+    assert 'Failed to create new sprint.' in caplog.text
 
 
 def test_full_orchestration_path(
@@ -104,6 +146,15 @@ def test_full_orchestration_path(
         monkeypatch
 ) -> None:
     new_sprint = {'id': 12, 'name': 'DART 241218 (12/18-01/01)'}
+    raw_issue = {
+        'key': 'JIRA-1',
+        'fields': {
+            'summary': 'Summary',
+            'status': {'name': 'To Do'},
+            'issuetype': {'name': 'Story'},
+        },
+    }
+    move_key_batches = MagicMock()
     active_sprint = {
         'id': 99,
         'name': 'DART 250101 (01/01-01/15)',
@@ -113,14 +164,135 @@ def test_full_orchestration_path(
 
     patch_all(
         monkeypatch,
-        get_all_future_sprints=lambda_return([]),
+        get_board_sprint_snapshot=lambda_return(
+            BoardSprintSnapshot(active=active_sprint, future_by_start={})
+        ),
         create_sprint=lambda_return(new_sprint),
-        get_sprint_by_state=lambda_return(active_sprint),
-        get_incomplete_stories=lambda_return([{'key': 'JIRA-1'}]),
-        parse_issue=(lambda issue: {'key': issue['key'], 'fields': {}}),
-        close_sprint=lambda_return(None),
-        move_issues_to_new_sprint=lambda_return(None),
-        start_sprint=lambda_return(None),
+        iter_incomplete_stories=lambda_return(iter([raw_issue])),
+        close_sprint=lambda_return(True),
+        move_key_batches=move_key_batches,
+        start_sprint=lambda_return(True),
     )
 
     automate_sprint(test_session, test_config)
+
+    move_key_batches.assert_called_once()
+    batches, *args = move_key_batches.call_args.args
+    assert list(batches) == [['JIRA-1']]
+    assert args == [test_session, test_config.base_url, 12]
+
+
+def test_failed_close_aborts_before_moving(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    move_key_batches = MagicMock()
+    start_sprint = MagicMock()
+
+    patch_all(
+        monkeypatch,
+        get_board_sprint_snapshot=lambda_return(
+            BoardSprintSnapshot(
+                active={
+                    'id': 99,
+                    'name': 'DART 250101 (01/01-01/15)',
+                    'startDate': '2025-01-01',
+                    'endDate': '2025-01-15',
+                },
+                future_by_start={},
+            )
+        ),
+        create_sprint=lambda_return({'id': 12, 'name': 'NewSprint'}),
+        iter_incomplete_stories=lambda_return(iter([])),
+        close_sprint=lambda_return(False),
+        move_key_batches=move_key_batches,
+        start_sprint=start_sprint,
+    )
+
+    with pytest.raises(PhaseAborted, match='Failed to close sprint'):
+        automate_sprint(test_session, test_config)
+
+    move_key_batches.assert_not_called()
+    start_sprint.assert_not_called()
+
+
+def test_failed_start_aborts_the_run(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    patch_all(
+        monkeypatch,
+        get_board_sprint_snapshot=lambda_return(EMPTY_SNAPSHOT),
+        create_sprint=lambda_return({'id': 12, 'name': 'NewSprint'}),
+        start_sprint=lambda_return(False),
+    )
+
+    with pytest.raises(PhaseAborted, match='Failed to start sprint'):
+        automate_sprint(test_session, test_config)
+
+
+def test_incomplete_stories_stream_into_issue_table(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    raw_issues = (
+        {
+            'key': f'JIRA-{n}',
+            'fields': {
+                'summary': 'Summary',
+                'status': {'name': 'To Do'},
+                'issuetype': {'name': 'Story'},
+            },
+        }
+        for n in range(120)
+    )
+
+    patch_all(
+        monkeypatch,
+        iter_incomplete_stories=lambda_return(raw_issues),
+    )
+
+    issues = collect_incomplete_issues(99, test_session, test_config)
+    batches = list(issues.key_batches())
+
+    assert len(issues) == 120
+    assert [len(batch) for batch in batches] == [50, 50, 20]
+    assert batches[0][0] == 'JIRA-0' and batches[-1][-1] == 'JIRA-119'
+
+
+def test_failed_issue_listing_leaves_the_sprint_open(
+        test_session,
+        test_config,
+        monkeypatch
+) -> None:
+    def failing_stream(*_args, **_kwargs):
+        raise PaginationError('retrieving issues', 50)
+        yield
+
+    close_sprint = MagicMock()
+
+    patch_all(
+        monkeypatch,
+        get_board_sprint_snapshot=lambda_return(
+            BoardSprintSnapshot(
+                active={
+                    'id': 99,
+                    'name': 'DART 250101 (01/01-01/15)',
+                    'startDate': '2025-01-01',
+                    'endDate': '2025-01-15',
+                },
+                future_by_start={},
+            )
+        ),
+        create_sprint=lambda_return({'id': 12, 'name': 'NewSprint'}),
+        iter_incomplete_stories=failing_stream,
+        close_sprint=close_sprint,
+    )
+
+    with pytest.raises(PhaseAborted, match='Could not list incomplete'):
+        automate_sprint(test_session, test_config)
+
+    close_sprint.assert_not_called()
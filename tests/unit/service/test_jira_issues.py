@@ -5,8 +5,17 @@ from hypothesis import given
 from hypothesis.strategies import text, one_of, sampled_from, lists, just
 from pydantic import HttpUrl
 
+from src.exceptions.pagination_error import PaginationError
 from src.models.board_config import BoardConfig
-from src.services.jira_issues import DONE_STATUSES, get_incomplete_stories
+from src.services.jira_issues import (
+    DONE_STATUSES,
+    ISSUE_FIELDS,
+    SEARCH_JQL,
+    build_issue_page_params,
+    build_sprint_search_jql,
+    get_incomplete_stories,
+    iter_incomplete_stories,
+)
 from tests.utils.patch_helper import make_base_path
 
 
@@ -155,3 +164,119 @@ def test_stops_fetching_when_results_less_than_max(
 
     called_params = mock_session.get.call_args.kwargs['params']
     assert called_params['startAt'] == 0
+
+
+def test_default_page_params_request_all_fields() -> None:
+    params = build_issue_page_params(50, 50, server_side_filter=False)
+
+    assert params == {'startAt': 50, 'maxResults': 50}
+
+
+def test_server_side_filter_sends_jql_and_field_projection(
+    mock_session: MagicMock, mock_config: BoardConfig
+) -> None:
+    mock_session.get.return_value.json.return_value = {
+        'issues': [{'fields': {'status': {'name': 'To Do'}}}]
+    }
+
+    with patch(base_path('handle_api_error'), return_value=True):
+        result = get_incomplete_stories(
+            5, mock_config, mock_session, server_side_filter=True
+        )
+
+    params = mock_session.get.call_args.kwargs['params']
+    assert len(result) == 1
+    assert params['fields'] == ISSUE_FIELDS
+    assert params['jql'].startswith('status not in (')
+    assert all(f'"{status}"' in params['jql'] for status in DONE_STATUSES)
+
+
+def test_fetches_remaining_pages_concurrently_when_total_known(
+    mock_session: MagicMock, mock_config: BoardConfig
+) -> None:
+    def get(_url, params, **_kwargs):
+        start_at = params['startAt']
+        issues = [
+            {'key': f'K-{n}', 'fields': {'status': {'name': 'To Do'}}}
+            for n in range(start_at, min(start_at + 50, 120))
+        ]
+        return MagicMock(json=lambda: {'issues': issues, 'total': 120})
+
+    mock_session.get.side_effect = get
+
+    with patch(base_path('handle_api_error'), return_value=True):
+        result = get_incomplete_stories(
+            1, mock_config, mock_session, max_workers=3
+        )
+
+    assert [issue['key'] for issue in result] == [
+        f'K-{n}' for n in range(120)
+    ]
+    assert mock_session.get.call_count == 3
+
+
+def test_iter_incomplete_stories_fetches_pages_on_demand(
+    mock_session: MagicMock, mock_config: BoardConfig
+) -> None:
+    page = {'issues': [{'fields': {'status': {'name': 'To Do'}}}] * 50}
+    mock_session.get.return_value = MagicMock(json=lambda: page)
+
+    with patch(base_path('handle_api_error'), return_value=True):
+        stream = iter_incomplete_stories(3, mock_config, mock_session)
+        first = next(stream)
+
+        assert first == page['issues'][0]
+        assert mock_session.get.call_count == 1
+        stream.close()
+
+
+def test_iter_incomplete_stories_raises_on_api_error(
+    mock_session: MagicMock, mock_config: BoardConfig
+) -> None:
+    with (
+        patch(base_path('handle_api_error'), return_value=False),
+        pytest.raises(PaginationError),
+    ):
+        list(iter_incomplete_stories(3, mock_config, mock_session))
+
+
+def test_cursor_backend_walks_tokens_and_dedupes_by_key(
+    mock_session: MagicMock, mock_config: BoardConfig
+) -> None:
+    def issue(key: str) -> dict:
+        return {'key': key, 'fields': {'status': {'name': 'To Do'}}}
+
+    mock_session.get.side_effect = [
+        MagicMock(
+            json=lambda: {
+                'issues': [issue('A-1'), issue('A-2')],
+                'nextPageToken': 'next',
+            }
+        ),
+        MagicMock(
+            json=lambda: {
+                'issues': [issue('A-2'), issue('A-3')],
+                'isLast': True,
+            }
+        ),
+    ]
+
+    with patch(base_path('handle_api_error'), return_value=True):
+        result = get_incomplete_stories(
+            8, mock_config, mock_session, backend='cursor'
+        )
+
+    assert [item['key'] for item in result] == ['A-1', 'A-2', 'A-3']
+
+    first_call, second_call = mock_session.get.call_args_list
+    assert first_call.args[0].endswith(SEARCH_JQL)
+    assert 'nextPageToken' not in first_call.kwargs['params']
+    assert second_call.kwargs['params']['nextPageToken'] == 'next'
+    assert second_call.kwargs['params']['fields'] == ISSUE_FIELDS
+
+
+def test_sprint_search_jql_adds_status_filter_on_request() -> None:
+    assert build_sprint_search_jql(4, False) == 'sprint = 4'
+    assert build_sprint_search_jql(4, True).startswith(
+        'sprint = 4 AND status not in ('
+    )
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,8 +12,8 @@ from src.services.jira_sprint import (
     post_sprint_payload,
     parse_json_response,
     create_sprint,
-    get_sprint_by_state,
-    get_all_future_sprints,
+    get_board_sprint_snapshot,
+    iter_board_sprints,
 )
 from tests.strategies.shared import cleaned_string
 from tests.utils.patch_helper import make_base_path
@@ -47,10 +47,10 @@ def test_post_sprint_payload_sends_correct_request():
     session.post.return_value = MagicMock(status_code=200)
 
     payload = MagicMock()
-    payload.model_dump.return_value = {'mock': 'data'}
 
     response = post_sprint_payload(session, 'https://mock/api', payload)
     assert response.status_code == 200
+    session.post.assert_called_once_with('https://mock/api', json=payload)
 
 
 def test_parse_json_response_success():
@@ -78,81 +78,49 @@ def test_parse_json_response_logs_and_returns_none_on_decode_error(caplog):
     assert 'Failed to parse JSON' in caplog.text
 
 
-def test_create_sprint_successfully_returns_parsed_response():
+def test_create_sprint_successfully_returns_parsed_response(test_config):
     session = MagicMock()
     fake_response = MagicMock()
     fake_response.json.lambda_return = {'id': 1, 'self': '...', 'name': 'Sprint'}
     fake_response.json.lambda_return = {'id': 1, 'self': '...', 'name': 'Sprint'}
 
     with (
-        patch(base_path('load_config')) as mock_cfg,
         patch(base_path('handle_api_error'), return_value=True),
         patch(
             base_path('parse_json_response'), return_value='parsed'
         ) as _mock_parse,
-        patch(base_path('post_sprint_payload'), return_value=fake_response),
+        patch(
+            base_path('post_sprint_payload'), return_value=fake_response
+        ) as mock_post,
     ):
-
-        mock_cfg.return_value.board_id = 1
-        mock_cfg.return_value.base_url = 'https://mock'
-
         result = create_sprint(
             'Test Sprint',
             datetime.now(),
             datetime.now() + timedelta(days=14),
             session,
+            test_config,
         )
 
         assert result == 'parsed'
+        _, url, payload = mock_post.call_args.args
+        assert url == f'{test_config.base_url}/rest/agile/1.0/sprint'
+        assert payload.originBoardId == test_config.board_id
 
 
-def test_create_sprint_aborts_on_api_failure():
+def test_create_sprint_aborts_on_api_failure(test_config):
     session = MagicMock()
-    with (
-        patch(base_path('load_config')) as mock_cfg,
-        patch(base_path('handle_api_error'), return_value=False),
-    ):
-
-        mock_cfg.return_value.board_id = 1
-        mock_cfg.return_value.base_url = 'https://mock'
-
+    with patch(base_path('handle_api_error'), return_value=False):
         result = create_sprint(
             'Sprint',
             datetime.now(),
             datetime.now() + timedelta(days=14),
             session,
+            test_config,
         )
         assert result is None
 
 
-def test_get_sprint_by_state_returns_first_result():
-    session = MagicMock()
-    config = MagicMock()
-    config.base_url = 'https://mock'
-    config.board_id = 10
-    session.get.return_value.json.return_value = {'values': ['sprint_1']}
-
-    with patch(base_path('handle_api_error'), return_value=True):
-        result = get_sprint_by_state(session, config, 'active')
-
-        assert result == 'sprint_1'
-
-
-def test_get_sprint_by_state_returns_none_on_error_or_empty():
-    session = MagicMock()
-    config = MagicMock()
-    config.base_url = 'https://mock'
-    config.board_id = 10
-
-    with patch(base_path('handle_api_error'), return_value=False):
-        assert get_sprint_by_state(session, config, 'future') is None
-
-    with patch(base_path('handle_api_error'), return_value=True):
-        session.get.return_value.json.return_value = {'values': []}
-        assert get_sprint_by_state(session, config, 'closed') is None
-
-
-def test_get_all_future_sprints_handles_pagination():
+def test_iter_board_sprints_handles_pagination():
     session = MagicMock()
     config = MagicMock()
     config.board_id = 1
@@ -167,12 +135,28 @@ def test_get_all_future_sprints_handles_pagination():
         ),
     ]
 
-    result = get_all_future_sprints(session, config)
+    result = list(iter_board_sprints(session, config, 'future'))
 
     assert result == ['a', 'b']
 
 
-def test_get_all_future_sprints_raises_on_non_200():
+def test_iter_board_sprints_requests_pages_on_demand():
+    session = MagicMock()
+    config = MagicMock(base_url='https://mock', board_id=1)
+    session.get.return_value = MagicMock(
+        status_code=200,
+        json=lambda: {'values': [{'id': 1}, {'id': 2}], 'isLast': False},
+    )
+
+    sprints = iter_board_sprints(session, config, 'future')
+
+    assert next(sprints) == {'id': 1}
+    assert next(sprints) == {'id': 2}
+    assert session.get.call_count == 1
+    sprints.close()
+
+
+def test_iter_board_sprints_raises_on_non_200():
     session = MagicMock()
     config = MagicMock()
     config.board_id = 1
@@ -185,4 +169,67 @@ def test_get_all_future_sprints_raises_on_non_200():
         expected_exception=RuntimeError,
         match='Error while fetching future ' 'sprints',
     ):
-        get_all_future_sprints(session, config)
+        list(iter_board_sprints(session, config, 'future'))
+
+
+def sprint_page(sprints: list[dict], is_last: bool) -> MagicMock:
+    return MagicMock(
+        status_code=200, json=lambda: {'values': sprints, 'isLast': is_last}
+    )
+
+
+def test_board_snapshot_fetches_active_and_future_in_one_listing():
+    session = MagicMock()
+    config = MagicMock(base_url='https://mock/', board_id=3)
+    active = {'id': 1, 'name': 'Current', 'state': 'active'}
+    dart = {'id': 2, 'name': 'DART 250728 (07/28-08/11)', 'state': 'future'}
+    other = {'id': 3, 'name': 'Backlog grooming', 'state': 'future'}
+    session.get.return_value = sprint_page([active, dart, other], True)
+
+    snapshot = get_board_sprint_snapshot(session, config)
+
+    assert snapshot.active == active
+    assert snapshot.future_by_start == {date(2025, 7, 28): dart}
+    assert snapshot.dart_sprint_starting(date(2025, 7, 28)) == dart
+    session.get.assert_called_once()
+    assert session.get.call_args.args[0] == (
+        'https://mock/rest/agile/1.0/board/3/sprint'
+    )
+    assert session.get.call_args.kwargs['params']['state'] == 'active,future'
+    assert session.get.call_args.kwargs['headers'] == {
+        'Cache-Control': 'no-cache'
+    }
+
+
+def test_board_snapshot_can_skip_revalidation():
+    session = MagicMock()
+    config = MagicMock(base_url='https://mock/', board_id=3)
+    session.get.return_value = sprint_page([], True)
+
+    get_board_sprint_snapshot(session, config, revalidate=False)
+
+    assert session.get.call_args.kwargs['headers'] is None
+
+
+def test_board_snapshot_stops_paging_once_both_sprints_are_known():
+    session = MagicMock()
+    config = MagicMock(base_url='https://mock/', board_id=3)
+    session.get.side_effect = [
+        sprint_page([{'id': 1, 'name': 'Current', 'state': 'active'}], False),
+        sprint_page(
+            [
+                {
+                    'id': 2,
+                    'name': 'DART 250728 (07/28-08/11)',
+                    'state': 'future',
+                }
+            ],
+            False,
+        ),
+        sprint_page([{'id': 3, 'name': 'Later', 'state': 'future'}], True),
+    ]
+
+    snapshot = get_board_sprint_snapshot(session, config, date(2025, 7, 28))
+
+    assert snapshot.active['id'] == 1
+    assert session.get.call_count == 2
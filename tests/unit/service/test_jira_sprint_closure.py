@@ -34,7 +34,6 @@ def test_close_sprint_success_logs_expected_messages(
         caplog.at_level(logging.INFO),
     ):
         payload_mock = MagicMock()
-        payload_mock.model_dump.lambda_return = {'mock': 'data'}
         mock_builder.return_value = payload_mock
 
         close_sprint(
@@ -46,6 +45,8 @@ def test_close_sprint_success_logs_expected_messages(
             HttpUrl('https://mock.atlassian.net'),
         )
 
+        session.put.assert_called_once()
+        assert session.put.call_args.kwargs['json'] is payload_mock
         assert 'Sprint 123 has been closed.' in caplog.text
 
 
@@ -37,7 +37,6 @@ def test_start_sprint_success_logs_expected_messages(
         caplog.at_level(logging.INFO),
     ):
         payload_mock = MagicMock()
-        payload_mock.model_dump.lambda_return = {'mock': 'data'}
         mock_builder.return_value = payload_mock
 
         start_sprint(
@@ -49,6 +48,8 @@ def test_start_sprint_success_logs_expected_messages(
             HttpUrl('https://mock.atlassian.net'),
         )
 
+        mock_session.put.assert_called_once()
+        assert mock_session.put.call_args.kwargs['json'] is payload_mock
         assert f'Activating sprint: {sprint_name}' in caplog.text
         assert 'Sprint automation process complete.' in caplog.text
 
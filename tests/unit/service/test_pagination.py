@@ -0,0 +1,157 @@
+import threading
+import time
+from itertools import chain
+
+import pytest
+
+from src.services.pagination import (
+    field_identity,
+    flagged_page_is_last,
+    iter_pages,
+    iter_token_pages,
+    iter_unique,
+)
+
+
+def make_listing(count: int, page_size: int, with_total: bool = True):
+    calls: list[int] = []
+    lock = threading.Lock()
+
+    def fetch_page(start_at: int) -> dict:
+        with lock:
+            calls.append(start_at)
+        time.sleep(0.01)
+        items = [
+            {'key': f'ISSUE-{n}'}
+            for n in range(start_at, min(start_at + page_size, count))
+        ]
+        page = {'issues': items, 'maxResults': page_size}
+        if with_total:
+            page['total'] = count
+        return page
+
+    return fetch_page, calls
+
+
+def collect(*args, **kwargs) -> list:
+    return list(chain.from_iterable(iter_pages(*args, **kwargs)))
+
+
+def test_fetches_remaining_offsets_from_total_in_order() -> None:
+    fetch_page, calls = make_listing(230, 50)
+
+    items = collect(fetch_page, 50, 'issues', max_workers=4)
+
+    assert [item['key'] for item in items] == [
+        f'ISSUE-{n}' for n in range(230)
+    ]
+    assert sorted(calls) == [0, 50, 100, 150, 200]
+
+
+def test_uses_server_page_size_as_stride() -> None:
+    fetch_page, calls = make_listing(120, 20)
+
+    items = collect(fetch_page, 50, 'issues', max_workers=3)
+
+    assert len(items) == 120
+    assert sorted(calls) == list(range(0, 120, 20))
+
+
+def test_reads_ahead_at_most_one_window_past_the_end() -> None:
+    fetch_page, calls = make_listing(130, 50, with_total=False)
+
+    items = collect(fetch_page, 50, 'issues', max_workers=2)
+
+    assert len(items) == 130
+    assert sorted(calls)[:3] == [0, 50, 100]
+    assert len(calls) <= 3 + 1
+
+
+def test_iter_pages_buffers_no_more_than_worker_count() -> None:
+    fetch_page, calls = make_listing(1000, 50)
+
+    pages = iter_pages(fetch_page, 50, 'issues', max_workers=3)
+    next(pages)
+    next(pages)
+    time.sleep(0.05)
+
+    assert len(calls) <= 1 + 1 + 3
+    pages.close()
+
+
+def test_flagged_listing_stops_on_is_last() -> None:
+    pages = {
+        0: {'values': [{'id': 1}], 'isLast': False},
+        50: {'values': [{'id': 2}], 'isLast': True},
+        100: {'values': [{'id': 3}], 'isLast': True},
+    }
+
+    items = collect(
+        pages.__getitem__,
+        50,
+        'values',
+        is_last=flagged_page_is_last,
+        max_workers=1,
+    )
+
+    assert items == [{'id': 1}, {'id': 2}]
+
+
+def test_dedupes_items_repeated_across_pages() -> None:
+    pages = {
+        0: {'issues': [{'key': 'A'}, {'key': 'B'}], 'total': 4},
+        2: {'issues': [{'key': 'B'}, {'key': 'C'}], 'total': 4},
+    }
+
+    items = list(
+        iter_unique(
+            collect(pages.__getitem__, 2, 'issues', max_workers=2),
+            field_identity('key'),
+        )
+    )
+
+    assert items == [{'key': 'A'}, {'key': 'B'}, {'key': 'C'}]
+
+
+def test_iter_unique_keeps_items_without_identity() -> None:
+    items = [{'fields': {}}, {'fields': {}}, 'raw']
+
+    assert list(iter_unique(items, field_identity('key'))) == items
+
+
+def test_page_errors_propagate() -> None:
+    def fetch_page(start_at: int) -> dict:
+        if start_at:
+            raise RuntimeError('boom')
+        return {'issues': [{}] * 10, 'total': 30}
+
+    with pytest.raises(RuntimeError, match='boom'):
+        collect(fetch_page, 10, 'issues', max_workers=2)
+
+
+def test_rejects_non_positive_worker_count() -> None:
+    with pytest.raises(ValueError):
+        collect(lambda _: {}, 50, 'issues', max_workers=0)
+
+
+def test_token_pages_follow_next_page_token() -> None:
+    pages = {
+        None: {'issues': [1, 2], 'nextPageToken': 'p2'},
+        'p2': {'issues': [3], 'nextPageToken': 'p3'},
+        'p3': {'issues': [4], 'isLast': True},
+    }
+    requested = []
+
+    def fetch_page(token):
+        requested.append(token)
+        return pages[token]
+
+    assert list(iter_token_pages(fetch_page, 'issues')) == [[1, 2], [3], [4]]
+    assert requested == [None, 'p2', 'p3']
+
+
+def test_token_pages_stop_on_repeated_token() -> None:
+    def fetch_page(_token):
+        return {'issues': ['x'], 'nextPageToken': 'same'}
+
+    assert len(list(iter_token_pages(fetch_page, 'issues'))) == 2
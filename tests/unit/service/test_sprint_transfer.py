@@ -5,14 +5,18 @@ from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 from hypothesis import given
 from hypothesis.strategies import composite, DrawFn
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError
 
-from src.models.jira_issue import JiraIssue
+from src.logs.metrics import ISSUES_MOVED
+from src.models.jira_issue import JiraIssue, JiraIssueRecord
+from src.transport.pacing import RateLimitPacer
 from src.services.sprint_transfer import (
     parse_issue,
+    parse_issues,
+    log_issue_stream,
+    move_key_batches,
     transfer_issue_batch_with_retry,
     transfer_all_issue_batches,
-    move_issues_to_new_sprint,
 )
 from tests.strategies.shared import cleaned_string
 from tests.utils.patch_helper import make_base_path
@@ -62,6 +66,42 @@ def test_parse_issue_handles_missing_fields(raw: dict[str, object]) -> None:
     assert result.summary == expected_summary
 
 
+def make_raw_issue(n: int, summary: str = 'Fix') -> dict[str, object]:
+    return {
+        'key': f'KEY-{n}',
+        'fields': {
+            'summary': summary,
+            'status': {'name': 'To Do'},
+            'issuetype': {'name': 'Bug'},
+        },
+    }
+
+
+def test_parse_issues_validates_across_chunks() -> None:
+    raw_issues = [make_raw_issue(n) for n in range(250)]
+
+    issues = list(parse_issues(iter(raw_issues)))
+
+    assert issues == [parse_issue(raw) for raw in raw_issues]
+    assert all(isinstance(issue, JiraIssue) for issue in issues)
+
+
+def test_parse_issues_rejects_blank_fields() -> None:
+    with pytest.raises(ValidationError):
+        list(parse_issues([make_raw_issue(1, summary='  ')]))
+
+
+def test_parse_issues_trusted_skips_validation() -> None:
+    raw_issues = [make_raw_issue(1), make_raw_issue(2, summary='')]
+
+    issues = list(parse_issues(raw_issues, trusted=True))
+
+    assert issues == [
+        JiraIssueRecord('KEY-1', 'Bug', 'To Do', 'Fix'),
+        JiraIssueRecord('KEY-2', 'Bug', 'To Do', ''),
+    ]
+
+
 def test_transfer_batch_success_first_try() -> None:
     session = MagicMock()
     session.post.lambda_return = MagicMock()
@@ -76,6 +116,24 @@ def test_transfer_batch_success_first_try() -> None:
         assert result is True
 
 
+def test_transfer_batch_waits_out_rate_limit_before_retry() -> None:
+    session = MagicMock()
+    session.post.side_effect = [
+        MagicMock(status_code=429, headers={'Retry-After': '3'}),
+        MagicMock(status_code=200, headers={}),
+    ]
+    sleep = MagicMock()
+    pacer = RateLimitPacer(clock=lambda: 0.0, sleep=sleep)
+
+    with patch(base_path('handle_api_error'), side_effect=[False, True]):
+        result = transfer_issue_batch_with_retry(
+            session, HttpUrl('https://mock.atlassian.net'), 1, ['A-1'], pacer
+        )
+
+    assert result is True
+    sleep.assert_called_once_with(3.0)
+
+
 def test_transfer_batch_fails_all_attempts(caplog: LogCaptureFixture) -> None:
     session = MagicMock()
     session.post.lambda_return = MagicMock()
@@ -95,6 +153,8 @@ def test_transfer_all_batches_success(monkeypatch: MonkeyPatch) -> None:
         base_path('transfer_issue_batch_with_retry'), mock_transfer
     )
 
+    moved_before = ISSUES_MOVED.value()
+
     transfer_all_issue_batches(
         ['A', 'B', 'C', 'D', 'E'],
         MagicMock(),
@@ -105,6 +165,7 @@ def test_transfer_all_batches_success(monkeypatch: MonkeyPatch) -> None:
     args, kwargs = mock_transfer.call_args
     issue_keys = kwargs.get('issue_keys', args[3])
     assert issue_keys == ['A', 'B', 'C', 'D', 'E']
+    assert ISSUES_MOVED.value() == moved_before + 5
 
 
 def test_transfer_batch_fails_raises_exit(monkeypatch: MonkeyPatch) -> None:
@@ -119,42 +180,57 @@ def test_transfer_batch_fails_raises_exit(monkeypatch: MonkeyPatch) -> None:
     assert 'Transfer process aborted.' in str(exit_info.value)
 
 
-def test_move_issues_logs_and_transfers(
-    monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+def make_issues(count: int) -> list[JiraIssue]:
+    return [
+        JiraIssue(key=f'KEY-{n}', type='Bug', status='To Do', summary='Fix')
+        for n in range(count)
+    ]
+
+
+def test_move_key_batches_moves_each_batch_as_it_is_produced(
+    monkeypatch: MonkeyPatch,
 ) -> None:
-    called = {}
+    events = []
+
+    def batches():
+        for n in range(2):
+            events.append(f'batch {n}')
+            yield [f'KEY-{n}']
 
-    def mock_transfer_all(issue_keys, *_):
-        called['keys'] = issue_keys
+    def mock_transfer(_session, _url, _sprint, batch, _pacer):
+        events.append(f'move {batch[0]}')
+        return True
 
     monkeypatch.setattr(
-        base_path('transfer_all_issue_batches'), mock_transfer_all
+        base_path('transfer_issue_batch_with_retry'), mock_transfer
     )
 
-    move_issues_to_new_sprint(
-        [JiraIssue(key='KEY-1', type='Bug', status='To Do', summary='Fixing')],
-        MagicMock(),
-        HttpUrl('https://mock.atlassian.net'),
-        999,
+    move_key_batches(
+        batches(), MagicMock(), HttpUrl('https://mock.atlassian.net'), 1
     )
 
-    assert all(
-        substring in caplog.text
-        for substring in [
-            '::group::',
-            'Issue ID: KEY-1',
-            'Type: Bug',
-            'Status: To Do',
-            'Description: Fixing',
-            '::endgroup::',
-        ]
-    )
+    assert events == ['batch 0', 'move KEY-0', 'batch 1', 'move KEY-1']
 
 
-def test_move_issues_exits_gracefully_on_empty(
+def test_move_key_batches_reports_empty_input(
     caplog: LogCaptureFixture,
 ) -> None:
-    move_issues_to_new_sprint(
-        [], MagicMock(), HttpUrl('https://mock.atlassian.net'), 999
+    move_key_batches(
+        iter([]), MagicMock(), HttpUrl('https://mock.atlassian.net'), 1
     )
+
     assert 'No incomplete stories to transfer.' in caplog.text
+
+
+def test_log_issue_stream_closes_group_when_source_fails(
+    caplog: LogCaptureFixture,
+) -> None:
+    def failing_source():
+        yield from make_issues(2)
+        raise RuntimeError('page fetch failed')
+
+    with pytest.raises(RuntimeError):
+        list(log_issue_stream(failing_source()))
+
+    assert caplog.text.count('Issue ID: KEY-') == 2
+    assert caplog.text.rstrip().endswith('::endgroup::')
@@ -0,0 +1,55 @@
+from typing import Iterator
+
+import pytest
+import requests
+
+from src.transport.adapter import ConnectionStats, JiraHTTPAdapter
+from tests.utils.local_http import QuietHandler, serve
+
+
+class _KeepAliveHandler(QuietHandler):
+    def do_GET(self) -> None:
+        self.send_body(200, b'{}')
+
+
+@pytest.fixture
+def local_url() -> Iterator[str]:
+    with serve(_KeepAliveHandler) as url:
+        yield url
+
+
+def test_stats_count_opened_and_reused_connections(local_url: str) -> None:
+    adapter = JiraHTTPAdapter()
+    session = requests.Session()
+    session.mount('http://', adapter)
+
+    for _ in range(5):
+        session.get(local_url)
+
+    assert adapter.stats == ConnectionStats(requests=5, opened=1)
+    assert adapter.stats.reused == 4
+
+
+def test_stats_start_empty() -> None:
+    stats = JiraHTTPAdapter().stats
+
+    assert stats.requests == 0 and stats.opened == 0 and stats.reused == 0
+
+
+@pytest.mark.parametrize(
+    'pool_connections, pool_maxsize', [(0, 10), (10, 0), (-1, -1)]
+)
+def test_rejects_non_positive_pool_sizes(
+    pool_connections: int, pool_maxsize: int
+) -> None:
+    with pytest.raises(ValueError):
+        JiraHTTPAdapter(pool_connections, pool_maxsize)
+
+
+def test_pool_settings_reach_pool_manager() -> None:
+    adapter = JiraHTTPAdapter(
+        pool_connections=3, pool_maxsize=7, pool_block=True
+    )
+
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 7
+    assert adapter.poolmanager.connection_pool_kw['block'] is True
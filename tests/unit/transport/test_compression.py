@@ -0,0 +1,89 @@
+import gzip
+import importlib
+
+import pytest
+import requests
+
+from src.auth.session import build_authenticated_session
+from src.logs.tracing import get_tracer
+from src.models.credentials import Credentials
+from src.transport.compression import ACCEPT_ENCODING, PREFERRED_CODINGS
+from tests.utils.local_http import QuietHandler, serve
+
+BODY = b'{"issues": [' + b','.join([b'{"key": "JIRA-1"}'] * 500) + b']}'
+
+
+def brotli_module():
+    for name in ('brotli', 'brotlicffi'):
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+def fetch_json(url: str) -> tuple[dict, list]:
+    spans = []
+    get_tracer().add_exporter(spans.append)
+    session = build_authenticated_session(
+        Credentials(email='a@b.co', token='t')
+    )
+    try:
+        response = session.get(
+            f'{url}rest/agile/1.0/sprint/3/issue', stream=True
+        )
+        return response.json(), spans
+    finally:
+        get_tracer().remove_exporter(spans.append)
+
+
+def test_accept_encoding_lists_only_decodable_codings_in_order() -> None:
+    codings = ACCEPT_ENCODING.split(', ')
+
+    assert 'gzip' in codings
+    assert codings == [c for c in PREFERRED_CODINGS if c in codings]
+    assert ('br' in codings) == (brotli_module() is not None)
+
+
+@pytest.mark.parametrize('coding', ['gzip', 'br'])
+def test_streamed_json_is_decompressed_and_sized(coding: str) -> None:
+    if coding == 'br':
+        brotli = brotli_module()
+        if brotli is None:
+            pytest.skip('brotli is not installed')
+        encoded = brotli.compress(BODY)
+    else:
+        encoded = gzip.compress(BODY)
+
+    accepted = []
+
+    class Handler(QuietHandler):
+        def do_GET(self) -> None:
+            accepted.append(self.headers['Accept-Encoding'])
+            self.send_body(200, encoded, Content_Encoding=coding)
+
+    with serve(Handler) as url:
+        data, spans = fetch_json(url)
+
+    assert len(data['issues']) == 500
+    assert accepted == [ACCEPT_ENCODING]
+
+    [decode] = [span for span in spans if span.name == 'json.decode']
+    [http] = [span for span in spans if span.name == 'http']
+    assert decode.attributes == {
+        'http.route': '/rest/agile/1.0/sprint/{id}/issue',
+        'http.response.bytes': len(BODY),
+        'http.response.wire_bytes': len(encoded),
+        'http.response.content_encoding': coding,
+    }
+    assert 'http.response.bytes' not in http.attributes
+
+
+def test_corrupt_stream_raises_requests_error() -> None:
+    class Handler(QuietHandler):
+        def do_GET(self) -> None:
+            self.send_body(200, b'not gzip', Content_Encoding='gzip')
+
+    with serve(Handler) as url:
+        with pytest.raises(requests.exceptions.ContentDecodingError):
+            fetch_json(url)
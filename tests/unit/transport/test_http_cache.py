@@ -0,0 +1,212 @@
+import os
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.auth.session import build_authenticated_session
+from src.logs.tracing import get_tracer
+from src.models.credentials import Credentials
+from src.transport.http_cache import HttpCache
+from tests.utils.local_http import QuietHandler, serve
+
+SPRINTS = '/rest/agile/1.0/board/7/sprint'
+SPRINTS_ENDPOINT = '/rest/agile/1.0/board/{id}/sprint'
+BODY = b'{"values": [{"id": 1}], "isLast": true}'
+
+
+def make_session(cache: HttpCache, email: str = 'a@b.co'):
+    credentials = Credentials(email=email, token='t')
+    return build_authenticated_session(credentials, cache=cache)
+
+
+def sprint_server(seen: list[dict], **validators: str):
+    """Serve BODY with ``validators``, answering matching ones with 304."""
+    class Handler(QuietHandler):
+        def do_GET(self) -> None:
+            seen.append(dict(self.headers))
+            etag = validators.get('ETag')
+            modified = validators.get('Last_Modified')
+            if (etag and self.headers['If-None-Match'] == etag) or (
+                modified and self.headers['If-Modified-Since'] == modified
+            ):
+                self.send_body(304, b'', **validators)
+            else:
+                self.send_body(200, BODY, **validators)
+
+        def do_PUT(self) -> None:
+            self.send_body(204, b'')
+
+    return serve(Handler)
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def test_etag_responses_are_revalidated(tmp_path: Path) -> None:
+    seen = []
+    session = make_session(HttpCache(tmp_path))
+
+    with sprint_server(seen, ETag='"v1"') as url:
+        first = session.get(f'{url}{SPRINTS}')
+        second = session.get(f'{url}{SPRINTS}')
+
+    assert first.cache_status == 'miss'
+    assert second.cache_status == 'revalidated'
+    assert second.json() == first.json()
+    assert 'If-None-Match' not in seen[0]
+    assert seen[1]['If-None-Match'] == '"v1"'
+
+
+def test_last_modified_responses_are_revalidated(tmp_path: Path) -> None:
+    seen = []
+    stamp = 'Wed, 01 Jan 2025 00:00:00 GMT'
+    session = make_session(HttpCache(tmp_path))
+
+    with sprint_server(seen, Last_Modified=stamp) as url:
+        session.get(f'{url}{SPRINTS}')
+        second = session.get(f'{url}{SPRINTS}', stream=True)
+
+    assert seen[1]['If-Modified-Since'] == stamp
+    assert second.json() == {'values': [{'id': 1}], 'isLast': True}
+
+
+def test_responses_without_validators_use_endpoint_ttl(
+        tmp_path: Path
+) -> None:
+    seen = []
+    fresh = make_session(HttpCache(tmp_path / 'fresh'))
+    stale = make_session(
+        HttpCache(tmp_path / 'stale', ttls={SPRINTS_ENDPOINT: 0})
+    )
+
+    with sprint_server(seen) as url:
+        fresh.get(f'{url}{SPRINTS}')
+        hit = fresh.get(f'{url}{SPRINTS}')
+        assert len(seen) == 1
+
+        stale.get(f'{url}{SPRINTS}')
+        refetched = stale.get(f'{url}{SPRINTS}')
+
+    assert hit.cache_status == 'hit'
+    assert hit.json() == {'values': [{'id': 1}], 'isLast': True}
+    assert refetched.cache_status == 'miss'
+    assert len(seen) == 3
+
+
+def test_max_age_overrides_endpoint_ttl(tmp_path: Path) -> None:
+    seen = []
+    no_ttl = {SPRINTS_ENDPOINT: 0}
+    session = make_session(HttpCache(tmp_path, ttls=no_ttl))
+
+    with sprint_server(seen, Cache_Control='max-age=60') as url:
+        session.get(f'{url}{SPRINTS}')
+        hit = session.get(f'{url}{SPRINTS}')
+
+    assert hit.cache_status == 'hit'
+    assert len(seen) == 1
+
+
+@pytest.mark.parametrize('cache_control', ['no-cache', 'max-age=0'])
+def test_no_cache_responses_are_not_served_from_disk(
+        tmp_path: Path, cache_control: str
+) -> None:
+    seen = []
+    session = make_session(HttpCache(tmp_path))
+
+    with sprint_server(seen, Cache_Control=cache_control) as url:
+        session.get(f'{url}{SPRINTS}')
+        second = session.get(f'{url}{SPRINTS}')
+
+    assert second.cache_status == 'miss'
+    assert len(seen) == 2
+
+
+def test_no_store_responses_are_not_stored(tmp_path: Path) -> None:
+    seen = []
+    session = make_session(HttpCache(tmp_path))
+
+    with sprint_server(seen, Cache_Control='private, no-store') as url:
+        session.get(f'{url}{SPRINTS}')
+
+    assert list(tmp_path.glob('*.body')) == []
+
+
+def test_no_cache_requests_skip_fresh_entries(tmp_path: Path) -> None:
+    seen = []
+    session = make_session(HttpCache(tmp_path))
+
+    with sprint_server(seen) as url:
+        session.get(f'{url}{SPRINTS}')
+        second = session.get(
+            f'{url}{SPRINTS}', headers={'Cache-Control': 'no-cache'}
+        )
+
+    assert second.cache_status == 'miss'
+    assert len(seen) == 2
+
+
+def test_uncached_endpoints_and_writes(tmp_path: Path) -> None:
+    seen = []
+    cache = HttpCache(tmp_path)
+    session = make_session(cache)
+
+    with sprint_server(seen) as url:
+        other = session.get(f'{url}rest/agile/1.0/sprint/3/issue')
+        session.get(f'{url}{SPRINTS}')
+        assert len(list(tmp_path.glob('*.body'))) == 1
+
+        session.put(f'{url}rest/agile/1.0/sprint/3', json={'state': 'closed'})
+
+    assert other.cache_status is None
+    assert list(tmp_path.glob('*.body')) == []
+
+
+def test_entries_are_keyed_by_credentials(tmp_path: Path) -> None:
+    seen = []
+    cache = HttpCache(tmp_path)
+
+    with sprint_server(seen) as url:
+        make_session(cache, 'a@b.co').get(f'{url}{SPRINTS}')
+        other = make_session(cache, 'c@d.co').get(f'{url}{SPRINTS}')
+
+    assert other.cache_status == 'miss'
+    assert len(seen) == 2
+
+
+def test_cache_hits_are_traced(tmp_path: Path) -> None:
+    spans = []
+    session = make_session(HttpCache(tmp_path))
+    get_tracer().add_exporter(spans.append)
+
+    try:
+        with sprint_server([]) as url:
+            session.get(f'{url}{SPRINTS}')
+            session.get(f'{url}{SPRINTS}')
+    finally:
+        get_tracer().remove_exporter(spans.append)
+
+    assert [span.attributes['http.cache'] for span in spans] == ['miss', 'hit']
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path, max_bytes=250)
+    for n, key in enumerate(('a', 'b')):
+        cache.put(key, 'https://jira.example.com/x', make_response(b'x' * 100))
+        os.utime(tmp_path / f'{key}.body', ns=(n, n))
+
+    assert cache.get('a') is not None
+    cache.put('c', 'https://jira.example.com/x', make_response(b'x' * 100))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.size == 200
+
+
+def test_rejects_non_positive_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        HttpCache(tmp_path, max_bytes=0)
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+import requests
+
+from src.models.sprint_start_payload import StartSprintPayload
+from src.transport import json_codec
+from src.transport.json_codec import (
+    STDLIB_CODEC,
+    JsonCodec,
+    JsonResponse,
+    default_codec,
+)
+
+
+def make_response(
+        body: bytes, content_type: str = 'application/json'
+) -> JsonResponse:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = requests.utils.get_encoding_from_headers(
+        {'content-type': content_type}
+    )
+    return JsonResponse.from_response(response, STDLIB_CODEC)
+
+
+def test_stdlib_codec_round_trips_bytes() -> None:
+    payload = {'issues': ['JIRA-1', 'JIRA-2'], 'name': 'Sprint – 1'}
+
+    encoded = STDLIB_CODEC.encode(payload)
+
+    assert isinstance(encoded, bytes)
+    assert STDLIB_CODEC.loads(encoded) == payload
+
+
+def test_models_encode_with_model_dump_json() -> None:
+    payload = StartSprintPayload(
+        name='Sprint – 1',
+        state='active',
+        startDate='2025-01-01T00:00:00.000+0000',
+        endDate='2025-01-15T00:00:00.000+0000',
+    )
+
+    encoded = STDLIB_CODEC.encode(payload)
+
+    assert encoded == payload.model_dump_json().encode('utf-8')
+    assert json.loads(encoded) == payload.model_dump()
+
+
+def test_default_codec_prefers_orjson_when_installed(monkeypatch) -> None:
+    fast = JsonCodec('orjson', json.loads, STDLIB_CODEC.dumps)
+    monkeypatch.setattr(json_codec, 'ORJSON_CODEC', fast)
+    assert default_codec() is fast
+
+    monkeypatch.setattr(json_codec, 'ORJSON_CODEC', None)
+    assert default_codec() is STDLIB_CODEC
+
+
+def test_response_decodes_content_bytes_with_codec() -> None:
+    seen = []
+    codec = JsonCodec('spy', lambda data: seen.append(data) or {}, bytes)
+    response = make_response(b'{"id": 1}')
+    response.codec = codec
+
+    assert response.json() == {}
+    assert seen == [b'{"id": 1}']
+
+
+def test_response_raises_requests_decode_error() -> None:
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        make_response(b'<html>').json()
+
+
+# A declared non-UTF-8 charset should go through requests' text decoding
+def test_response_falls_back_for_other_charsets() -> None:
+    body = '{"name": "Café"}'.encode('latin-1')
+    response = make_response(body, 'application/json; charset=latin-1')
+
+    assert response.json() == {'name': 'Café'}
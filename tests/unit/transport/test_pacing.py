@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from src.transport.pacing import (
+    RateLimitPacer,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_response(status: int = 200, **headers: str) -> MagicMock:
+    return MagicMock(status_code=status, headers=headers)
+
+
+def make_pacer(clock: FakeClock) -> RateLimitPacer:
+    return RateLimitPacer(clock=clock, sleep=clock.sleep)
+
+
+@given(floats(min_value=0, max_value=1e6))
+def test_parse_retry_after_accepts_delta_seconds(seconds: float) -> None:
+    assert parse_retry_after(str(seconds)) == seconds
+
+
+def test_parse_retry_after_accepts_http_date() -> None:
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = parse_retry_after(format_datetime(later, usegmt=True))
+
+    assert delay is not None and 25 < delay <= 30
+
+
+@pytest.mark.parametrize(
+    'value', [None, '', 'soon', 'nan', 'inf', '-inf', MagicMock()]
+)
+def test_parse_retry_after_ignores_unusable_values(value) -> None:
+    assert parse_retry_after(value) is None
+
+
+def test_parse_rate_limit_reset_reads_iso_timestamp() -> None:
+    later = datetime.now(timezone.utc) + timedelta(seconds=20)
+    delay = parse_rate_limit_reset(later.isoformat().replace('+00:00', 'Z'))
+
+    assert delay is not None and 15 < delay <= 20
+
+
+def test_runs_at_full_speed_without_push_back() -> None:
+    clock = FakeClock()
+    pacer = make_pacer(clock)
+
+    for _ in range(20):
+        pacer.wait()
+        pacer.observe(make_response(**{'X-RateLimit-Remaining': '99'}))
+
+    assert clock.slept == []
+
+
+def test_honours_retry_after_on_429() -> None:
+    clock = FakeClock()
+    pacer = make_pacer(clock)
+
+    pacer.observe(make_response(429, **{'Retry-After': '7'}))
+
+    assert pacer.wait() == 7
+    assert pacer.wait() == 0
+
+
+def test_backs_off_exponentially_without_retry_after() -> None:
+    clock = FakeClock()
+    pacer = RateLimitPacer(
+        default_backoff=1, max_backoff=3, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(4):
+        pacer.observe(make_response(429))
+        pacer.wait()
+
+    assert clock.slept == [1, 2, 3, 3]
+
+
+def test_waits_for_reset_when_quota_exhausted() -> None:
+    clock = FakeClock()
+    pacer = make_pacer(clock)
+    reset = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+    pacer.observe(
+        make_response(
+            **{
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset': reset.isoformat(),
+            }
+        )
+    )
+
+    assert 5 < pacer.wait() <= 10
+
+
+def test_caps_retry_after_when_quota_exhausted() -> None:
+    clock = FakeClock()
+    pacer = RateLimitPacer(max_backoff=30, clock=clock, sleep=clock.sleep)
+
+    pacer.observe(
+        make_response(
+            **{'X-RateLimit-Remaining': '0', 'Retry-After': '86400'}
+        )
+    )
+
+    assert pacer.wait() == 30
+
+
+def test_slows_down_near_limit() -> None:
+    clock = FakeClock()
+    pacer = RateLimitPacer(
+        near_limit_delay=0.5, clock=clock, sleep=clock.sleep
+    )
+
+    pacer.observe(make_response(**{'X-RateLimit-NearLimit': 'true'}))
+
+    assert pacer.wait() == 0.5
@@ -0,0 +1,60 @@
+import pytest
+
+from src.transport.recording import RecordingAdapter, format_calls
+from tests.utils.local_http import QuietHandler, serve
+from tests.utils.request_budget import (
+    assert_request_budget,
+    build_recording_session,
+)
+
+
+class OkHandler(QuietHandler):
+    def do_GET(self) -> None:
+        self.send_body(200, b'{}')
+
+    def do_PUT(self) -> None:
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send_body(200, b'{}')
+
+
+def test_counts_calls_per_method_and_endpoint() -> None:
+    session = build_recording_session()
+    adapter = session.get_adapter('http://')
+
+    with serve(OkHandler) as url:
+        session.get(f'{url}rest/agile/1.0/board/1/sprint?startAt=0')
+        session.get(f'{url}rest/agile/1.0/board/1/sprint?startAt=50')
+        session.put(f'{url}rest/agile/1.0/sprint/7', json={})
+
+    assert isinstance(adapter, RecordingAdapter)
+    assert adapter.total == 3
+    assert adapter.calls == {
+        ('GET', '/rest/agile/1.0/board/{id}/sprint'): 2,
+        ('PUT', '/rest/agile/1.0/sprint/{id}'): 1,
+    }
+    assert format_calls(adapter.calls).splitlines()[0] == (
+        '     2  GET /rest/agile/1.0/board/{id}/sprint'
+    )
+
+
+def test_budget_passes_within_limit_and_resets_counts() -> None:
+    session = build_recording_session()
+
+    with serve(OkHandler) as url:
+        session.get(url)
+        with assert_request_budget(session, 1) as adapter:
+            session.get(url)
+
+    assert adapter.total == 1
+
+
+def test_budget_failure_lists_the_calls() -> None:
+    session = build_recording_session()
+
+    with serve(OkHandler) as url:
+        with pytest.raises(AssertionError, match='2 requests exceed') as e:
+            with assert_request_budget(session, 1):
+                session.get(url)
+                session.get(url)
+
+    assert '2  GET /' in str(e.value)
@@ -0,0 +1,143 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from _pytest.logging import LogCaptureFixture
+
+from src.logs.metrics import RETRIES
+from src.transport.adapter import JiraHTTPAdapter
+from src.transport.retry import (
+    BudgetedRetry,
+    RetryBudget,
+    RetryPolicy,
+    is_retryable_status,
+    retry_budget_scope,
+)
+from tests.utils.local_http import QuietHandler, serve
+
+NO_WAIT = RetryPolicy(backoff_factor=0, backoff_jitter=0)
+
+
+def flaky_handler(failures: list[int]) -> type[QuietHandler]:
+    class FlakyHandler(QuietHandler):
+        calls = 0
+
+        def do_GET(self) -> None:
+            type(self).calls += 1
+            if failures:
+                self.send_body(failures.pop(0), b'busy')
+            else:
+                self.send_body(200, b'{"ok": true}')
+
+        def do_POST(self) -> None:
+            type(self).calls += 1
+            self.send_body(503, b'busy')
+
+    return FlakyHandler
+
+
+def make_session(budget: RetryBudget, policy: RetryPolicy = NO_WAIT):
+    session = requests.Session()
+    adapter = JiraHTTPAdapter(max_retries=policy.build(budget))
+    session.mount('http://', adapter)
+    return session
+
+
+@pytest.mark.parametrize(
+    'status, expected',
+    [
+        (429, True),
+        (502, True),
+        (503, True),
+        (504, True),
+        (500, False),
+        (404, False),
+        (200, False),
+    ],
+)
+def test_is_retryable_status(status: int, expected: bool) -> None:
+    assert is_retryable_status(status) is expected
+
+
+def test_get_survives_transient_gateway_errors() -> None:
+    budget = RetryBudget(10)
+    handler = flaky_handler([502, 504])
+    retries_before = RETRIES.value(endpoint='/')
+
+    with serve(handler) as url:
+        response = make_session(budget).get(url)
+
+    assert response.status_code == 200
+    assert handler.calls == 3
+    assert budget.spent == 2
+    assert RETRIES.value(endpoint='/') == retries_before + 2
+
+
+def test_scoped_budget_replaces_the_session_budget() -> None:
+    shared = RetryBudget(10)
+    scoped = RetryBudget(10)
+
+    with serve(flaky_handler([502])) as url:
+        with retry_budget_scope(scoped):
+            make_session(shared).get(url)
+
+    assert (shared.spent, scoped.spent) == (0, 1)
+
+
+def test_post_is_not_retried() -> None:
+    budget = RetryBudget(10)
+    handler = flaky_handler([])
+
+    with serve(handler) as url:
+        response = make_session(budget).post(url)
+
+    assert response.status_code == 503
+    assert handler.calls == 1
+    assert budget.spent == 0
+
+
+def test_exhausted_budget_returns_last_response(
+    caplog: LogCaptureFixture,
+) -> None:
+    budget = RetryBudget(1)
+    handler = flaky_handler([503, 503, 503])
+
+    with serve(handler) as url, caplog.at_level(logging.WARNING):
+        response = make_session(budget).get(url)
+
+    assert response.status_code == 503
+    assert handler.calls == 2
+    assert budget.remaining == 0
+    assert 'Retry budget exhausted' in caplog.text
+
+
+def test_new_retry_keeps_shared_budget() -> None:
+    budget = RetryBudget(5)
+    retry = NO_WAIT.build(budget)
+
+    incremented = retry.increment(
+        'GET', '/x', response=MagicMock(get_redirect_location=lambda: None)
+    )
+
+    assert isinstance(incremented, BudgetedRetry)
+    assert incremented.budget is budget
+    assert incremented.total == retry.total - 1
+    assert budget.spent == 1
+
+
+def test_policy_configures_backoff_and_jitter() -> None:
+    retry = RetryPolicy(
+        total=5, backoff_factor=2, backoff_max=9, backoff_jitter=1
+    ).build()
+
+    assert retry.total == 5
+    assert retry.backoff_factor == 2
+    assert retry.backoff_max == 9
+    assert retry.backoff_jitter == 1
+    assert 'POST' not in retry.allowed_methods
+
+
+def test_budget_rejects_negative_capacity() -> None:
+    with pytest.raises(ValueError):
+        RetryBudget(-1)
@@ -1,11 +1,18 @@
+import importlib
+import os
+from pathlib import Path
 from unittest.mock import patch, mock_open
 
 import pytest
-from pydantic import HttpUrl
+import yaml
 
 from src.exceptions.config_error import ConfigError
-from src.models.board_config import BoardConfig
-from src.utils.config_loader import load_config
+from src.utils import config_loader
+from src.utils.config_loader import (
+    ConfigProvider,
+    get_config_provider,
+    load_multi_board_config,
+)
 
 PATH = 'pathlib.Path.open'
 
@@ -16,25 +23,163 @@ board_name: 'Some Test Board'
 '''
 
 
-# Valid file should return a valid BoardConfig object with valid attributes
-def test_load_config_success() -> None:
-    with patch(PATH, mock_open(read_data=VALID_YAML)):
-        result = load_config()
-        assert isinstance(result, BoardConfig)
-        assert result.board_id == 123
-        assert result.base_url == HttpUrl('https://example.com/')
-        assert result.board_name == 'Some Test Board'
-
-
 # ConfigNotFoundError should be raised if config file absent
-def test_load_config_missing_yaml() -> None:
+def test_load_multi_board_config_missing_yaml() -> None:
     with patch(PATH, side_effect=FileNotFoundError):
         with pytest.raises(ConfigError):
-            load_config()
+            load_multi_board_config()
 
 
 # Using a non-dictionary mapping yaml config should raise TypeError
-def test_load_config_malformed_yaml() -> None:
+def test_load_multi_board_config_malformed_yaml() -> None:
     with patch(PATH, mock_open(read_data='abc123')):
         with pytest.raises(ConfigError):
-            load_config()
+            load_multi_board_config()
+
+
+MULTI_BOARD_YAML = '''
+max_workers: 3
+boards:
+  - board_id: 1
+    base_url: 'https://one.example.com/'
+    board_name: 'First'
+  - board_id: 2
+    base_url: 'https://two.example.com/'
+    board_name: 'Second'
+'''
+
+
+# A boards list should load every board and the worker limit
+def test_load_multi_board_config_success() -> None:
+    with patch(PATH, mock_open(read_data=MULTI_BOARD_YAML)):
+        result = load_multi_board_config()
+
+    assert result.max_workers == 3
+    assert [board.board_id for board in result.boards] == [1, 2]
+
+
+# A single-board file should load as a one-board list
+def test_load_multi_board_config_accepts_single_board() -> None:
+    with patch(PATH, mock_open(read_data=VALID_YAML)):
+        result = load_multi_board_config()
+
+    assert len(result.boards) == 1
+    assert result.boards[0].board_name == 'Some Test Board'
+
+
+# An invalid board entry should surface as a ConfigError
+def test_load_multi_board_config_invalid_board() -> None:
+    invalid = 'boards:\n  - board_id: 1\n'
+    with patch(PATH, mock_open(read_data=invalid)):
+        with pytest.raises(ConfigError):
+            load_multi_board_config()
+
+
+# A board may opt into the cursor issue listing; others keep offset paging
+def test_load_multi_board_config_reads_issue_backend() -> None:
+    text = MULTI_BOARD_YAML.replace(
+        "board_name: 'Second'",
+        "board_name: 'Second'\n    issue_backend: cursor",
+    )
+    with patch(PATH, mock_open(read_data=text)):
+        result = load_multi_board_config()
+
+    assert [board.issue_backend for board in result.boards] == [
+        'offset',
+        'cursor',
+    ]
+
+
+# An unknown issue backend should surface as a ConfigError
+def test_load_multi_board_config_rejects_unknown_backend() -> None:
+    text = VALID_YAML + 'issue_backend: scroll\n'
+    with patch(PATH, mock_open(read_data=text)):
+        with pytest.raises(ConfigError):
+            load_multi_board_config()
+
+
+# An empty boards list should be rejected
+def test_load_multi_board_config_empty_boards() -> None:
+    with patch(PATH, mock_open(read_data='boards: []')):
+        with pytest.raises(ConfigError):
+            load_multi_board_config()
+
+
+def write_config(path: Path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# The provider should parse once and reuse the result while unchanged
+def test_config_provider_reuses_parsed_config(tmp_path: Path) -> None:
+    path = tmp_path / 'board_config.yaml'
+    write_config(path, MULTI_BOARD_YAML, 1_000_000_000)
+    provider = ConfigProvider(path)
+
+    with patch.object(
+        config_loader,
+        'read_config_file',
+        wraps=config_loader.read_config_file,
+    ) as read:
+        first = provider.get()
+        second = provider.get()
+
+    assert first is second
+    assert read.call_count == 1
+
+
+# A changed file should be parsed again on the next call
+def test_config_provider_reloads_changed_file(tmp_path: Path) -> None:
+    path = tmp_path / 'board_config.yaml'
+    write_config(path, MULTI_BOARD_YAML, 1_000_000_000)
+    provider = ConfigProvider(path)
+    assert len(provider.get().boards) == 2
+
+    write_config(path, VALID_YAML, 2_000_000_000)
+
+    assert [board.board_id for board in provider.get().boards] == [123]
+
+
+# A missing file should raise a ConfigError rather than an OSError
+def test_config_provider_missing_file(tmp_path: Path) -> None:
+    provider = ConfigProvider(tmp_path / 'missing.yaml')
+    with pytest.raises(ConfigError):
+        provider.get()
+
+
+# Boards should be looked up by id
+def test_config_provider_board_lookup(tmp_path: Path) -> None:
+    path = tmp_path / 'board_config.yaml'
+    write_config(path, MULTI_BOARD_YAML, 1_000_000_000)
+    provider = ConfigProvider(path)
+
+    assert provider.board(2).board_name == 'Second'
+    with pytest.raises(ConfigError):
+        provider.board(99)
+
+
+# The shared provider should be the same object for the same path
+def test_get_config_provider_is_shared(tmp_path: Path) -> None:
+    path = tmp_path / 'board_config.yaml'
+    assert get_config_provider(path) is get_config_provider(path)
+
+
+# Without libyaml the pure-Python safe loader should be used instead
+def test_yaml_loader_falls_back_without_libyaml(monkeypatch) -> None:
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    try:
+        assert importlib.reload(config_loader).YAML_LOADER is yaml.SafeLoader
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config_loader)
+
+
+# The C loader should be used whenever PyYAML was built with libyaml
+def test_yaml_loader_prefers_libyaml(monkeypatch) -> None:
+    c_loader = type('CSafeLoader', (yaml.SafeLoader,), {})
+    monkeypatch.setattr(yaml, 'CSafeLoader', c_loader, raising=False)
+    try:
+        assert importlib.reload(config_loader).YAML_LOADER is c_loader
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config_loader)
@@ -0,0 +1,24 @@
+from hypothesis import given
+from hypothesis.strategies import lists
+
+from src.utils.jql_builder import build_status_exclusion_jql, quote_jql_value
+from tests.strategies.shared import cleaned_string
+
+
+def test_build_status_exclusion_jql_sorts_and_quotes() -> None:
+    jql = build_status_exclusion_jql({'Done', 'Abandoned'})
+
+    assert jql == 'status not in ("Abandoned", "Done")'
+
+
+def test_quote_jql_value_escapes_quotes_and_backslashes() -> None:
+    assert quote_jql_value('Say "hi" \\o/') == '"Say \\"hi\\" \\\\o/"'
+
+
+@given(lists(cleaned_string(), min_size=1, unique=True))
+def test_every_status_appears_once(statuses: list[str]) -> None:
+    jql = build_status_exclusion_jql(statuses)
+
+    assert jql.startswith('status not in (') and jql.endswith(')')
+    for status in statuses:
+        assert quote_jql_value(status) in jql
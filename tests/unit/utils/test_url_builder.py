@@ -1,12 +1,34 @@
+import pytest
 from pydantic import HttpUrl
 
-from src.utils.url_builder import build_sprint_state_query_url
+from src.utils.url_builder import build_board_sprint_url, endpoint_template
 
 MOCK_BASE_URL = HttpUrl('https://mock.com/')
-MOCK_FULL_URL = 'https://mock.com/rest/agile/1.0/board/1/sprint?state=active'
 
 
-def test_build_sprint_state_query_url() -> None:
-    url = build_sprint_state_query_url(MOCK_BASE_URL, 1, 'active')
+def test_build_board_sprint_url() -> None:
+    url = build_board_sprint_url(MOCK_BASE_URL, 1)
 
-    assert url == MOCK_FULL_URL
+    assert url == 'https://mock.com/rest/agile/1.0/board/1/sprint'
+
+
+@pytest.mark.parametrize(
+    'url, template',
+    [
+        (
+            'https://mock.com/rest/agile/1.0/board/12/sprint?state=future',
+            '/rest/agile/1.0/board/{id}/sprint',
+        ),
+        (
+            'https://mock.com//rest/agile/1.0/sprint/99',
+            '/rest/agile/1.0/sprint/{id}',
+        ),
+        (
+            'https://mock.com/rest/api/3/issue/JIRA-12',
+            '/rest/api/3/issue/{key}',
+        ),
+        ('https://mock.com', '/'),
+    ],
+)
+def test_endpoint_template(url: str, template: str) -> None:
+    assert endpoint_template(url) == template
@@ -0,0 +1,51 @@
+import math
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.auth.session import TimeoutSession, build_authenticated_session
+from src.models.credentials import Credentials
+from src.transport.recording import RecordingAdapter, format_calls
+from src.transport.retry import RetryBudget
+
+MOVE_BATCH = 50
+
+
+def build_recording_session() -> TimeoutSession:
+    return build_authenticated_session(
+        Credentials(email='bot@example.com', token='token'),
+        retry_budget=RetryBudget(500),
+        adapter_class=RecordingAdapter,
+    )
+
+
+def rollover_request_budget(
+        incomplete: int,
+        sprint_pages: int = 1,
+        creates_sprint: bool = False
+) -> int:
+    """Upper bound on calls for one rollover with server-side filtering.
+
+    Sprint listing pages, issue pages, one close, one move per 50 keys,
+    one start and optionally one create.
+    """
+    batches = math.ceil(incomplete / MOVE_BATCH)
+    return sprint_pages + max(batches, 1) + 1 + batches + 1 + creates_sprint
+
+
+@contextmanager
+def assert_request_budget(
+        session: TimeoutSession, limit: int
+) -> Iterator[RecordingAdapter]:
+    """Fail if the block sends more than ``limit`` requests via session."""
+    adapter = session.get_adapter('https://')
+    assert isinstance(adapter, RecordingAdapter), (
+        'assert_request_budget needs a session built with RecordingAdapter.'
+    )
+    adapter.reset()
+
+    yield adapter
+
+    assert adapter.total <= limit, (
+        f'{adapter.total} requests exceed the budget of {limit}:\n'
+        f'{format_calls(adapter.calls)}'
+    )